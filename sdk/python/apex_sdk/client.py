@@ -223,6 +223,10 @@ class ApexClient(BaseApexClient):
     response body.  Transient server/network errors are retried automatically
     (up to *max_retries* times with exponential back-off).
 
+    An optional *transport* is passed straight to ``httpx.Client``; supply an
+    ``httpx.MockTransport`` to serve canned responses in tests without
+    building a connection pool.
+
     See :class:`AsyncApexClient` for the ``async``/``await`` variant.
     """
 
@@ -234,12 +238,14 @@ class ApexClient(BaseApexClient):
         timeout: float = 30.0,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        transport: httpx.BaseTransport | None = None,
     ) -> None:
         super().__init__(base_url, api_key, token, timeout, max_retries, retry_delay)
         self._client = httpx.Client(
             base_url=self.base_url,
             headers=self._get_headers(),
             timeout=timeout,
+            transport=transport,
         )
 
     def __enter__(self) -> "ApexClient":
@@ -856,6 +862,8 @@ class AsyncApexClient(BaseApexClient):
 
     Also provides a :meth:`websocket` accessor for obtaining a
     :class:`ApexWebSocketClient` pre-configured with the same credentials.
+
+    An optional *transport* is passed straight to ``httpx.AsyncClient``.
     """
 
     def __init__(
@@ -866,12 +874,14 @@ class AsyncApexClient(BaseApexClient):
         timeout: float = 30.0,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         super().__init__(base_url, api_key, token, timeout, max_retries, retry_delay)
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
             headers=self._get_headers(),
             timeout=timeout,
+            transport=transport,
         )
         self._ws_client: ApexWebSocketClient | None = None
 
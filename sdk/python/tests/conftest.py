@@ -0,0 +1,186 @@
+"""Shared fixtures for the Apex SDK tests.
+
+Pass ``--sdk-cached`` to reuse validated model fixtures from previous runs
+(stored in ``.pytest_cache``). The cache is keyed on the source payload, so
+an edited payload is re-validated; CI runs without the flag, and without it
+the cache is never touched.
+"""
+
+import pytest
+
+from apex_sdk import DAG, Agent, Approval, Task
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--sdk-cached",
+        action="store_true",
+        default=False,
+        help="reuse validated apex_sdk model fixtures cached by a previous run",
+    )
+
+
+def _prebuilt(request, model_cls, payload):
+    """Validate *payload* into *model_cls*, optionally via the pytest cache.
+
+    With ``--sdk-cached`` the model is rebuilt from its cached JSON dump through
+    ``model_validate_json`` as long as the cached source payload still matches.
+    """
+    if not request.config.getoption("--sdk-cached"):
+        # Leave the cache alone; it is absent under ``-p no:cacheprovider``
+        return model_cls.model_validate(payload)
+    cache = request.config.cache
+    key = f"apex_sdk/{model_cls.__name__}"
+    cached = cache.get(key, None)
+    if cached and cached["source"] == payload:
+        return model_cls.model_validate_json(cached["json"])
+    model = model_cls.model_validate(payload)
+    cache.set(key, {"source": payload, "json": model.model_dump_json(by_alias=True)})
+    return model
+
+
+@pytest.fixture(scope="session")
+def mock_task_response():
+    return {
+        "id": "task-123",
+        "name": "Test Task",
+        "description": "A test task",
+        "status": "pending",
+        "priority": "normal",
+        "agentId": None,
+        "input": {"data": {"key": "value"}},
+        "output": None,
+        "error": None,
+        "timeoutSeconds": 3600,
+        "retries": 3,
+        "retryCount": 0,
+        "tags": ["test"],
+        "metadata": {},
+        "dagId": None,
+        "dependsOn": [],
+        "createdAt": "2024-01-15T10:00:00Z",
+        "updatedAt": "2024-01-15T10:00:00Z",
+        "startedAt": None,
+        "completedAt": None,
+    }
+
+
+@pytest.fixture(scope="session")
+def mock_agent_response():
+    return {
+        "id": "agent-456",
+        "name": "Test Agent",
+        "description": "A test agent",
+        "status": "idle",
+        "capabilities": [{"name": "code-analysis", "version": "1.0"}],
+        "maxConcurrentTasks": 5,
+        "currentTasks": 0,
+        "totalTasksCompleted": 100,
+        "tags": ["python"],
+        "metadata": {},
+        "lastHeartbeat": "2024-01-15T10:00:00Z",
+        "createdAt": "2024-01-15T09:00:00Z",
+        "updatedAt": "2024-01-15T10:00:00Z",
+    }
+
+
+@pytest.fixture(scope="session")
+def mock_dag_response():
+    return {
+        "id": "dag-789",
+        "name": "Test DAG",
+        "description": "A test DAG",
+        "status": "pending",
+        "nodes": [
+            {
+                "id": "node-1",
+                "taskTemplate": {"name": "Task 1"},
+                "dependsOn": [],
+            }
+        ],
+        "edges": [],
+        "input": {},
+        "output": {},
+        "tags": [],
+        "metadata": {},
+        "schedule": None,
+        "taskStatuses": [],
+        "createdAt": "2024-01-15T09:00:00Z",
+        "updatedAt": "2024-01-15T10:00:00Z",
+        "startedAt": None,
+        "completedAt": None,
+    }
+
+
+@pytest.fixture(scope="session")
+def mock_approval_response():
+    return {
+        "id": "approval-101",
+        "taskId": "task-123",
+        "status": "pending",
+        "type": "manual",
+        "description": "Please approve this task",
+        "requiredApprovers": ["user-1"],
+        "approvers": [],
+        "expiresAt": "2024-01-16T10:00:00Z",
+        "decidedAt": None,
+        "comment": None,
+        "metadata": {},
+        "createdAt": "2024-01-15T10:00:00Z",
+        "updatedAt": "2024-01-15T10:00:00Z",
+    }
+
+
+@pytest.fixture(scope="session")
+def mock_task_list_response(mock_task_response):
+    return {
+        "items": [mock_task_response],
+        "total": 1,
+        "page": 1,
+        "perPage": 20,
+        "totalPages": 1,
+    }
+
+
+# Status variants of the base payloads. Add one fixture per variant rather
+# than copying and mutating a payload inside a test.
+
+
+@pytest.fixture(scope="session")
+def cancelled_task_response(mock_task_response):
+    return {**mock_task_response, "status": "cancelled"}
+
+
+@pytest.fixture(scope="session")
+def running_dag_response(mock_dag_response):
+    return {**mock_dag_response, "status": "running"}
+
+
+@pytest.fixture(scope="session")
+def approved_approval_response(mock_approval_response):
+    return {
+        **mock_approval_response,
+        "status": "approved",
+        "decidedAt": "2024-01-15T11:00:00Z",
+        "comment": "Looks good",
+    }
+
+
+@pytest.fixture(scope="session")
+def prebuilt_task(request, mock_task_response):
+    return _prebuilt(request, Task, mock_task_response)
+
+
+@pytest.fixture(scope="session")
+def prebuilt_agent(request, mock_agent_response):
+    return _prebuilt(request, Agent, mock_agent_response)
+
+
+@pytest.fixture(scope="session")
+def prebuilt_dag(request, mock_dag_response):
+    return _prebuilt(request, DAG, mock_dag_response)
+
+
+@pytest.fixture(scope="session")
+def prebuilt_approval(request, mock_approval_response):
+    return _prebuilt(request, Approval, mock_approval_response)
@@ -1,13 +1,17 @@
 """Unit tests for the Apex SDK client."""
 
-from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import inspect
+from contextlib import ExitStack
+from unittest.mock import patch
 
 import httpx
+import orjson
 import pytest
+import pytest_asyncio
+from tenacity import stop_after_attempt, wait_exponential, wait_none
 
 from apex_sdk import (
-    Agent,
     AgentCreate,
     AgentStatus,
     ApexClient,
@@ -15,13 +19,11 @@ from apex_sdk import (
     ApexRateLimitError,
     ApexServerError,
     ApexValidationError,
-    Approval,
     ApprovalCreate,
     ApprovalDecision,
     ApprovalStatus,
     ApprovalType,
     AsyncApexClient,
-    DAG,
     DAGCreate,
     DAGNode,
     DAGStatus,
@@ -31,121 +33,217 @@ from apex_sdk import (
     TaskStatus,
 )
 
+# Keep every test that shares the session-scoped clients on one xdist worker
+# (effective with ``pytest -n auto --dist loadgroup``).
+pytestmark = pytest.mark.xdist_group("apex_sdk")
+
+
+# id(body) -> (body, encoded body). The body is kept referenced so its id
+# cannot be reused by another object while the entry exists.
+_ENCODED_BODIES = {}
+
+
+def _resp(status=200, body=None, headers=None):
+    """Build an ``httpx.Response`` with the given status and JSON body.
+
+    Each body object is serialized once with orjson; later responses built
+    from the same (unmutated) payload reuse the bytes.
+    """
+    entry = _ENCODED_BODIES.get(id(body))
+    if entry is None:
+        entry = _ENCODED_BODIES[id(body)] = (body, orjson.dumps(body))
+    return httpx.Response(
+        status,
+        content=entry[1],
+        headers={"Content-Type": "application/json", **(headers or {})},
+    )
+
+
+class _MockAPI:
+    """Request handler for the ``httpx.MockTransport`` behind the shared clients.
+
+    Tests queue responses with :meth:`reply`. Each request is recorded in
+    :attr:`requests` and answered with the next queued response; the last one
+    is repeated once the queue runs dry.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self._responses = []
+
+    def reply(self, *responses):
+        self._responses[:] = responses
+
+    def reset(self):
+        self.requests.clear()
+        self._responses.clear()
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if len(self._responses) > 1:
+            return self._responses.pop(0)
+        return self._responses[0]
+
 
 # Fixtures
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def base_url():
     return "https://api.apex.example.com"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_key():
     return "test-api-key"
 
 
-@pytest.fixture
-def mock_task_response():
-    return {
-        "id": "task-123",
-        "name": "Test Task",
-        "description": "A test task",
-        "status": "pending",
-        "priority": "normal",
-        "agentId": None,
-        "input": {"data": {"key": "value"}},
-        "output": None,
-        "error": None,
-        "timeoutSeconds": 3600,
-        "retries": 3,
-        "retryCount": 0,
-        "tags": ["test"],
-        "metadata": {},
-        "dagId": None,
-        "dependsOn": [],
-        "createdAt": "2024-01-15T10:00:00Z",
-        "updatedAt": "2024-01-15T10:00:00Z",
-        "startedAt": None,
-        "completedAt": None,
-    }
+@pytest.fixture(scope="session", autouse=True)
+def _disable_retry():
+    """Make ``_request`` fail fast: one attempt, no back-off.
 
+    The ``@retry`` decorator is applied when ``apex_sdk.client`` is imported,
+    so the policy is patched on the ``Retrying`` objects it attached rather
+    than on ``apex_sdk.client.retry``.
+    """
+    with ExitStack() as stack:
+        for client_cls in (ApexClient, AsyncApexClient):
+            retrying = client_cls._request.retry
+            stack.enter_context(patch.object(retrying, "stop", stop_after_attempt(1)))
+            stack.enter_context(patch.object(retrying, "wait", wait_none()))
+        yield
 
-@pytest.fixture
-def mock_agent_response():
-    return {
-        "id": "agent-456",
-        "name": "Test Agent",
-        "description": "A test agent",
-        "status": "idle",
-        "capabilities": [{"name": "code-analysis", "version": "1.0"}],
-        "maxConcurrentTasks": 5,
-        "currentTasks": 0,
-        "totalTasksCompleted": 100,
-        "tags": ["python"],
-        "metadata": {},
-        "lastHeartbeat": "2024-01-15T10:00:00Z",
-        "createdAt": "2024-01-15T09:00:00Z",
-        "updatedAt": "2024-01-15T10:00:00Z",
-    }
+
+@pytest.fixture(scope="session")
+def _mock_api_handler():
+    return _MockAPI()
 
 
 @pytest.fixture
-def mock_dag_response():
-    return {
-        "id": "dag-789",
-        "name": "Test DAG",
-        "description": "A test DAG",
-        "status": "pending",
-        "nodes": [
-            {
-                "id": "node-1",
-                "taskTemplate": {"name": "Task 1"},
-                "dependsOn": [],
-            }
-        ],
-        "edges": [],
-        "input": {},
-        "output": {},
-        "tags": [],
-        "metadata": {},
-        "schedule": None,
-        "taskStatuses": [],
-        "createdAt": "2024-01-15T09:00:00Z",
-        "updatedAt": "2024-01-15T10:00:00Z",
-        "startedAt": None,
-        "completedAt": None,
-    }
+def mock_api(_mock_api_handler):
+    """The shared clients' request handler, cleared for the current test."""
+    _mock_api_handler.reset()
+    return _mock_api_handler
+
+
+@pytest.fixture(scope="session")
+def sync_client(base_url, api_key, _mock_api_handler):
+    """Shared synchronous client served by ``mock_api``."""
+    client = ApexClient(
+        base_url, api_key=api_key, transport=httpx.MockTransport(_mock_api_handler)
+    )
+    yield client
+    client.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client(base_url, api_key, _mock_api_handler):
+    """Shared asynchronous client served by ``mock_api``, bound to the session loop."""
+    client = AsyncApexClient(
+        base_url, api_key=api_key, transport=httpx.MockTransport(_mock_api_handler)
+    )
+    yield client
+    await client.close()
+
+
+# Request payloads shared by the create/decide tests. Built once at import;
+# tests only read them, so a single validated instance per payload is enough.
+_TASK_CREATE = TaskCreate(
+    name="Test Task",
+    description="A test task",
+    priority=TaskPriority.HIGH,
+)
+_AGENT_CREATE = AgentCreate(name="Test Agent", description="A test agent")
+_DAG_CREATE = DAGCreate(
+    name="Test DAG",
+    nodes=[DAGNode(id="node-1", taskTemplate=TaskCreate(name="Task 1"))],
+)
+_APPROVAL_CREATE = ApprovalCreate(
+    taskId="task-123",
+    type=ApprovalType.MANUAL,
+    description="Please approve",
+)
+_APPROVAL_DECISION = ApprovalDecision(
+    status=ApprovalStatus.APPROVED,
+    approverId="user-1",
+    comment="Looks good",
+)
 
 
-@pytest.fixture
-def mock_approval_response():
-    return {
-        "id": "approval-101",
-        "taskId": "task-123",
-        "status": "pending",
-        "type": "manual",
-        "description": "Please approve this task",
-        "requiredApprovers": ["user-1"],
-        "approvers": [],
-        "expiresAt": "2024-01-16T10:00:00Z",
-        "decidedAt": None,
-        "comment": None,
-        "metadata": {},
-        "createdAt": "2024-01-15T10:00:00Z",
-        "updatedAt": "2024-01-15T10:00:00Z",
-    }
+# (status, exception, response body, response headers). Kept as a module-level
+# tuple so every collection reuses the same parameter objects; exception
+# classes are passed directly rather than by name.
+ERROR_CASES = (
+    pytest.param(404, ApexNotFoundError, {"message": "Task not found"}, {}, id="404"),
+    pytest.param(
+        422,
+        ApexValidationError,
+        {"message": "Validation failed", "details": {"name": "required"}},
+        {},
+        id="422",
+    ),
+    pytest.param(
+        429,
+        ApexRateLimitError,
+        {"message": "Rate limit exceeded"},
+        {"Retry-After": "60"},
+        id="429",
+    ),
+)
 
 
-@pytest.fixture
-def mock_task_list_response(mock_task_response):
-    return {
-        "items": [mock_task_response],
-        "total": 1,
-        "page": 1,
-        "perPage": 20,
-        "totalPages": 1,
-    }
+# (list_tasks kwargs, expected query parameters)
+LIST_TASKS_QUERY_CASES = (
+    pytest.param(
+        {"page": 2, "per_page": 50},
+        {"page": "2", "perPage": "50"},
+        id="pagination",
+    ),
+    pytest.param(
+        {"status": "running", "tags": ["urgent", "critical"]},
+        {"status": "running", "tags": "urgent,critical", "page": "1", "perPage": "20"},
+        id="filters",
+    ),
+)
+
+
+# (model class, constructor kwargs, expected attribute values)
+VALID_MODEL_CASES = (
+    pytest.param(
+        TaskCreate,
+        {"name": "Valid Task", "priority": TaskPriority.HIGH, "retries": 5},
+        {"name": "Valid Task", "priority": TaskPriority.HIGH, "retries": 5},
+        id="task-create",
+    ),
+    pytest.param(
+        AgentCreate,
+        {"name": "Valid Agent", "maxConcurrentTasks": 10},
+        {"name": "Valid Agent", "max_concurrent_tasks": 10},
+        id="agent-create",
+    ),
+    pytest.param(
+        DAGNode,
+        {"id": "node-1", "taskTemplate": TaskCreate(name="Node Task"), "dependsOn": ["node-0"]},
+        {"id": "node-1", "depends_on": ["node-0"]},
+        id="dag-node",
+    ),
+    pytest.param(
+        ApprovalDecision,
+        {
+            "status": ApprovalStatus.APPROVED,
+            "approverId": "user-123",
+            "comment": "Approved with comments",
+        },
+        {"status": ApprovalStatus.APPROVED, "approver_id": "user-123"},
+        id="approval-decision",
+    ),
+)
+
+# (model class, constructor kwargs)
+INVALID_MODEL_CASES = (
+    pytest.param(TaskCreate, {"name": ""}, id="task-empty-name"),
+    pytest.param(TaskCreate, {"name": "Task", "retries": 20}, id="task-too-many-retries"),
+)
 
 
 # Synchronous Client Tests
@@ -176,325 +274,206 @@ class TestApexClient:
         with ApexClient(base_url, api_key=api_key) as client:
             assert client is not None
 
-    @patch.object(httpx.Client, "request")
-    def test_list_tasks(self, mock_request, base_url, api_key, mock_task_list_response):
-        """Test listing tasks."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_task_list_response
-        mock_request.return_value = mock_response
 
-        with ApexClient(base_url, api_key=api_key) as client:
-            result = client.list_tasks()
+# Asynchronous Client Tests
 
-        assert len(result.items) == 1
-        assert result.items[0].id == "task-123"
-        assert result.total == 1
 
-    @patch.object(httpx.Client, "request")
-    def test_get_task(self, mock_request, base_url, api_key, mock_task_response):
-        """Test getting a task by ID."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_task_response
-        mock_request.return_value = mock_response
+class TestAsyncApexClient:
+    """Tests for the asynchronous AsyncApexClient."""
 
-        with ApexClient(base_url, api_key=api_key) as client:
-            task = client.get_task("task-123")
+    pytestmark = [pytest.mark.asyncio(loop_scope="session"), pytest.mark.looptime]
 
-        assert task.id == "task-123"
-        assert task.name == "Test Task"
-        assert task.status == TaskStatus.PENDING
+    async def test_async_client_initialization(self, base_url, api_key):
+        """Test async client initialization."""
+        async with AsyncApexClient(base_url, api_key=api_key) as client:
+            assert client.base_url == base_url
+            assert client.api_key == api_key
 
-    @patch.object(httpx.Client, "request")
-    def test_create_task(self, mock_request, base_url, api_key, mock_task_response):
-        """Test creating a task."""
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = mock_task_response
-        mock_request.return_value = mock_response
+    async def test_async_cancel_task(
+        self, mock_api, async_client, cancelled_task_response
+    ):
+        """Test async cancelling a task."""
+        mock_api.reply(_resp(200, cancelled_task_response))
 
-        with ApexClient(base_url, api_key=api_key) as client:
-            task = client.create_task(
-                TaskCreate(
-                    name="Test Task",
-                    description="A test task",
-                    priority=TaskPriority.HIGH,
-                )
-            )
+        task = await async_client.cancel_task("task-123")
 
-        assert task.id == "task-123"
-        assert isinstance(task, Task)
+        assert task.status == TaskStatus.CANCELLED
 
-    @patch.object(httpx.Client, "request")
-    def test_create_agent(self, mock_request, base_url, api_key, mock_agent_response):
-        """Test creating an agent."""
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = mock_agent_response
-        mock_request.return_value = mock_response
+    async def test_async_start_dag(
+        self, mock_api, async_client, running_dag_response
+    ):
+        """Test async starting a DAG."""
+        mock_api.reply(_resp(200, running_dag_response))
 
-        with ApexClient(base_url, api_key=api_key) as client:
-            agent = client.create_agent(
-                AgentCreate(
-                    name="Test Agent",
-                    description="A test agent",
-                )
-            )
+        dag = await async_client.start_dag("dag-789", input_data={"param": "value"})
 
-        assert agent.id == "agent-456"
-        assert agent.status == AgentStatus.IDLE
+        assert dag.status == DAGStatus.RUNNING
 
-    @patch.object(httpx.Client, "request")
-    def test_create_dag(self, mock_request, base_url, api_key, mock_dag_response):
-        """Test creating a DAG."""
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = mock_dag_response
-        mock_request.return_value = mock_response
+    async def test_async_create_approval(
+        self, mock_api, async_client, mock_approval_response
+    ):
+        """Test async creating an approval."""
+        mock_api.reply(_resp(201, mock_approval_response))
 
-        with ApexClient(base_url, api_key=api_key) as client:
-            dag = client.create_dag(
-                DAGCreate(
-                    name="Test DAG",
-                    nodes=[
-                        DAGNode(
-                            id="node-1",
-                            taskTemplate=TaskCreate(name="Task 1"),
-                        )
-                    ],
-                )
-            )
+        approval = await async_client.create_approval(_APPROVAL_CREATE)
 
-        assert dag.id == "dag-789"
-        assert dag.status == DAGStatus.PENDING
+        assert approval.id == "approval-101"
+        assert approval.status == ApprovalStatus.PENDING
 
-    @patch.object(httpx.Client, "request")
-    def test_error_handling_404(self, mock_request, base_url, api_key):
-        """Test 404 error handling."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.json.return_value = {"message": "Task not found"}
-        mock_request.return_value = mock_response
+    async def test_async_decide_approval(
+        self, mock_api, async_client, approved_approval_response
+    ):
+        """Test async deciding an approval."""
+        mock_api.reply(_resp(200, approved_approval_response))
 
-        with ApexClient(base_url, api_key=api_key) as client:
-            with pytest.raises(ApexNotFoundError) as exc_info:
-                client.get_task("nonexistent")
-
-        assert exc_info.value.status_code == 404
-
-    @patch.object(httpx.Client, "request")
-    def test_error_handling_422(self, mock_request, base_url, api_key):
-        """Test validation error handling."""
-        mock_response = MagicMock()
-        mock_response.status_code = 422
-        mock_response.json.return_value = {
-            "message": "Validation failed",
-            "details": {"name": "required"},
-        }
-        mock_request.return_value = mock_response
+        approval = await async_client.decide_approval("approval-101", _APPROVAL_DECISION)
 
-        with ApexClient(base_url, api_key=api_key) as client:
-            with pytest.raises(ApexValidationError) as exc_info:
-                client.create_task(TaskCreate(name=""))
+        assert approval.status == ApprovalStatus.APPROVED
+
+    async def test_async_websocket_client(self, base_url, api_key):
+        """Test getting WebSocket client from async client."""
+        async with AsyncApexClient(base_url, api_key=api_key) as client:
+            ws = client.websocket()
+            assert ws is not None
+            assert ws.api_key == api_key
+            assert "ws" in ws.ws_url
 
-        assert exc_info.value.status_code == 422
+    async def test_async_error_handling_500(self, mock_api, async_client):
+        """Test server error handling with retries disabled."""
+        mock_api.reply(_resp(500, {"message": "Internal server error"}))
 
-    @patch.object(httpx.Client, "request")
-    def test_error_handling_429(self, mock_request, base_url, api_key):
-        """Test rate limit error handling."""
-        mock_response = MagicMock()
-        mock_response.status_code = 429
-        mock_response.headers = {"Retry-After": "60"}
-        mock_response.json.return_value = {"message": "Rate limit exceeded"}
-        mock_request.return_value = mock_response
+        with pytest.raises(ApexServerError) as exc_info:
+            await async_client.get_task("task-123")
 
-        with ApexClient(base_url, api_key=api_key) as client:
-            with pytest.raises(ApexRateLimitError) as exc_info:
-                client.list_tasks()
+        assert exc_info.value.status_code == 500
+        assert len(mock_api.requests) == 1
 
-        assert exc_info.value.status_code == 429
-        assert exc_info.value.retry_after == 60
+    @patch.object(AsyncApexClient._request.retry, "wait", wait_exponential(min=1, max=60))
+    @patch.object(AsyncApexClient._request.retry, "stop", stop_after_attempt(3))
+    async def test_async_retry_backoff(self, mock_api, async_client, mock_task_response):
+        """Test exponential back-off runs on the fast-forwarded loop clock."""
+        unavailable = {"message": "Service unavailable"}
+        mock_api.reply(
+            _resp(503, unavailable), _resp(503, unavailable), _resp(200, mock_task_response)
+        )
+        loop = asyncio.get_running_loop()
+        started = loop.time()
 
+        task = await async_client.get_task("task-123")
 
-# Asynchronous Client Tests
+        assert task.id == "task-123"
+        assert len(mock_api.requests) == 3
+        assert loop.time() - started >= 3
 
 
-class TestAsyncApexClient:
-    """Tests for the asynchronous AsyncApexClient."""
+# Shared Sync/Async Tests
 
-    @pytest.mark.asyncio
-    async def test_async_client_initialization(self, base_url, api_key):
-        """Test async client initialization."""
-        async with AsyncApexClient(base_url, api_key=api_key) as client:
-            assert client.base_url == base_url
-            assert client.api_key == api_key
 
-    @pytest.mark.asyncio
-    @patch.object(httpx.AsyncClient, "request")
-    async def test_async_list_tasks(
-        self, mock_request, base_url, api_key, mock_task_list_response
-    ):
-        """Test async listing tasks."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_task_list_response
-        mock_request.return_value = mock_response
+async def _resolve(result):
+    """Await *result* if it came from the async client."""
+    if inspect.isawaitable(result):
+        return await result
+    return result
 
-        async with AsyncApexClient(base_url, api_key=api_key) as client:
-            result = await client.list_tasks()
+
+class TestClientOperations:
+    """Tests run against both ApexClient and AsyncApexClient."""
+
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+    @pytest.fixture(params=["sync", "async"])
+    def client(self, request):
+        return request.getfixturevalue(f"{request.param}_client")
+
+    async def test_list_tasks(self, mock_api, client, mock_task_list_response):
+        """Test listing tasks."""
+        mock_api.reply(_resp(200, mock_task_list_response))
+
+        result = await _resolve(client.list_tasks())
 
         assert len(result.items) == 1
         assert result.items[0].id == "task-123"
+        assert result.total == 1
 
-    @pytest.mark.asyncio
-    @patch.object(httpx.AsyncClient, "request")
-    async def test_async_get_task(
-        self, mock_request, base_url, api_key, mock_task_response
-    ):
-        """Test async getting a task."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_task_response
-        mock_request.return_value = mock_response
+    async def test_get_task(self, mock_api, client, mock_task_response):
+        """Test getting a task by ID."""
+        mock_api.reply(_resp(200, mock_task_response))
 
-        async with AsyncApexClient(base_url, api_key=api_key) as client:
-            task = await client.get_task("task-123")
+        task = await _resolve(client.get_task("task-123"))
 
         assert task.id == "task-123"
+        assert task.name == "Test Task"
+        assert task.status == TaskStatus.PENDING
 
-    @pytest.mark.asyncio
-    @patch.object(httpx.AsyncClient, "request")
-    async def test_async_create_task(
-        self, mock_request, base_url, api_key, mock_task_response
-    ):
-        """Test async creating a task."""
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = mock_task_response
-        mock_request.return_value = mock_response
+    async def test_create_task(self, mock_api, client, mock_task_response):
+        """Test creating a task."""
+        mock_api.reply(_resp(201, mock_task_response))
 
-        async with AsyncApexClient(base_url, api_key=api_key) as client:
-            task = await client.create_task(
-                TaskCreate(name="Test Task", priority=TaskPriority.CRITICAL)
-            )
+        task = await _resolve(client.create_task(_TASK_CREATE))
 
         assert task.id == "task-123"
+        assert isinstance(task, Task)
 
-    @pytest.mark.asyncio
-    @patch.object(httpx.AsyncClient, "request")
-    async def test_async_cancel_task(
-        self, mock_request, base_url, api_key, mock_task_response
-    ):
-        """Test async cancelling a task."""
-        cancelled_response = mock_task_response.copy()
-        cancelled_response["status"] = "cancelled"
+    async def test_create_agent(self, mock_api, client, mock_agent_response):
+        """Test creating an agent."""
+        mock_api.reply(_resp(201, mock_agent_response))
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = cancelled_response
-        mock_request.return_value = mock_response
+        agent = await _resolve(client.create_agent(_AGENT_CREATE))
 
-        async with AsyncApexClient(base_url, api_key=api_key) as client:
-            task = await client.cancel_task("task-123")
+        assert agent.id == "agent-456"
+        assert agent.status == AgentStatus.IDLE
 
-        assert task.status == TaskStatus.CANCELLED
+    async def test_create_dag(self, mock_api, client, mock_dag_response):
+        """Test creating a DAG."""
+        mock_api.reply(_resp(201, mock_dag_response))
 
-    @pytest.mark.asyncio
-    @patch.object(httpx.AsyncClient, "request")
-    async def test_async_start_dag(
-        self, mock_request, base_url, api_key, mock_dag_response
-    ):
-        """Test async starting a DAG."""
-        running_response = mock_dag_response.copy()
-        running_response["status"] = "running"
+        dag = await _resolve(client.create_dag(_DAG_CREATE))
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = running_response
-        mock_request.return_value = mock_response
+        assert dag.id == "dag-789"
+        assert dag.status == DAGStatus.PENDING
 
-        async with AsyncApexClient(base_url, api_key=api_key) as client:
-            dag = await client.start_dag("dag-789", input_data={"param": "value"})
+    @pytest.mark.parametrize("status,exc,body,headers", ERROR_CASES)
+    async def test_error_handling(self, mock_api, client, status, exc, body, headers):
+        """Test HTTP error responses map to typed SDK exceptions."""
+        mock_api.reply(_resp(status, body, headers))
 
-        assert dag.status == DAGStatus.RUNNING
+        with pytest.raises(exc) as exc_info:
+            await _resolve(client.get_task("task-123"))
 
-    @pytest.mark.asyncio
-    @patch.object(httpx.AsyncClient, "request")
-    async def test_async_create_approval(
-        self, mock_request, base_url, api_key, mock_approval_response
-    ):
-        """Test async creating an approval."""
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = mock_approval_response
-        mock_request.return_value = mock_response
+        assert exc_info.value.status_code == status
+        assert exc_info.value.message == body["message"]
+        if "Retry-After" in headers:
+            assert exc_info.value.retry_after == int(headers["Retry-After"])
 
-        async with AsyncApexClient(base_url, api_key=api_key) as client:
-            approval = await client.create_approval(
-                ApprovalCreate(
-                    taskId="task-123",
-                    type=ApprovalType.MANUAL,
-                    description="Please approve",
-                )
-            )
 
-        assert approval.id == "approval-101"
-        assert approval.status == ApprovalStatus.PENDING
+# Retry Tests
 
-    @pytest.mark.asyncio
-    @patch.object(httpx.AsyncClient, "request")
-    async def test_async_decide_approval(
-        self, mock_request, base_url, api_key, mock_approval_response
-    ):
-        """Test async deciding an approval."""
-        approved_response = mock_approval_response.copy()
-        approved_response["status"] = "approved"
-        approved_response["decidedAt"] = "2024-01-15T11:00:00Z"
-        approved_response["comment"] = "Looks good"
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = approved_response
-        mock_request.return_value = mock_response
+class TestRetry:
+    """Tests that re-enable the retry policy disabled by ``_disable_retry``."""
 
-        async with AsyncApexClient(base_url, api_key=api_key) as client:
-            approval = await client.decide_approval(
-                "approval-101",
-                ApprovalDecision(
-                    status=ApprovalStatus.APPROVED,
-                    approverId="user-1",
-                    comment="Looks good",
-                ),
-            )
+    @patch.object(ApexClient._request.retry, "stop", stop_after_attempt(3))
+    def test_retries_server_errors(self, mock_api, sync_client, mock_task_response):
+        """Test transient 5xx responses are retried until success."""
+        unavailable = {"message": "Service unavailable"}
+        mock_api.reply(
+            _resp(503, unavailable), _resp(503, unavailable), _resp(200, mock_task_response)
+        )
 
-        assert approval.status == ApprovalStatus.APPROVED
+        task = sync_client.get_task("task-123")
 
-    @pytest.mark.asyncio
-    async def test_async_websocket_client(self, base_url, api_key):
-        """Test getting WebSocket client from async client."""
-        async with AsyncApexClient(base_url, api_key=api_key) as client:
-            ws = client.websocket()
-            assert ws is not None
-            assert ws.api_key == api_key
-            assert "ws" in ws.ws_url
+        assert task.id == "task-123"
+        assert len(mock_api.requests) == 3
 
-    @pytest.mark.asyncio
-    @patch.object(httpx.AsyncClient, "request")
-    async def test_async_error_handling_500(self, mock_request, base_url, api_key):
-        """Test server error handling with retries disabled."""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.json.return_value = {"message": "Internal server error"}
-        mock_request.return_value = mock_response
+    @patch.object(ApexClient._request.retry, "stop", stop_after_attempt(3))
+    def test_does_not_retry_client_errors(self, mock_api, sync_client):
+        """Test 4xx responses are raised without retrying."""
+        mock_api.reply(_resp(404, {"message": "Task not found"}))
 
-        # Create client with retry disabled by mocking tenacity
-        with patch("apex_sdk.client.retry", lambda **kwargs: lambda f: f):
-            async with AsyncApexClient(base_url, api_key=api_key) as client:
-                with pytest.raises(ApexServerError) as exc_info:
-                    await client.get_task("task-123")
+        with pytest.raises(ApexNotFoundError):
+            sync_client.get_task("task-123")
 
-            assert exc_info.value.status_code == 500
+        assert len(mock_api.requests) == 1
 
 
 # Model Tests
@@ -503,71 +482,44 @@ class TestAsyncApexClient:
 class TestModels:
     """Tests for Pydantic models."""
 
-    def test_task_create_validation(self):
-        """Test TaskCreate validation."""
-        task = TaskCreate(
-            name="Valid Task",
-            priority=TaskPriority.HIGH,
-            retries=5,
-        )
-        assert task.name == "Valid Task"
-        assert task.priority == TaskPriority.HIGH
-        assert task.retries == 5
-
-    def test_task_create_invalid_name(self):
-        """Test TaskCreate with invalid name."""
-        with pytest.raises(ValueError):
-            TaskCreate(name="")
+    @pytest.mark.parametrize("model_cls,kwargs,expected", VALID_MODEL_CASES)
+    def test_valid_construction(self, model_cls, kwargs, expected):
+        """Test valid input builds the model with the expected field values."""
+        model = model_cls(**kwargs)
+        for field, value in expected.items():
+            assert getattr(model, field) == value
 
-    def test_task_create_invalid_retries(self):
-        """Test TaskCreate with invalid retries."""
+    @pytest.mark.parametrize("model_cls,kwargs", INVALID_MODEL_CASES)
+    def test_invalid_construction(self, model_cls, kwargs):
+        """Test invalid input is rejected."""
         with pytest.raises(ValueError):
-            TaskCreate(name="Task", retries=20)
+            model_cls(**kwargs)
 
-    def test_agent_create_validation(self):
-        """Test AgentCreate validation."""
-        agent = AgentCreate(
-            name="Valid Agent",
-            maxConcurrentTasks=10,
-        )
-        assert agent.name == "Valid Agent"
-        assert agent.max_concurrent_tasks == 10
-
-    def test_dag_node_validation(self):
-        """Test DAGNode validation."""
-        node = DAGNode(
-            id="node-1",
-            taskTemplate=TaskCreate(name="Node Task"),
-            dependsOn=["node-0"],
-        )
-        assert node.id == "node-1"
-        assert node.depends_on == ["node-0"]
-
-    def test_approval_decision_validation(self):
-        """Test ApprovalDecision validation."""
-        decision = ApprovalDecision(
-            status=ApprovalStatus.APPROVED,
-            approverId="user-123",
-            comment="Approved with comments",
-        )
-        assert decision.status == ApprovalStatus.APPROVED
-        assert decision.approver_id == "user-123"
-
-    def test_task_serialization(self, mock_task_response):
+    def test_task_serialization(self, prebuilt_task):
         """Test Task model serialization."""
-        task = Task(**mock_task_response)
-        serialized = task.model_dump(by_alias=True)
+        serialized = prebuilt_task.model_dump(by_alias=True)
         assert serialized["id"] == "task-123"
         assert serialized["agentId"] is None
         assert "createdAt" in serialized
 
-    def test_agent_serialization(self, mock_agent_response):
+    def test_agent_serialization(self, prebuilt_agent):
         """Test Agent model serialization."""
-        agent = Agent(**mock_agent_response)
-        serialized = agent.model_dump(by_alias=True)
+        serialized = prebuilt_agent.model_dump(by_alias=True)
         assert serialized["id"] == "agent-456"
         assert serialized["maxConcurrentTasks"] == 5
 
+    def test_dag_serialization(self, prebuilt_dag):
+        """Test DAG model serialization."""
+        serialized = prebuilt_dag.model_dump(by_alias=True)
+        assert serialized["id"] == "dag-789"
+        assert serialized["nodes"][0]["taskTemplate"]["name"] == "Task 1"
+
+    def test_approval_serialization(self, prebuilt_approval):
+        """Test Approval model serialization."""
+        serialized = prebuilt_approval.model_dump(by_alias=True)
+        assert serialized["id"] == "approval-101"
+        assert serialized["requiredApprovers"] == ["user-1"]
+
 
 # Pagination Tests
 
@@ -575,45 +527,13 @@ class TestModels:
 class TestPagination:
     """Tests for pagination functionality."""
 
-    @patch.object(httpx.Client, "request")
-    def test_pagination_parameters(self, mock_request, base_url, api_key):
-        """Test pagination parameters are passed correctly."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "items": [],
-            "total": 0,
-            "page": 2,
-            "perPage": 50,
-            "totalPages": 0,
-        }
-        mock_request.return_value = mock_response
-
-        with ApexClient(base_url, api_key=api_key) as client:
-            client.list_tasks(page=2, per_page=50)
-
-        # Verify pagination params were passed
-        call_args = mock_request.call_args
-        assert call_args[1]["params"]["page"] == 2
-        assert call_args[1]["params"]["perPage"] == 50
-
-    @patch.object(httpx.Client, "request")
-    def test_filter_parameters(self, mock_request, base_url, api_key):
-        """Test filter parameters are passed correctly."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "items": [],
-            "total": 0,
-            "page": 1,
-            "perPage": 20,
-            "totalPages": 0,
-        }
-        mock_request.return_value = mock_response
+    @pytest.mark.parametrize("kwargs,expected", LIST_TASKS_QUERY_CASES)
+    def test_list_tasks_query_params(self, mock_api, sync_client, kwargs, expected):
+        """Test pagination and filter arguments are encoded into the query string."""
+        mock_api.reply(
+            _resp(200, {"items": [], "total": 0, "page": 1, "perPage": 20, "totalPages": 0})
+        )
 
-        with ApexClient(base_url, api_key=api_key) as client:
-            client.list_tasks(status="running", tags=["urgent", "critical"])
+        sync_client.list_tasks(**kwargs)
 
-        call_args = mock_request.call_args
-        assert call_args[1]["params"]["status"] == "running"
-        assert call_args[1]["params"]["tags"] == "urgent,critical"
+        assert dict(mock_api.requests[-1].url.params) == expected
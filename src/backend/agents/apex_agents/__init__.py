@@ -8,35 +8,100 @@ This module provides:
 - AgentExecutor: Manages agent pool and coordinates task execution
 - Worker: Process that runs agents in a loop with heartbeat
 - Configuration and tracing utilities
+
+Public names are imported from their submodules on first access. Prefer
+explicit imports (``from apex_agents import Agent``); ``from apex_agents
+import *`` resolves every name in ``__all__`` and so loads every submodule.
 """
 
 __version__ = "0.1.0"
 
-from apex_agents.agent import Agent, AgentConfig, AgentStatus, TaskInput, TaskOutput
-from apex_agents.config import Settings, get_settings
-from apex_agents.executor import AgentExecutor, QueuedTask, TaskResult
-from apex_agents.llm import LLMClient, LLMProvider
-from apex_agents.loop_detector import (
-    CostPerInsightTracker,
-    LoopDetectionResult,
-    LoopDetector,
-    LoopType,
-    compute_output_novelty,
-)
-from apex_agents.routing import ModelRouter, RoutingConfig, RoutingResult
-from apex_agents.tools import Tool, ToolError, ToolRegistry, ToolResult, create_default_registry
-from apex_agents.tracing import (
-    TaskSpanContext,
-    get_tracer,
-    init_tracing,
-    shutdown_tracing,
-    traced,
-    traced_async,
-)
-from apex_agents.bidding import AgentBid, AwardDecision, BiddingAgent, TaskAnnouncement
-from apex_agents.worker import Worker, WorkerPool, WorkerState
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from apex_agents.agent import Agent, AgentConfig, AgentStatus, TaskInput, TaskOutput
+    from apex_agents.bidding import AgentBid, AwardDecision, BiddingAgent, TaskAnnouncement
+    from apex_agents.config import Settings, get_settings
+    from apex_agents.executor import AgentExecutor, QueuedTask, TaskResult
+    from apex_agents.llm import LLMClient, LLMProvider
+    from apex_agents.loop_detector import (
+        CostPerInsightTracker,
+        LoopDetectionResult,
+        LoopDetector,
+        LoopType,
+        compute_output_novelty,
+    )
+    from apex_agents.routing import ModelRouter, RoutingConfig, RoutingResult
+    from apex_agents.tools import Tool, ToolError, ToolRegistry, ToolResult, create_default_registry
+    from apex_agents.tracing import (
+        TaskSpanContext,
+        get_tracer,
+        init_tracing,
+        shutdown_tracing,
+        traced,
+        traced_async,
+    )
+    from apex_agents.worker import Worker, WorkerPool, WorkerState
+
+# Submodule -> public names it provides. Submodules are imported on first
+# access (PEP 562) so that ``import apex_agents`` does not pull in the LLM
+# clients, OpenTelemetry, Redis, etc. for callers that only need part of the
+# package.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "apex_agents.agent": ("Agent", "AgentConfig", "AgentStatus", "TaskInput", "TaskOutput"),
+    "apex_agents.bidding": ("BiddingAgent", "TaskAnnouncement", "AgentBid", "AwardDecision"),
+    "apex_agents.executor": ("AgentExecutor", "QueuedTask", "TaskResult"),
+    "apex_agents.worker": ("Worker", "WorkerPool", "WorkerState"),
+    "apex_agents.tools": (
+        "Tool",
+        "ToolError",
+        "ToolRegistry",
+        "ToolResult",
+        "create_default_registry",
+    ),
+    "apex_agents.llm": ("LLMClient", "LLMProvider"),
+    "apex_agents.loop_detector": (
+        "LoopDetector",
+        "LoopDetectionResult",
+        "LoopType",
+        "CostPerInsightTracker",
+        "compute_output_novelty",
+    ),
+    "apex_agents.routing": ("ModelRouter", "RoutingConfig", "RoutingResult"),
+    "apex_agents.config": ("Settings", "get_settings"),
+    "apex_agents.tracing": (
+        "init_tracing",
+        "shutdown_tracing",
+        "get_tracer",
+        "traced",
+        "traced_async",
+        "TaskSpanContext",
+    ),
+}
+
+_LAZY = {name: module for module, names in _EXPORTS.items() for name in names}
+_LAZY_KEYS = frozenset(_LAZY)
 
-__all__ = [
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_KEYS:
+        module_name = _LAZY[name]
+        module = importlib.import_module(module_name)
+        # Bind every re-export of the submodule at once; later lookups hit the
+        # package dict directly and never reach __getattr__ again.
+        namespace = globals()
+        for attr in _EXPORTS[module_name]:
+            namespace[attr] = getattr(module, attr)
+        return namespace[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_KEYS])
+
+
+__all__ = (
     # Agent
     "Agent",
     "AgentConfig",
@@ -85,4 +150,4 @@ __all__ = [
     "traced",
     "traced_async",
     "TaskSpanContext",
-]
+)
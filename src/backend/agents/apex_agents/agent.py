@@ -5,21 +5,24 @@ Agent definition and execution logic.
 from __future__ import annotations
 
 import asyncio
+import copy
+import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
 import structlog
 from opentelemetry import trace
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from apex_agents.llm import LLMClient
 from apex_agents.loop_detector import (
     CostPerInsightTracker,
     LoopDetector,
-    compute_output_novelty,
+    compute_output_novelty_hashed,
+    token_hashes,
 )
 from apex_agents.routing import ModelRouter
 from apex_agents.bidding import BiddingAgent
@@ -59,6 +62,9 @@ class AgentConfig(BaseModel):
     tools: list[str] = []
     max_iterations: int = 10
     temperature: float = 0.7
+    max_parallel_tools: int = Field(
+        default=8, ge=1, description="Tool calls run concurrently per iteration"
+    )
 
 
 @dataclass
@@ -68,14 +74,15 @@ class AgentMetrics:
     cost_dollars: float = 0.0
     iterations: int = 0
     tool_calls: int = 0
-    start_time: datetime | None = None
-    end_time: datetime | None = None
+    # Monotonic time.perf_counter_ns() readings, only meaningful as a pair
+    start_ns: int | None = None
+    end_ns: int | None = None
 
     @property
     def duration_ms(self) -> int:
         """Get duration in milliseconds."""
-        if self.start_time and self.end_time:
-            return int((self.end_time - self.start_time).total_seconds() * 1000)
+        if self.start_ns is not None and self.end_ns is not None:
+            return (self.end_ns - self.start_ns) // 1_000_000
         return 0
 
 
@@ -98,6 +105,9 @@ class Agent:
         result = await agent.run(TaskInput(instruction="Research AI trends"))
     """
 
+    # Number of prior outputs each new output is compared against for novelty
+    NOVELTY_WINDOW = 8
+
     def __init__(
         self,
         config: AgentConfig,
@@ -116,18 +126,45 @@ class Agent:
         self.metrics = AgentMetrics()
         self.loop_detector = LoopDetector()
         self.cost_tracker = CostPerInsightTracker()
-        self._previous_outputs: list[str] = []
+        self._previous_outputs: deque[frozenset[int]] = deque(maxlen=self.NOVELTY_WINDOW)
+        # config.tools is fixed for the agent's lifetime, so resolve once
+        self._resolved_tools: tuple[Tool, ...] = tuple(
+            t for t in (tool_registry.get(name) for name in config.tools) if t is not None
+        )
+        self._tools_schema: list[dict[str, Any]] = [t.to_schema() for t in self._resolved_tools]
+        self._tool_semaphore = asyncio.Semaphore(config.max_parallel_tools)
+        # Shared, never-mutated system message keeps the prompt prefix stable
+        self._system_msg: tuple[dict[str, Any], ...] = (
+            ({"role": "system", "content": config.system_prompt},)
+            if config.system_prompt
+            else ()
+        )
         self._logger = logger.bind(agent_id=str(self.id), agent_name=config.name)
 
+    def clone(self) -> Agent:
+        """
+        Create a fresh agent with this agent's configuration.
+
+        The config-derived parts (resolved tools, tool schema, system
+        message) are shared, as nothing mutates them. Per-run state such as
+        metrics, loop detection, the novelty window and the tool semaphore
+        starts anew, so the clone can run alongside the original.
+        """
+        agent = copy.copy(self)
+        agent.id = uuid.uuid4()
+        agent.status = AgentStatus.IDLE
+        agent.metrics = AgentMetrics()
+        agent.loop_detector = LoopDetector()
+        agent.cost_tracker = CostPerInsightTracker()
+        agent._previous_outputs = deque(maxlen=self.NOVELTY_WINDOW)
+        agent._tool_semaphore = asyncio.Semaphore(self.config.max_parallel_tools)
+        agent._logger = logger.bind(agent_id=str(agent.id), agent_name=self.config.name)
+        return agent
+
     @property
-    def available_tools(self) -> list[Tool]:
-        """Get tools available to this agent."""
-        tools = []
-        for name in self.config.tools:
-            t = self.tool_registry.get(name)
-            if t is not None:
-                tools.append(t)
-        return tools
+    def available_tools(self) -> tuple[Tool, ...]:
+        """Get tools available to this agent, resolved at construction."""
+        return self._resolved_tools
 
     async def run(self, task: TaskInput, trace_id: str | None = None) -> TaskOutput:
         """
@@ -149,7 +186,7 @@ class Agent:
             }
         ) as span:
             self.status = AgentStatus.BUSY
-            self.metrics = AgentMetrics(start_time=datetime.now(UTC))
+            self.metrics = AgentMetrics(start_ns=time.perf_counter_ns())
 
             self._logger.info(
                 "Starting task execution",
@@ -168,7 +205,7 @@ class Agent:
                 raise
 
             finally:
-                self.metrics.end_time = datetime.now(UTC)
+                self.metrics.end_ns = time.perf_counter_ns()
                 self._logger.info(
                     "Task execution completed",
                     tokens_used=self.metrics.tokens_used,
@@ -180,7 +217,7 @@ class Agent:
     async def _execute_loop(self, task: TaskInput, span: trace.Span) -> TaskOutput:
         """Execute the agent loop with tool use and loop detection."""
         messages = self._build_initial_messages(task)
-        tools_schema = self._build_tools_schema()
+        tools_schema = self._build_tools_schema() or None
 
         # Reset detectors for this execution
         self.loop_detector.reset()
@@ -195,7 +232,7 @@ class Agent:
                 if self.model_router is not None:
                     routing_result = await self.model_router.route(
                         messages=messages,
-                        tools=tools_schema if tools_schema else None,
+                        tools=tools_schema,
                         temperature=self.config.temperature,
                     )
                     response = routing_result.response
@@ -204,7 +241,7 @@ class Agent:
                     response = await self.llm_client.create(
                         model=self.config.model,
                         messages=messages,
-                        tools=tools_schema if tools_schema else None,
+                        tools=tools_schema,
                         temperature=self.config.temperature,
                     )
                     iteration_cost = response.cost
@@ -218,26 +255,29 @@ class Agent:
                 output_text = response.content or ""
                 loop_result = self.loop_detector.check(output_text)
                 if loop_result.is_loop:
+                    loop_type = loop_result.loop_type.value if loop_result.loop_type else None
                     self._logger.warning(
                         "Loop detected",
-                        loop_type=loop_result.loop_type.value if loop_result.loop_type else None,
+                        loop_type=loop_type,
                         confidence=loop_result.confidence,
                         iteration=iteration,
                     )
                     span.set_attribute("agent.loop_detected", True)
-                    span.set_attribute("agent.loop_type", str(loop_result.loop_type))
+                    if loop_result.loop_type is not None:
+                        span.set_attribute("agent.loop_type", str(loop_result.loop_type))
                     return TaskOutput(
                         result=f"Agent terminated: {loop_result.suggestion}",
                         data={
                             "error": "loop_detected",
-                            "loop_type": loop_result.loop_type.value if loop_result.loop_type else None,
+                            "loop_type": loop_type,
                             "confidence": loop_result.confidence,
                             "iteration": iteration,
                         },
                     )
 
                 # --- Cost-per-insight tracking ---
-                novelty = compute_output_novelty(output_text, self._previous_outputs)
+                output_tokens = token_hashes(output_text)
+                novelty = compute_output_novelty_hashed(output_tokens, self._previous_outputs)
                 state_changed = bool(response.tool_calls)
                 self.cost_tracker.record_iteration(
                     tokens_used=response.usage.total_tokens,
@@ -245,7 +285,7 @@ class Agent:
                     state_changed=state_changed,
                     output_novelty=novelty,
                 )
-                self._previous_outputs.append(output_text)
+                self._previous_outputs.append(output_tokens)
 
                 should_terminate, reason = self.cost_tracker.should_terminate()
                 if should_terminate:
@@ -292,68 +332,76 @@ class Agent:
 
     def _build_initial_messages(self, task: TaskInput) -> list[dict[str, Any]]:
         """Build the initial message list."""
-        messages = []
-
-        if self.config.system_prompt:
-            messages.append({
-                "role": "system",
-                "content": self.config.system_prompt,
-            })
-
         # Build user message with context
         user_content = task.instruction
         if task.context:
             context_str = "\n".join(f"- {k}: {v}" for k, v in task.context.items())
             user_content = f"Context:\n{context_str}\n\nTask: {task.instruction}"
 
-        messages.append({
-            "role": "user",
-            "content": user_content,
-        })
-
-        return messages
+        return [*self._system_msg, {"role": "user", "content": user_content}]
 
     def _build_tools_schema(self) -> list[dict[str, Any]]:
-        """Build the tools schema for the LLM."""
-        return [tool.to_schema() for tool in self.available_tools]
+        """Return the tools schema for the LLM, built once in ``__init__``."""
+        return self._tools_schema
 
     async def _execute_tools(
         self, tool_calls: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
-        """Execute tool calls and return results."""
-        results = []
+        """Execute tool calls concurrently and return results in call order."""
+        results: list[dict[str, Any] | None] = [None] * len(tool_calls)
 
-        for call in tool_calls:
+        # Resolve every tool up front so unknown names fail without a task
+        slots: list[int] = []
+        pending = []
+        for i, call in enumerate(tool_calls):
             tool_name = call["function"]["name"]
-            tool_args = call["function"]["arguments"]
-            call_id = call["id"]
+            tool = self.tool_registry.get(tool_name)
+            if tool is None:
+                self.metrics.tool_calls += 1
+                error = f"Tool not found: {tool_name}"
+                self._logger.error("Tool execution failed", tool=tool_name, error=error)
+                results[i] = {
+                    "role": "tool",
+                    "tool_call_id": call["id"],
+                    "content": f"Error: {error}",
+                }
+                continue
+            slots.append(i)
+            pending.append(self._execute_tool(call, tool))
+
+        for i, message in zip(slots, await asyncio.gather(*pending), strict=True):
+            results[i] = message
+
+        return results  # type: ignore[return-value]
+
+    async def _execute_tool(self, call: dict[str, Any], tool: Tool) -> dict[str, Any]:
+        """Execute a single resolved tool call, converting failures into an error result."""
+        tool_name = call["function"]["name"]
+        tool_args = call["function"]["arguments"]
+        call_id = call["id"]
+
+        self.metrics.tool_calls += 1
 
-            self.metrics.tool_calls += 1
-
-            with tracer.start_as_current_span(
-                f"tool_{tool_name}",
-                attributes={"tool.name": tool_name}
-            ):
-                self._logger.debug("Executing tool", tool=tool_name)
+        with tracer.start_as_current_span(
+            f"tool_{tool_name}",
+            attributes={"tool.name": tool_name}
+        ):
+            self._logger.debug("Executing tool", tool=tool_name)
 
-                try:
-                    tool = self.tool_registry.get(tool_name)
-                    if tool is None:
-                        raise KeyError(f"Tool not found: {tool_name}")
+            try:
+                async with self._tool_semaphore:
                     tool_result = await tool.execute(**tool_args)
 
-                    results.append({
-                        "role": "tool",
-                        "tool_call_id": call_id,
-                        "content": tool_result.output if tool_result.success else f"Error: {tool_result.error}",
-                    })
-
-                except Exception as e:
-                    self._logger.error("Tool execution failed", tool=tool_name, error=str(e))
-                    results.append({
-                        "role": "tool",
-                        "tool_call_id": call_id,
-                        "content": f"Error: {str(e)}",
-                    })
-
-        return results
+                return {
+                    "role": "tool",
+                    "tool_call_id": call_id,
+                    "content": tool_result.output if tool_result.success else f"Error: {tool_result.error}",
+                }
+
+            except Exception as e:
+                self._logger.error("Tool execution failed", tool=tool_name, error=str(e))
+                return {
+                    "role": "tool",
+                    "tool_call_id": call_id,
+                    "content": f"Error: {str(e)}",
+                }
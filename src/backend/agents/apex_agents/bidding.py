@@ -12,24 +12,76 @@ This module implements the agent-side of the Contract Net Protocol:
 from __future__ import annotations
 
 import asyncio
-import json
 import time
 import uuid
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Literal
 
+import numpy as np
+import orjson
 import redis.asyncio as redis
 import structlog
 
+try:
+    import msgpack
+except ImportError:  # optional: only needed for wire_format="msgpack"
+    msgpack = None  # type: ignore[assignment, unused-ignore]
+
 logger = structlog.get_logger()
 
+# Encoding of bids, announcements and awards on the Redis wire. Both sides
+# must agree; the Rust orchestrator currently speaks JSON only.
+WireFormat = Literal["json", "msgpack"]
+
+
+def _encode(data: dict[str, Any], wire_format: WireFormat) -> bytes:
+    """Encode a CNP message for Redis."""
+    if wire_format == "msgpack":
+        packed: bytes = msgpack.packb(data, use_bin_type=True)
+        return packed
+    return orjson.dumps(data)
+
+
+def _decode(payload: bytes | str, wire_format: WireFormat) -> Any:
+    """Decode a CNP message read from Redis."""
+    if wire_format == "msgpack":
+        return msgpack.unpackb(payload, raw=False)
+    return orjson.loads(payload)
+
+
+def compute_bid_estimates(
+    req_counts: np.ndarray,
+    queue_depth: int,
+    base_cost: float,
+    complexity_premium: float,
+    load_factor: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Price a batch of tasks in one vectorized pass.
+
+    Applies the same formulas as :meth:`BiddingAgent.marginal_cost` and the
+    duration heuristic in :meth:`BiddingAgent.evaluate_task` to an array of
+    requirement counts.
+
+    Returns:
+        Tuple of (costs, estimated_durations) arrays.
+    """
+    costs = np.round(
+        base_cost + load_factor * queue_depth + complexity_premium * req_counts, 6
+    )
+    durations = (
+        BiddingAgent.BASE_DURATION_SECS
+        + BiddingAgent.DURATION_PER_REQUIREMENT_SECS * req_counts
+    )
+    return costs, durations
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Data Models
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TaskAnnouncement:
     """A task announcement from the orchestrator."""
 
@@ -51,6 +103,10 @@ class TaskAnnouncement:
             metadata=data.get("metadata", {}),
         )
 
+    @classmethod
+    def from_bytes(cls, payload: bytes | str, wire_format: WireFormat = "json") -> TaskAnnouncement:
+        return cls.from_dict(_decode(payload, wire_format))
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "task_id": self.task_id,
@@ -62,7 +118,7 @@ class TaskAnnouncement:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentBid:
     """A bid submitted by an agent for a task."""
 
@@ -83,8 +139,11 @@ class AgentBid:
             "capabilities": self.capabilities,
         }
 
+    def to_bytes(self, wire_format: WireFormat = "json") -> bytes:
+        return _encode(self.to_dict(), wire_format)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AwardDecision:
     """An award decision from the orchestrator."""
 
@@ -102,6 +161,10 @@ class AwardDecision:
             total_bids=data.get("total_bids", 0),
         )
 
+    @classmethod
+    def from_bytes(cls, payload: bytes | str, wire_format: WireFormat = "json") -> AwardDecision:
+        return cls.from_dict(_decode(payload, wire_format))
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Bidding Agent
@@ -123,6 +186,9 @@ class BiddingAgent:
         complexity_premium: Multiplier applied based on task complexity.
         heartbeat_interval: Seconds between heartbeats during execution.
         heartbeat_ttl: TTL for the heartbeat key in seconds.
+        wire_format: Encoding for bids, announcements and awards. "msgpack"
+            requires the optional msgpack package and an orchestrator that
+            speaks it; heartbeats are always JSON.
     """
 
     # Redis key patterns (must match the Rust side)
@@ -131,6 +197,24 @@ class BiddingAgent:
     AWARDS_QUEUE_PREFIX = "apex:cnp:awards:"
     HEARTBEAT_PREFIX = "apex:cnp:heartbeat:"
 
+    # Maximum number of queued write commands sent in one pipeline
+    FLUSH_BATCH_SIZE = 128
+
+    # Connection pool sizing: callers wait up to POOL_TIMEOUT seconds for a
+    # free connection instead of opening new ones under bursty fan-out
+    POOL_MAX_CONNECTIONS = 32
+    POOL_TIMEOUT = 5
+    HEALTH_CHECK_INTERVAL = 30
+
+    # Announcements already buffered on the pubsub socket are priced together
+    # (up to this many); a single announcement takes the scalar path.
+    ANNOUNCEMENT_BATCH_SIZE = 256
+
+    # Pricing: cost increase per queued task, and the duration heuristic
+    LOAD_FACTOR = 0.002
+    BASE_DURATION_SECS = 10.0
+    DURATION_PER_REQUIREMENT_SECS = 5.0
+
     def __init__(
         self,
         agent_id: str | None = None,
@@ -140,21 +224,54 @@ class BiddingAgent:
         complexity_premium: float = 0.005,
         heartbeat_interval: float = 5.0,
         heartbeat_ttl: int = 15,
+        wire_format: WireFormat = "json",
     ):
+        if wire_format not in ("json", "msgpack"):
+            raise ValueError(f"Unsupported wire format: {wire_format!r}")
+        if wire_format == "msgpack" and msgpack is None:
+            raise ImportError(
+                "wire_format='msgpack' requires the msgpack package "
+                "(pip install 'apex-agents[msgpack]')"
+            )
+
         self.agent_id = agent_id or str(uuid.uuid4())
         self.capabilities = capabilities or []
+        # Capabilities are fixed after construction; match against a set
+        self._capabilities_set = frozenset(self.capabilities)
         self.redis_url = redis_url
         self.base_cost = base_cost
         self.complexity_premium = complexity_premium
         self.heartbeat_interval = heartbeat_interval
         self.heartbeat_ttl = heartbeat_ttl
+        self.wire_format = wire_format
 
         # Runtime state
-        self._redis: redis.Redis | None = None
+        # redis-py opens sockets on first command, so the client can be built
+        # eagerly and hot paths use it without a connect() check.
+        # Payloads are encoded bytes both ways, so responses stay undecoded.
+        self._pool = redis.BlockingConnectionPool.from_url(
+            self.redis_url,
+            max_connections=self.POOL_MAX_CONNECTIONS,
+            timeout=self.POOL_TIMEOUT,
+            socket_keepalive=True,
+            health_check_interval=self.HEALTH_CHECK_INTERVAL,
+            protocol=3,
+        )
+        self._redis: redis.Redis = redis.Redis(connection_pool=self._pool)
         self._current_queue_depth: int = 0
-        self._active_tasks: set[str] = set()
+        # Active task_id -> its pre-encoded heartbeat key
+        self._active_tasks: dict[str, bytes] = {}
+        self._awards_key = f"{self.AWARDS_QUEUE_PREFIX}{self.agent_id}".encode()
         self._shutdown_event = asyncio.Event()
-        self._heartbeat_tasks: dict[str, asyncio.Task[Any]] = {}
+        # One loop heartbeats every active task while any are running
+        self._heartbeat_task: asyncio.Task[None] | None = None
+        # Active task_id -> its pre-encoded heartbeat payload prefix
+        self._heartbeat_prefixes: dict[str, bytes] = {}
+        # Fire-and-forget writes (bids, heartbeats) drained in pipelines
+        self._cmd_queue: asyncio.Queue[tuple[Any, ...]] = asyncio.Queue()
+        self._flusher: asyncio.Task[None] | None = None
+        # Queued writes lost to failed or cancelled pipelines
+        self._dropped_writes = 0
         self._logger = logger.bind(
             component="bidding_agent",
             agent_id=self.agent_id,
@@ -169,36 +286,102 @@ class BiddingAgent:
     def current_queue_depth(self, value: int) -> None:
         self._current_queue_depth = max(0, value)
 
+    @property
+    def dropped_writes(self) -> int:
+        """Number of queued bids and heartbeats that were never written."""
+        return self._dropped_writes
+
     # ─────────────────────────────────────────────────────────────────────
     # Connection Management
     # ─────────────────────────────────────────────────────────────────────
 
     async def connect(self) -> None:
-        """Establish the Redis connection."""
-        if self._redis is None:
-            self._redis = redis.from_url(
-                self.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
-            )
-            self._logger.debug("Connected to Redis")
+        """Verify the Redis connection.
+
+        The client is created in ``__init__`` and connects on first use, so
+        calling this is optional; it surfaces connection errors early.
+        """
+        await self._redis.ping()
+        self._logger.debug("Connected to Redis")
 
     async def close(self) -> None:
-        """Close the Redis connection and cancel heartbeats."""
+        """Flush pending writes, cancel heartbeats and close the Redis connection."""
         self._shutdown_event.set()
 
-        # Cancel all heartbeat tasks
-        for task_id, task in self._heartbeat_tasks.items():
-            task.cancel()
+        # Cancel the shared heartbeat loop
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
             try:
-                await task
+                await self._heartbeat_task
             except asyncio.CancelledError:
                 pass
-        self._heartbeat_tasks.clear()
+            self._heartbeat_task = None
+
+        await self.flush()
 
-        if self._redis:
-            await self._redis.aclose()
-            self._redis = None
+        await self._redis.aclose()
+        # A client built on an explicit pool does not disconnect it on close
+        await self._pool.disconnect()
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Write Coalescing
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _enqueue(self, command: str, *args: Any) -> None:
+        """Queue a Redis write command and make sure a flusher is running.
+
+        Commands queued while a pipeline is in flight are sent together in
+        the next one, so concurrent bids and heartbeats share round-trips.
+        """
+        self._cmd_queue.put_nowait((command, *args))
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Drain the command queue in pipelines until it is empty."""
+        while not self._cmd_queue.empty():
+            batch: list[tuple[Any, ...]] = []
+            while len(batch) < self.FLUSH_BATCH_SIZE and not self._cmd_queue.empty():
+                batch.append(self._cmd_queue.get_nowait())
+
+            written = False
+            try:
+                pipe = self._redis.pipeline(transaction=False)
+                for command, *args in batch:
+                    getattr(pipe, command)(*args)
+                await pipe.execute()
+                written = True
+            except Exception as e:
+                self._logger.warning(
+                    "Failed to flush Redis commands",
+                    commands=len(batch),
+                    error=str(e),
+                )
+            finally:
+                # Also reached when the flusher is cancelled mid-batch
+                if not written:
+                    self._dropped_writes += len(batch)
+
+    async def flush(self) -> int:
+        """Write every queued bid and heartbeat.
+
+        Drives the flusher rather than waiting on the queue, so a flusher
+        that was cancelled or died with commands still queued is replaced
+        instead of waited on forever.
+
+        Returns:
+            Writes dropped by failed pipelines during this call; see
+            ``dropped_writes`` for the running total.
+        """
+        dropped_before = self._dropped_writes
+        while True:
+            flusher = self._flusher
+            if flusher is None or flusher.done():
+                if self._cmd_queue.empty():
+                    return self._dropped_writes - dropped_before
+                flusher = self._flusher = asyncio.create_task(self._flush_loop())
+            # wait() rather than await: a cancelled flusher must not cancel us
+            await asyncio.wait({flusher})
 
     # ─────────────────────────────────────────────────────────────────────
     # Step 1: Listen for Announcements
@@ -218,38 +401,55 @@ class BiddingAgent:
             callback: Optional async callback invoked with each TaskAnnouncement.
                       If None, the agent auto-evaluates and bids.
         """
-        await self.connect()
-        assert self._redis is not None
-
-        pubsub = self._redis.pubsub()
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
         await pubsub.subscribe(self.ANNOUNCEMENTS_CHANNEL)
 
         self._logger.info("Listening for task announcements")
 
         try:
-            async for message in pubsub.listen():
-                if self._shutdown_event.is_set():
-                    break
-
-                if message["type"] != "message":
+            while not self._shutdown_event.is_set():
+                # Subscribe confirmations are filtered by redis-py; a timeout
+                # keeps the shutdown check responsive on a quiet channel.
+                message = await pubsub.get_message(timeout=1.0)
+                if message is None:
                     continue
 
-                try:
-                    data = json.loads(message["data"])
-                    announcement = TaskAnnouncement.from_dict(data)
-
-                    if callback:
+                # Drain whatever else is already buffered without waiting
+                messages = [message]
+                while len(messages) < self.ANNOUNCEMENT_BATCH_SIZE:
+                    message = await pubsub.get_message(timeout=0.0)
+                    if message is None:
+                        break
+                    messages.append(message)
+
+                announcements = []
+                for message in messages:
+                    try:
+                        announcements.append(
+                            TaskAnnouncement.from_bytes(message["data"], self.wire_format)
+                        )
+                    except (ValueError, KeyError) as e:
+                        self._logger.warning(
+                            "Ignoring malformed announcement",
+                            error=str(e),
+                        )
+
+                if callback:
+                    for announcement in announcements:
                         await callback(announcement)
-                    else:
-                        await self._auto_evaluate_and_bid(announcement)
-
-                except (json.JSONDecodeError, KeyError) as e:
-                    self._logger.warning(
-                        "Ignoring malformed announcement",
-                        error=str(e),
-                    )
+                elif len(announcements) == 1:
+                    await self._auto_evaluate_and_bid(announcements[0])
+                elif announcements:
+                    await self._auto_evaluate_and_bid_batch(announcements)
         finally:
+            # Shielded so a cancelled listener still releases its connection
+            await asyncio.shield(self._close_pubsub(pubsub))
+
+    async def _close_pubsub(self, pubsub: Any) -> None:
+        """Unsubscribe from announcements and close the pubsub connection."""
+        try:
             await pubsub.unsubscribe(self.ANNOUNCEMENTS_CHANNEL)
+        finally:
             await pubsub.aclose()
 
     async def _auto_evaluate_and_bid(self, announcement: TaskAnnouncement) -> None:
@@ -258,6 +458,14 @@ class BiddingAgent:
         if bid is not None:
             await self.submit_bid(bid)
 
+    async def _auto_evaluate_and_bid_batch(
+        self, announcements: list[TaskAnnouncement]
+    ) -> None:
+        """Evaluate a burst of tasks together and bid on every capable one."""
+        for bid in self.evaluate_tasks(announcements):
+            if bid is not None:
+                await self.submit_bid(bid)
+
     # ─────────────────────────────────────────────────────────────────────
     # Step 2: Evaluate Task
     # ─────────────────────────────────────────────────────────────────────
@@ -269,13 +477,73 @@ class BiddingAgent:
         Returns a bid if the agent has at least partial capability match,
         or None if the agent cannot handle the task at all.
         """
-        # Check capability overlap
-        matched = [
-            cap for cap in self.capabilities
-            if cap in announcement.requirements
-        ]
+        matched = self._match_capabilities(announcement)
+        if matched is None:
+            return None
+
+        # Estimate duration (heuristic: 10s base + 5s per requirement)
+        estimated_duration = (
+            self.BASE_DURATION_SECS
+            + self.DURATION_PER_REQUIREMENT_SECS * len(announcement.requirements)
+        )
+
+        return self._make_bid(
+            announcement, matched, self.marginal_cost(announcement), estimated_duration
+        )
+
+    def evaluate_tasks(
+        self, announcements: list[TaskAnnouncement]
+    ) -> list[AgentBid | None]:
+        """
+        Evaluate a batch of announcements, pricing them in one vectorized pass.
 
-        if announcement.requirements and not matched:
+        Equivalent to calling :meth:`evaluate_task` on each announcement;
+        results are returned in input order.
+        """
+        bids: list[AgentBid | None] = [None] * len(announcements)
+        eligible = []
+        for i, announcement in enumerate(announcements):
+            matched = self._match_capabilities(announcement)
+            if matched is not None:
+                eligible.append((i, matched))
+
+        if not eligible:
+            return bids
+
+        req_counts = np.fromiter(
+            (len(announcements[i].requirements) for i, _ in eligible),
+            dtype=np.float64,
+            count=len(eligible),
+        )
+        costs, durations = compute_bid_estimates(
+            req_counts,
+            self._current_queue_depth,
+            self.base_cost,
+            self.complexity_premium,
+            self.LOAD_FACTOR,
+        )
+
+        for (i, matched), cost, duration in zip(
+            eligible, costs.tolist(), durations.tolist(), strict=True
+        ):
+            bids[i] = self._make_bid(announcements[i], matched, cost, duration)
+
+        return bids
+
+    def _match_capabilities(self, announcement: TaskAnnouncement) -> list[str] | None:
+        """Return the capabilities to bid with, or None if the agent can't help."""
+        # An agent without capabilities can never satisfy a requirement
+        if announcement.requirements and not self._capabilities_set:
+            return None
+
+        if not announcement.requirements:
+            return list(self.capabilities)
+
+        # Check capability overlap, keeping the agent's own capability order
+        req_set = frozenset(announcement.requirements)
+        matched = [c for c in self.capabilities if c in req_set]
+
+        if not matched:
             self._logger.debug(
                 "Skipping task — no capability match",
                 task_id=announcement.task_id,
@@ -283,18 +551,22 @@ class BiddingAgent:
             )
             return None
 
+        return matched
+
+    def _make_bid(
+        self,
+        announcement: TaskAnnouncement,
+        matched: list[str],
+        cost: float,
+        estimated_duration: float,
+    ) -> AgentBid:
+        """Build a bid from a capability match and pricing estimates."""
         # Compute capability confidence
         if announcement.requirements:
             match_ratio = len(matched) / len(announcement.requirements)
         else:
             match_ratio = 1.0
 
-        # Compute cost
-        cost = self.marginal_cost(announcement)
-
-        # Estimate duration (heuristic: 10s base + 5s per requirement)
-        estimated_duration = 10.0 + 5.0 * len(announcement.requirements)
-
         # Confidence = capability match ratio * load penalty
         load_penalty = max(0.5, 1.0 - 0.1 * self._current_queue_depth)
         confidence = min(1.0, match_ratio * load_penalty)
@@ -305,7 +577,7 @@ class BiddingAgent:
             estimated_cost=cost,
             estimated_duration=estimated_duration,
             confidence=confidence,
-            capabilities=matched if announcement.requirements else list(self.capabilities),
+            capabilities=matched,
         )
 
         self._logger.debug(
@@ -332,10 +604,9 @@ class BiddingAgent:
         discouraging overbidding. The complexity premium scales with the
         number of required capabilities.
         """
-        load_factor = 0.002  # cost increase per queued task
         cost = (
             self.base_cost
-            + load_factor * self._current_queue_depth
+            + self.LOAD_FACTOR * self._current_queue_depth
             + self.complexity_premium * len(task.requirements)
         )
         return round(cost, 6)
@@ -348,16 +619,14 @@ class BiddingAgent:
         """
         Submit a bid to the per-task bid queue.
 
-        The bid is serialized as JSON and pushed to the Redis list
-        ``apex:cnp:bids:{task_id}``.
+        The bid is serialized in the agent's wire format and queued for an RPUSH to the Redis
+        list ``apex:cnp:bids:{task_id}``; use :meth:`flush` to wait for it
+        to be written.
         """
-        await self.connect()
-        assert self._redis is not None
-
         key = f"{self.BIDS_QUEUE_PREFIX}{bid.task_id}"
-        payload = json.dumps(bid.to_dict())
+        payload = bid.to_bytes(self.wire_format)
 
-        await self._redis.rpush(key, payload)
+        self._enqueue("rpush", key, payload)
 
         self._logger.info(
             "Bid submitted",
@@ -374,10 +643,12 @@ class BiddingAgent:
         """
         Handle a task award from the orchestrator.
 
-        Begins task execution tracking and starts the heartbeat loop.
+        Begins task execution tracking and makes sure the heartbeat loop
+        is running.
         """
         task_id = award.task_id
-        self._active_tasks.add(task_id)
+        self._active_tasks[task_id] = f"{self.HEARTBEAT_PREFIX}{task_id}".encode()
+        self._heartbeat_prefixes[task_id] = self._heartbeat_prefix(task_id)
         self._current_queue_depth += 1
 
         self._logger.info(
@@ -385,9 +656,9 @@ class BiddingAgent:
             task_id=task_id,
         )
 
-        # Start heartbeat for this task
-        heartbeat_task = asyncio.create_task(self._heartbeat_loop(task_id))
-        self._heartbeat_tasks[task_id] = heartbeat_task
+        # The first active task starts the shared heartbeat loop
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
 
     async def wait_for_award(self, timeout: float = 30.0) -> AwardDecision | None:
         """
@@ -399,18 +670,13 @@ class BiddingAgent:
         Returns:
             The AwardDecision if received, or None on timeout.
         """
-        await self.connect()
-        assert self._redis is not None
-
-        key = f"{self.AWARDS_QUEUE_PREFIX}{self.agent_id}"
-        result = await self._redis.blpop(key, timeout=int(timeout))
+        result = await self._redis.blpop(self._awards_key, timeout=int(timeout))
 
         if result is None:
             return None
 
         _key, value = result
-        data = json.loads(value)
-        return AwardDecision.from_dict(data)
+        return AwardDecision.from_bytes(value, self.wire_format)
 
     # ─────────────────────────────────────────────────────────────────────
     # Step 6: Heartbeat
@@ -420,43 +686,60 @@ class BiddingAgent:
         """
         Send a single heartbeat for a task.
 
-        Sets the key ``apex:cnp:heartbeat:{task_id}`` with a TTL so the
+        Queues a SETEX of ``apex:cnp:heartbeat:{task_id}`` with a TTL so the
         orchestrator can detect when the agent stops reporting.
         """
-        await self.connect()
-        assert self._redis is not None
+        # Active tasks reuse what handle_award encoded; others are one-offs
+        key = self._active_tasks.get(task_id)
+        if key is None:
+            key = f"{self.HEARTBEAT_PREFIX}{task_id}".encode()
+        prefix = self._heartbeat_prefixes.get(task_id)
+        if prefix is None:
+            prefix = self._heartbeat_prefix(task_id)
+        heartbeat_data = b"%s%.6f}" % (prefix, time.time())
 
-        key = f"{self.HEARTBEAT_PREFIX}{task_id}"
-        heartbeat_data = json.dumps({
+        self._enqueue("setex", key, self.heartbeat_ttl, heartbeat_data)
+
+    def _heartbeat_prefix(self, task_id: str) -> bytes:
+        """Encode a heartbeat's fixed fields, up to and including ``"timestamp":``.
+
+        Each tick then only appends the number and the closing brace.
+        """
+        return orjson.dumps({
             "agent_id": self.agent_id,
             "task_id": task_id,
-            "timestamp": time.time(),
-        })
+            "timestamp": 0,
+        })[:-2]
 
-        await self._redis.setex(key, self.heartbeat_ttl, heartbeat_data)
+    async def _heartbeat_loop(self) -> None:
+        """Heartbeat every active task each interval until cancelled.
 
-    async def _heartbeat_loop(self, task_id: str) -> None:
-        """Continuously send heartbeats for a task until cancelled."""
-        self._logger.debug("Starting heartbeat", task_id=task_id)
+        All heartbeats for a tick are queued together, so they go out in a
+        single pipeline regardless of how many tasks are running.
+        """
+        self._logger.debug("Starting heartbeat loop")
 
         try:
             while not self._shutdown_event.is_set():
-                await self.send_heartbeat(task_id)
+                for task_id in list(self._active_tasks):
+                    await self.send_heartbeat(task_id)
                 await asyncio.sleep(self.heartbeat_interval)
         except asyncio.CancelledError:
-            self._logger.debug("Heartbeat cancelled", task_id=task_id)
+            self._logger.debug("Heartbeat loop cancelled")
 
     def complete_task(self, task_id: str) -> None:
         """
         Mark a task as completed and stop its heartbeat.
 
-        Call this when the agent finishes executing an awarded task.
+        Call this when the agent finishes executing an awarded task. The
+        shared heartbeat loop stops once no tasks remain active.
         """
-        self._active_tasks.discard(task_id)
+        self._active_tasks.pop(task_id, None)
+        self._heartbeat_prefixes.pop(task_id, None)
         self._current_queue_depth = max(0, self._current_queue_depth - 1)
 
-        if task_id in self._heartbeat_tasks:
-            self._heartbeat_tasks[task_id].cancel()
-            del self._heartbeat_tasks[task_id]
+        if not self._active_tasks and self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
 
         self._logger.info("Task completed", task_id=task_id)
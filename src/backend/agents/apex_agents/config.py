@@ -2,17 +2,42 @@
 Configuration management using Pydantic Settings.
 
 Loads configuration from environment variables with validation.
+
+Every settings model uses ``defer_build=True``: pydantic builds a model's
+validator on first instantiation rather than at import, so importing this
+module (or anything that imports it) does not pay for sections that are
+never constructed.
+
+Settings are frozen once loaded. To override values, build a new instance
+or use ``model_copy(update=...)``; values derived from fields are computed
+on access, so copies never report stale ones. ``model_copy`` does not
+validate the update, so prefer
+``model_validate({**model.model_dump(), ...})`` for values from user input.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import sys
 from enum import Enum
-from functools import lru_cache
-from typing import Any
-
-from pydantic import Field, field_validator, model_validator
+from functools import cache, cached_property, lru_cache
+from pathlib import Path
+from typing import Annotated, Any, Literal, TypeVar, get_origin
+
+import orjson
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+)
+from pydantic_core import to_json
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from apex_agents import __version__
 from apex_agents.routing import DEFAULT_CASCADE, RoutingConfig
 
 
@@ -34,7 +59,43 @@ class LogLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
-class BackendConfig(BaseSettings):
+_ENVIRONMENT_BY_VALUE: dict[str, Environment] = {e.value: e for e in Environment}
+_LOG_LEVEL_BY_VALUE: dict[str, LogLevel] = {level.value: level for level in LogLevel}
+
+
+def _parse_environment(v: Any) -> Any:
+    if isinstance(v, str):
+        v = v.lower()
+        return _ENVIRONMENT_BY_VALUE.get(v, v)
+    return v
+
+
+def _parse_log_level(v: Any) -> Any:
+    if isinstance(v, str):
+        v = v.upper()
+        return _LOG_LEVEL_BY_VALUE.get(v, v)
+    return v
+
+
+# Case-insensitive enum fields: known names resolve to their member with one
+# dict lookup; anything else falls through to pydantic's enum validation,
+# which reports the error
+_CaseInsensitiveEnvironment = Annotated[Environment, BeforeValidator(_parse_environment)]
+_CaseInsensitiveLogLevel = Annotated[LogLevel, BeforeValidator(_parse_log_level)]
+
+
+class _ApexSettings(BaseSettings):
+    """Shared config for every settings model; subclasses only set ``env_prefix``."""
+
+    model_config = SettingsConfigDict(
+        case_sensitive=False,
+        frozen=True,
+        extra="forbid",
+        defer_build=True,
+    )
+
+
+class BackendConfig(_ApexSettings):
     """Configuration for connecting to the Rust backend."""
 
     model_config = SettingsConfigDict(env_prefix="APEX_BACKEND_")
@@ -46,18 +107,22 @@ class BackendConfig(BaseSettings):
     timeout_seconds: float = Field(default=30.0, description="Request timeout")
     max_retries: int = Field(default=3, description="Maximum retry attempts")
 
+    # Built on each access, so copies made with model_copy(update=...), which
+    # skips model_post_init, never report a previous host or port. Plain
+    # concatenation: one fixed shape, no per-field __format__ dispatch
+
     @property
     def http_base_url(self) -> str:
         """Get the HTTP base URL for the backend."""
-        return f"http://{self.host}:{self.http_port}"
+        return "http://" + self.host + ":" + str(self.http_port)
 
     @property
     def grpc_address(self) -> str:
         """Get the gRPC address for the backend."""
-        return f"{self.host}:{self.grpc_port}"
+        return self.host + ":" + str(self.grpc_port)
 
 
-class RedisConfig(BaseSettings):
+class RedisConfig(_ApexSettings):
     """Configuration for Redis connection."""
 
     model_config = SettingsConfigDict(env_prefix="APEX_REDIS_")
@@ -70,9 +135,22 @@ class RedisConfig(BaseSettings):
         default="apex:workers:heartbeat:", description="Worker heartbeat key prefix"
     )
     heartbeat_ttl_seconds: int = Field(default=30, description="Heartbeat TTL in seconds")
+    result_cache_key_prefix: str = Field(
+        default="apex:tasks:result-cache:", description="Task result cache key prefix"
+    )
+    result_cache_ttl_seconds: int = Field(
+        default=0, ge=0, description="Task result cache TTL in seconds (0 disables the cache)"
+    )
+    wire_format: Literal["json", "msgpack"] = Field(
+        default="json",
+        description=(
+            "Encoding of task and result payloads; msgpack needs the msgpack extra "
+            "and a producer that publishes msgpack"
+        ),
+    )
 
 
-class DatabaseConfig(BaseSettings):
+class DatabaseConfig(_ApexSettings):
     """Configuration for PostgreSQL database."""
 
     model_config = SettingsConfigDict(env_prefix="APEX_DATABASE_")
@@ -86,7 +164,7 @@ class DatabaseConfig(BaseSettings):
     echo: bool = Field(default=False, description="Echo SQL statements")
 
 
-class LLMConfig(BaseSettings):
+class LLMConfig(_ApexSettings):
     """Configuration for LLM providers."""
 
     model_config = SettingsConfigDict(env_prefix="APEX_LLM_")
@@ -97,18 +175,25 @@ class LLMConfig(BaseSettings):
     timeout_seconds: float = Field(default=120.0, description="LLM request timeout")
     max_retries: int = Field(default=3, description="Maximum retry attempts")
 
-    @model_validator(mode="after")
-    def validate_api_keys(self) -> "LLMConfig":
-        """Ensure at least one API key is configured."""
+    def ensure_api_keys(self) -> None:
+        """
+        Ensure at least one API key is configured.
+
+        This is a deployment check, not a validator: it runs once, where an
+        LLM client is built from these settings, instead of on every
+        construction.
+
+        Raises:
+            ValueError: If neither provider key is set.
+        """
         if not self.openai_api_key and not self.anthropic_api_key:
             raise ValueError(
                 "At least one LLM API key must be configured "
                 "(APEX_LLM_OPENAI_API_KEY or APEX_LLM_ANTHROPIC_API_KEY)"
             )
-        return self
 
 
-class TracingConfig(BaseSettings):
+class TracingConfig(_ApexSettings):
     """Configuration for OpenTelemetry tracing."""
 
     model_config = SettingsConfigDict(env_prefix="APEX_TRACING_")
@@ -126,7 +211,7 @@ class TracingConfig(BaseSettings):
     )
 
 
-class WorkerConfig(BaseSettings):
+class WorkerConfig(_ApexSettings):
     """Configuration for the worker process."""
 
     model_config = SettingsConfigDict(env_prefix="APEX_WORKER_")
@@ -147,81 +232,364 @@ class WorkerConfig(BaseSettings):
     graceful_shutdown_timeout_seconds: int = Field(
         default=30, ge=5, le=300, description="Graceful shutdown timeout"
     )
+    result_flush_interval_ms: int = Field(
+        default=50, ge=1, le=10_000, description="Max time a result waits to be batched"
+    )
+    result_batch_size: int = Field(
+        default=32, ge=1, le=1000, description="Max results reported per flush"
+    )
 
 
-class Settings(BaseSettings):
+class Settings(_ApexSettings):
     """Main application settings combining all configuration sections."""
 
-    model_config = SettingsConfigDict(
-        env_prefix="APEX_",
-        env_nested_delimiter="__",
-        case_sensitive=False,
-    )
+    model_config = SettingsConfigDict(env_prefix="APEX_")
 
     # General settings
-    environment: Environment = Field(
+    environment: _CaseInsensitiveEnvironment = Field(
         default=Environment.DEVELOPMENT, description="Deployment environment"
     )
     debug: bool = Field(default=False, description="Enable debug mode")
-    log_level: LogLevel = Field(default=LogLevel.INFO, description="Log level")
+    log_level: _CaseInsensitiveLogLevel = Field(default=LogLevel.INFO, description="Log level")
     log_json: bool = Field(default=True, description="Output logs as JSON")
 
-    # Sub-configurations
-    backend: BackendConfig = Field(default_factory=BackendConfig)
-    redis: RedisConfig = Field(default_factory=RedisConfig)
-    database: DatabaseConfig = Field(default_factory=DatabaseConfig)
-    llm: LLMConfig = Field(default_factory=lambda: LLMConfig(_env_prefix="APEX_LLM_"))  # type: ignore[call-arg]
-    tracing: TracingConfig = Field(default_factory=TracingConfig)
-    worker: WorkerConfig = Field(default_factory=WorkerConfig)
-    routing: RoutingConfig = Field(default_factory=RoutingConfig)
-
-    @field_validator("environment", mode="before")
-    @classmethod
-    def validate_environment(cls, v: Any) -> Environment:
-        """Parse environment from string."""
-        if isinstance(v, str):
-            return Environment(v.lower())
-        return v  # type: ignore[no-any-return]
-
-    @field_validator("log_level", mode="before")
-    @classmethod
-    def validate_log_level(cls, v: Any) -> LogLevel:
-        """Parse log level from string."""
-        if isinstance(v, str):
-            return LogLevel(v.upper())
-        return v  # type: ignore[no-any-return]
+    _env: dict[str, str] = PrivateAttr()
+
+    def __init__(self, **values: Any) -> None:
+        """
+        Load settings; section models may still be passed as keyword arguments.
+
+        Args:
+            **values: Field values, plus optional sections (e.g.
+                ``backend=BackendConfig(...)`` or a dict of its fields) that
+                replace the ones read from the environment.
+        """
+        sections = {name: values.pop(name) for name in _SECTIONS if name in values}
+        super().__init__(**values)
+        for name, value in sections.items():
+            model = _SECTIONS[name][0]
+            # Fill the cached_property slot, as a first access would
+            vars(self)[name] = value if isinstance(value, model) else model.model_validate(value)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Snapshot the APEX_* env the lazy sections are read from."""
+        self._env = _apex_env()
+
+    # Settings' own schema is just the scalar fields above. Sub-configurations
+    # are validated from the snapshot on first access, so a process only pays
+    # for the sections it actually touches and os.environ is scanned once per
+    # load rather than once per section. Each section reads both its own
+    # APEX_<SECTION>_<FIELD> names and the nested APEX_<SECTION>__<FIELD>
+    # form, which wins when both are set.
+
+    def _section(self, name: str, model: type[_M]) -> _M:
+        """Validate section ``name`` from its slice of the load-time snapshot."""
+        return _validate_from_env(model, self._env, _SECTIONS[name][1])
+
+    @cached_property
+    def backend(self) -> BackendConfig:
+        """Rust backend connection settings."""
+        return self._section("backend", BackendConfig)
+
+    @cached_property
+    def redis(self) -> RedisConfig:
+        """Redis connection settings."""
+        return self._section("redis", RedisConfig)
+
+    @cached_property
+    def database(self) -> DatabaseConfig:
+        """PostgreSQL settings."""
+        return self._section("database", DatabaseConfig)
+
+    @cached_property
+    def llm(self) -> LLMConfig:
+        """LLM provider settings."""
+        return self._section("llm", LLMConfig)
+
+    @cached_property
+    def tracing(self) -> TracingConfig:
+        """OpenTelemetry settings."""
+        return self._section("tracing", TracingConfig)
+
+    @cached_property
+    def worker(self) -> WorkerConfig:
+        """Worker process settings."""
+        return self._section("worker", WorkerConfig)
+
+    @cached_property
+    def routing(self) -> RoutingConfig:
+        """Cascade routing settings, read from ``APEX_ROUTING__*``."""
+        return self._section("routing", RoutingConfig)
 
     def is_production(self) -> bool:
         """Check if running in production."""
-        return self.environment == Environment.PRODUCTION
+        # Read the field on each call: model_copy(update=...) skips model_post_init
+        return self.environment is Environment.PRODUCTION
 
     def is_development(self) -> bool:
         """Check if running in development."""
-        return self.environment == Environment.DEVELOPMENT
+        return self.environment is Environment.DEVELOPMENT
+
+
+_M = TypeVar("_M", bound=BaseModel)
+
+# Env values shorter than this are interned when snapshotted
+_INTERN_MAX_LEN = 128
+
+# Directory for the validated-environment markers used by get_settings()
+SETTINGS_CACHE_DIR_ENV = "APEX_SETTINGS_CACHE_DIR"
+
+# Lazily built Settings sections by attribute, with the env prefixes each
+# reads, highest precedence first. The nested "__" names are the ones
+# Settings read when sections were nested fields of its schema.
+_SECTIONS: dict[str, tuple[type[BaseModel], tuple[str, ...]]] = {
+    "backend": (BackendConfig, ("APEX_BACKEND__", "APEX_BACKEND_")),
+    "redis": (RedisConfig, ("APEX_REDIS__", "APEX_REDIS_")),
+    "database": (DatabaseConfig, ("APEX_DATABASE__", "APEX_DATABASE_")),
+    "llm": (LLMConfig, ("APEX_LLM__", "APEX_LLM_")),
+    "tracing": (TracingConfig, ("APEX_TRACING__", "APEX_TRACING_")),
+    "worker": (WorkerConfig, ("APEX_WORKER__", "APEX_WORKER_")),
+    # RoutingConfig is a plain model and only ever had the nested names
+    "routing": (RoutingConfig, ("APEX_ROUTING__",)),
+}
+
+
+@lru_cache(maxsize=64)
+def _adapter(annotation: Any) -> TypeAdapter[Any]:
+    """Build the validator for a field type once per process."""
+    return TypeAdapter(annotation)
+
+
+def _is_complex(annotation: Any) -> bool:
+    """Whether env values for ``annotation`` are JSON documents."""
+    return get_origin(annotation) in (list, dict)
+
+
+def _parse_env_value(annotation: Any, raw: str) -> Any:
+    """Coerce a raw environment string to a field's annotated type."""
+    adapter = _adapter(annotation)
+    if _is_complex(annotation):
+        return adapter.validate_json(raw)
+    return adapter.validate_strings(raw)
+
+
+def _intern_value(key: str, value: str) -> str:
+    """Intern short, non-secret values such as hosts, URLs and model names."""
+    if len(value) < _INTERN_MAX_LEN and not key.endswith("_API_KEY"):
+        return sys.intern(value)
+    return value
+
+
+def _apex_env() -> dict[str, str]:
+    """
+    Snapshot the ``APEX_*`` environment with upper-cased keys.
+
+    Values are interned (see ``_intern_value``); pydantic keeps exact ``str``
+    inputs as-is, so settings fields that repeat a host or URL across
+    sections and reloads share one object.
+    """
+    env: dict[str, str] = {}
+    for name, value in os.environ.items():
+        key = name.upper()
+        if key.startswith("APEX_"):
+            env[key] = _intern_value(key, value)
+    return env
+
+
+def _env_values(
+    model: type[BaseModel], env: dict[str, str], prefixes: tuple[str, ...]
+) -> dict[str, str]:
+    """Slice the raw strings for ``model``'s fields out of an env snapshot."""
+    values: dict[str, str] = {}
+    for name in model.model_fields:
+        key = name.upper()
+        for prefix in prefixes:
+            raw = env.get(prefix + key)
+            if raw is not None:
+                values[name] = raw
+                break
+    return values
+
+
+def _construct_from_env(
+    model: type[_M],
+    env: dict[str, str],
+    prefixes: tuple[str, ...],
+    **preset: Any,
+) -> _M:
+    """
+    Build ``model`` from ``env`` with ``model_construct``.
+
+    Only values present in ``env`` are coerced to their field type (after any
+    ``BeforeValidator`` normalisation); fields in ``preset`` are used as given
+    and the rest take their defaults. Constraints, model validators and
+    ``field_validator`` methods do not run.
+    """
+    values: dict[str, Any] = dict(preset)
+    for name, raw in _env_values(model, env, prefixes).items():
+        if name in values:
+            continue
+        field = model.model_fields[name]
+        before = [m for m in field.metadata if isinstance(m, BeforeValidator)]
+        annotation = Annotated[(field.annotation, *before)] if before else field.annotation
+        values[name] = _parse_env_value(annotation, raw)
+    return model.model_construct(**values)
+
+
+def _decode_complex(raw: str) -> Any:
+    """Decode a JSON env value, falling back to ``json`` for what orjson rejects."""
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # e.g. NaN/Infinity or integers wider than 64 bits
+        return json.loads(raw)
+
+
+@cache
+def _default_section(model: type[_M]) -> _M:
+    """Validate ``model`` with no input once; only frozen models may share it."""
+    return model.model_validate({})
+
+
+def _validate_from_env(model: type[_M], env: dict[str, str], prefixes: tuple[str, ...]) -> _M:
+    """
+    Validate ``model`` from the raw strings for its fields in ``env``.
+
+    A frozen section with no variables set under its prefixes gets the shared
+    default instance instead of another validation pass over its defaults.
+    Mutable sections such as ``RoutingConfig`` are always built fresh, so a
+    change to one Settings cannot leak into another.
+    """
+    raw_values = _env_values(model, env, prefixes)
+    if not raw_values:
+        if not model.model_config.get("frozen"):
+            return model.model_validate({})
+        default: _M = _default_section(model)
+        return default
+    values: dict[str, Any] = {}
+    for name, raw in raw_values.items():
+        complex_value = _is_complex(model.model_fields[name].annotation)
+        values[name] = _decode_complex(raw) if complex_value else raw
+    return model.model_validate(values)
+
+
+def _construct_settings(env: dict[str, str]) -> Settings:
+    """Build Settings from ``env`` without running validators."""
+    settings = _construct_from_env(Settings, env, ("APEX_",))
+    # Prime the cached_property slots so sections skip validation too
+    for name, (model, prefixes) in _SECTIONS.items():
+        vars(settings)[name] = _construct_from_env(model, env, prefixes)
+    return settings
+
+
+def _env_fingerprint(env: dict[str, str]) -> str:
+    """Digest of the package version and ``env``, safe to use as a file name."""
+    digest = hashlib.blake2b(__version__.encode(), digest_size=16)
+    for key, value in sorted(env.items()):
+        digest.update(f"\n{key}={value}".encode())
+    return digest.hexdigest()
+
+
+def _load_settings() -> Settings:
+    """
+    Load settings, skipping validation for an environment validated before.
+
+    When ``APEX_SETTINGS_CACHE_DIR`` is set, a successful full validation
+    leaves an empty marker file named after the environment's fingerprint.
+    A later process that sees the same environment (and package version)
+    builds its settings through the ``model_construct`` path instead. Only
+    the digest is written to disk, never configuration values or keys.
+    """
+    env = _apex_env()
+    cache_dir = env.get(SETTINGS_CACHE_DIR_ENV)
+    if not cache_dir:
+        return Settings()
+
+    marker = Path(cache_dir) / f"settings-{_env_fingerprint(env)}"
+    if marker.exists():
+        return _construct_settings(env)
+
+    settings = Settings()
+    # Only vouch for the environment once every lazy section has validated
+    for name in _SECTIONS:
+        getattr(settings, name)
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+    except OSError:
+        pass
+    return settings
+
+
+# Section fields left out of settings_to_json: credentials, and URLs that
+# usually embed them
+_SECRET_FIELDS: dict[str, set[str]] = {
+    "llm": {"openai_api_key", "anthropic_api_key"},
+    "database": {"url"},
+    "redis": {"url"},
+}
+
+
+def settings_to_json(settings: Settings) -> bytes:
+    """
+    Serialize settings, including every section, to JSON for diagnostics.
+
+    Each section is handed to ``pydantic_core.to_json`` as a model (or as a
+    dict when fields must be excluded), so every part is written by its
+    class's already-built serializer in a single call.
+
+    Args:
+        settings: Settings to serialize.
+
+    Returns:
+        UTF-8 JSON bytes without credentials.
+    """
+    data: dict[str, Any] = settings.model_dump()
+    for name in _SECTIONS:
+        section = getattr(settings, name)
+        secret = _SECRET_FIELDS.get(name)
+        data[name] = section.model_dump(exclude=secret) if secret else section
+    return to_json(data)
+
+
+_SETTINGS: Settings | None = None
 
 
-@lru_cache
 def get_settings() -> Settings:
     """
     Get cached application settings.
 
     Settings are loaded once and cached for the lifetime of the process.
-    Uses environment variables with the APEX_ prefix.
+    Uses environment variables with the APEX_ prefix. Set
+    ``APEX_SETTINGS_CACHE_DIR`` to let warm starts with an unchanged
+    environment skip validation.
 
     Returns:
         Settings instance with all configuration loaded.
     """
-    return Settings()
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = _load_settings()
+    return _SETTINGS
 
 
-def reload_settings() -> Settings:
+def reload_settings(validate: bool = True) -> Settings:
     """
     Force reload settings (clears cache).
 
     Use this when settings need to be refreshed during runtime.
 
+    Args:
+        validate: Run full pydantic validation. Pass ``False`` for a fast
+            refresh from an environment that is already trusted: values are
+            coerced to their field types, but constraints and validators
+            are skipped and only each section's ``APEX_<SECTION>_`` and
+            ``APEX_<SECTION>__`` names are read. Keep the default after any
+            untrusted change to the environment.
+
     Returns:
         Fresh Settings instance.
     """
-    get_settings.cache_clear()
-    return get_settings()
+    global _SETTINGS
+    _SETTINGS = Settings() if validate else _construct_settings(_apex_env())
+    return _SETTINGS
@@ -8,14 +8,19 @@ executes them using the appropriate agent, and reports results back.
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import time
 import uuid
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import httpx
+import orjson
 import redis.asyncio as redis
 import structlog
 from opentelemetry import trace
@@ -37,9 +42,50 @@ from apex_agents.tracing import (
     traced_async,
 )
 
+try:
+    import msgpack
+except ImportError:  # optional: only needed for wire_format="msgpack"
+    msgpack = None  # type: ignore[assignment, unused-ignore]
+
+if TYPE_CHECKING:
+    from redis.commands.core import AsyncScript
+
+    from apex_agents.bidding import WireFormat
+
 logger = structlog.get_logger()
 
 
+# Backend task routes; f-strings already compile to a single BUILD_STRING,
+# faster than %-templates or cached httpx.URL joins
+_TASKS_PATH = "/api/v1/tasks"
+
+# Swap a task's in-flight payload for its retry in one atomic step, so a
+# crash between the two can neither lose the task nor run it twice.
+# KEYS: task queue, in-flight list. ARGV: retry payload, in-flight payload
+# it replaces ("" when the task was not pulled through this queue).
+_REQUEUE_SCRIPT = """
+if ARGV[2] ~= '' then
+    redis.call('LREM', KEYS[2], 1, ARGV[2])
+end
+return redis.call('LPUSH', KEYS[1], ARGV[1])
+"""
+
+
+def _encode(data: dict[str, Any], wire_format: WireFormat = "json") -> bytes:
+    """Encode a queue payload; in JSON, like ``json.dumps``, non-str keys become strings."""
+    if wire_format == "msgpack":
+        packed: bytes = msgpack.packb(data, use_bin_type=True)
+        return packed
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _decode(payload: bytes | str, wire_format: WireFormat = "json") -> Any:
+    """Decode a queue payload read from Redis."""
+    if wire_format == "msgpack":
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    return orjson.loads(payload)
+
+
 class TaskStatus(str, Enum):
     """Task status matching Rust backend."""
 
@@ -51,7 +97,11 @@ class TaskStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+# Enum ``.value`` is a descriptor lookup; a dict hit is several times faster
+_STATUS_VALUES: dict[TaskStatus, str] = {status: status.value for status in TaskStatus}
+
+
+@dataclass(slots=True)
 class QueuedTask:
     """A task pulled from the queue."""
 
@@ -66,13 +116,15 @@ class QueuedTask:
     trace_id: str | None = None
     span_id: str | None = None
     agent_config: AgentConfig | None = None
+    # Raw payload this delivery was pulled as; acks and requeues remove
+    # exactly this entry from the in-flight list. Not part of the wire form.
+    receipt: bytes | None = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_json(cls, data: dict[str, Any]) -> "QueuedTask":
         """Create a QueuedTask from JSON data."""
-        agent_config = None
-        if "agent_config" in data and data["agent_config"]:
-            agent_config = AgentConfig(**data["agent_config"])
+        raw_config = data.get("agent_config")
+        agent_config = AgentConfig.model_validate(raw_config) if raw_config else None
 
         return cls(
             id=data["id"],
@@ -88,8 +140,24 @@ class QueuedTask:
             agent_config=agent_config,
         )
 
+    def to_json(self) -> dict[str, Any]:
+        """Convert to the JSON-serializable dict read by ``from_json``."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "instruction": self.instruction,
+            "context": self.context,
+            "parameters": self.parameters,
+            "priority": self.priority,
+            "max_retries": self.max_retries,
+            "retry_count": self.retry_count,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "agent_config": self.agent_config.model_dump() if self.agent_config else None,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     """Result of task execution."""
 
@@ -103,12 +171,15 @@ class TaskResult:
     duration_ms: int = 0
     trace_id: str | None = None
     span_id: str | None = None
+    # Receipt of the delivery this result finishes, or None once the task
+    # has been requeued; see ``QueuedTask.receipt``. Not part of the wire form.
+    receipt: bytes | None = field(default=None, repr=False, compare=False)
 
     def to_json(self) -> dict[str, Any]:
         """Convert to JSON-serializable dict."""
         return {
             "task_id": self.task_id,
-            "status": self.status.value,
+            "status": _STATUS_VALUES[self.status],
             "result": self.result,
             "data": self.data,
             "error": self.error,
@@ -119,6 +190,22 @@ class TaskResult:
             "span_id": self.span_id,
         }
 
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> TaskResult:
+        """Create a TaskResult from the dict produced by ``to_json``."""
+        return cls(
+            task_id=data["task_id"],
+            status=TaskStatus(data["status"]),
+            result=data.get("result"),
+            data=data.get("data", {}),
+            error=data.get("error"),
+            tokens_used=data.get("tokens_used", 0),
+            cost_dollars=data.get("cost_dollars", 0.0),
+            duration_ms=data.get("duration_ms", 0),
+            trace_id=data.get("trace_id"),
+            span_id=data.get("span_id"),
+        )
+
 
 class BackendClient:
     """
@@ -127,6 +214,12 @@ class BackendClient:
     Supports both REST and gRPC communication modes.
     """
 
+    # Sized for a worker's concurrent start/complete reports; idle
+    # connections are kept alive so bursts skip the TCP handshake
+    HTTP_LIMITS = httpx.Limits(max_connections=128, max_keepalive_connections=64)
+    # HTTP/2 is negotiated via ALPN on TLS only, and needs the h2 package
+    HTTP2 = importlib.util.find_spec("h2") is not None
+
     def __init__(self, settings: Settings):
         """
         Initialize the backend client.
@@ -144,6 +237,8 @@ class BackendClient:
             self._http_client = httpx.AsyncClient(
                 base_url=self.settings.backend.http_base_url,
                 timeout=self.settings.backend.timeout_seconds,
+                limits=self.HTTP_LIMITS,
+                http2=self.HTTP2,
             )
         return self._http_client
 
@@ -195,7 +290,7 @@ class BackendClient:
         try:
             await self._request(
                 "POST",
-                f"/api/v1/tasks/{task_id}/start",
+                f"{_TASKS_PATH}/{task_id}/start",
                 json_data={"agent_id": agent_id},
             )
             self._logger.debug("Reported task started", task_id=task_id, agent_id=agent_id)
@@ -216,13 +311,13 @@ class BackendClient:
         try:
             await self._request(
                 "POST",
-                f"/api/v1/tasks/{result.task_id}/complete",
+                f"{_TASKS_PATH}/{result.task_id}/complete",
                 json_data=result.to_json(),
             )
             self._logger.info(
                 "Reported task result",
                 task_id=result.task_id,
-                status=result.status.value,
+                status=_STATUS_VALUES[result.status],
                 tokens=result.tokens_used,
                 cost=result.cost_dollars,
             )
@@ -233,6 +328,18 @@ class BackendClient:
                 error=str(e),
             )
 
+    async def report_task_results(self, results: list[TaskResult]) -> None:
+        """
+        Report a batch of task results to the backend.
+
+        The backend has no batch-completion endpoint, so the per-task
+        requests are issued concurrently over the shared keep-alive client.
+
+        Args:
+            results: The task results.
+        """
+        await asyncio.gather(*(self.report_task_result(result) for result in results))
+
     async def get_task(self, task_id: str) -> dict[str, Any] | None:
         """
         Get task details from the backend.
@@ -244,7 +351,7 @@ class BackendClient:
             Task data or None if not found.
         """
         try:
-            response = await self._request("GET", f"/api/v1/tasks/{task_id}")
+            response = await self._request("GET", f"{_TASKS_PATH}/{task_id}")
             if response.get("success"):
                 return response.get("data")
             return None
@@ -271,40 +378,163 @@ class TaskQueue:
     """
     Task queue backed by Redis.
 
-    Uses Redis lists for task queuing with priority support.
+    Uses Redis lists for task queuing with priority support. Tasks are
+    pulled in batches of up to ``prefetch_count`` and handed out one at a
+    time from a local buffer. Queues in one process share a connection
+    pool per Redis URL; ``close()`` releases only the instance's client.
+
+    Delivery is at-least-once: pulling atomically moves each task onto a
+    per-consumer in-flight list, and ``ack_tasks`` removes it once its
+    result has been reported. Tasks still in flight when a consumer dies
+    are requeued by the next queue connecting with the same consumer ID.
+    Acks go by each delivery's ``receipt``, so acking a failed attempt
+    never removes the retry that replaced it.
     """
 
-    def __init__(self, settings: Settings):
+    # Payloads above this size are decoded in a worker thread, so a large
+    # task context does not stall the event loop; smaller ones skip the hop
+    LARGE_PAYLOAD_BYTES = 64 * 1024
+
+    # Redis URL -> pool shared by every TaskQueue in the process
+    _pools: ClassVar[dict[str, redis.BlockingConnectionPool]] = {}
+
+    def __init__(
+        self,
+        settings: Settings,
+        consumer_id: str | None = None,
+        prefetch_count: int = 1,
+    ):
         """
         Initialize the task queue.
 
         Args:
             settings: Application settings.
+            consumer_id: Names this consumer's in-flight list. Falls back to
+                the configured worker ID, then to a random ID.
+            prefetch_count: Most tasks pulled per round-trip. Size it to how
+                many tasks the caller runs at once; buffered tasks wait for
+                this consumer while other workers may be idle.
         """
         self.settings = settings
         self._redis: redis.Redis | None = None
-        self._logger = logger.bind(component="task_queue")
+        self.prefetch_count = prefetch_count
+        self._prefetched: deque[QueuedTask] = deque()
+        self.consumer_id = consumer_id or settings.worker.worker_id or uuid.uuid4().hex
+        self.processing_key = f"{settings.redis.task_queue_key}:processing:{self.consumer_id}"
+        self._requeue_script: AsyncScript | None = None
+        # The producer must publish in the same format; the Rust orchestrator speaks JSON
+        self.wire_format: WireFormat = settings.redis.wire_format
+        if self.wire_format == "msgpack" and msgpack is None:
+            raise ImportError(
+                "wire_format='msgpack' requires the msgpack package "
+                "(pip install 'apex-agents[msgpack]')"
+            )
+        self._logger = logger.bind(component="task_queue", consumer_id=self.consumer_id)
 
     async def connect(self) -> None:
         """Connect to Redis."""
-        self._redis = redis.from_url(  # type: ignore[no-untyped-call]
-            self.settings.redis.url,
-            encoding="utf-8",
-            decode_responses=True,
-        )
+        url = self.settings.redis.url
+        pool = self._pools.get(url)
+        if pool is None:
+            # Payloads stay bytes end to end; orjson reads and writes them directly
+            pool = self._pools[url] = redis.BlockingConnectionPool.from_url(
+                url,
+                max_connections=self.settings.redis.pool_size,
+            )
+        self._redis = redis.Redis(connection_pool=pool)
+        # Runs via EVALSHA, loading the script on the first NOSCRIPT reply
+        self._requeue_script = self._redis.register_script(_REQUEUE_SCRIPT)
         self._logger.info("Connected to Redis", url=self.settings.redis.url)
+        await self._recover_inflight()
 
     async def close(self) -> None:
-        """Close Redis connection."""
+        """Close Redis connection, returning any prefetched tasks to the queue."""
         if self._redis:
+            if self._prefetched:
+                await self._return_prefetched()
             await self._redis.aclose()
             self._redis = None
 
+    @classmethod
+    async def disconnect_pools(cls) -> None:
+        """Disconnect and forget the shared pools; call once at process shutdown."""
+        pools = list(cls._pools.values())
+        cls._pools.clear()
+        for pool in pools:
+            await pool.disconnect()
+
+    async def _recover_inflight(self) -> None:
+        """Requeue tasks a previous run of this consumer left unacknowledged."""
+        assert self._redis is not None
+        recovered = 0
+        try:
+            # Newest-pulled first onto the consuming end, so the oldest runs first
+            while await self._redis.lmove(
+                self.processing_key, self.settings.redis.task_queue_key, "LEFT", "RIGHT"
+            ) is not None:
+                recovered += 1
+        except Exception as e:
+            self._logger.error("Failed to recover in-flight tasks", error=str(e))
+        if recovered:
+            self._logger.warning("Requeued unacknowledged tasks", count=recovered)
+
+    async def _remove_inflight(self, payloads: list[bytes]) -> None:
+        """Remove payloads from the in-flight list in one round-trip."""
+        assert self._redis is not None
+        pipe = self._redis.pipeline(transaction=False)
+        for data in payloads:
+            pipe.lrem(self.processing_key, 1, data)  # type: ignore[arg-type]
+        await pipe.execute()
+
+    async def ack_tasks(self, receipts: list[bytes]) -> None:
+        """
+        Acknowledge finished deliveries so they are not redelivered.
+
+        Args:
+            receipts: ``receipt`` of each delivery whose result has been reported.
+        """
+        if not self._redis:
+            raise RuntimeError("Not connected to Redis")
+
+        if not receipts:
+            return
+        try:
+            await self._remove_inflight(receipts)
+        except Exception as e:
+            self._logger.error("Failed to acknowledge tasks", count=len(receipts), error=str(e))
+
+    async def _return_prefetched(self) -> None:
+        """Move buffered tasks from the in-flight list back onto the queue."""
+        assert self._redis is not None
+        tasks = list(self._prefetched)
+        self._prefetched.clear()
+        payloads = [
+            task.receipt or _encode(task.to_json(), self.wire_format) for task in tasks
+        ]
+        try:
+            pipe = self._redis.pipeline(transaction=True)
+            # RPUSH in reverse so the oldest buffered task is popped first again
+            pipe.rpush(self.settings.redis.task_queue_key, *reversed(payloads))
+            for data in payloads:
+                pipe.lrem(self.processing_key, 1, data)  # type: ignore[arg-type]
+            await pipe.execute()
+            self._logger.info("Returned prefetched tasks to queue", count=len(tasks))
+        except Exception as e:
+            self._logger.error(
+                "Failed to return prefetched tasks",
+                task_ids=[task.id for task in tasks],
+                error=str(e),
+            )
+
     async def pull_task(self, timeout: float = 1.0) -> QueuedTask | None:
         """
         Pull a task from the queue.
 
-        Uses BRPOP for blocking pop with timeout.
+        Serves from the prefetch buffer when it is non-empty. Otherwise one
+        pipeline sends a blocking BLMOVE followed by up to
+        ``prefetch_count - 1`` LMOVEs onto the in-flight list, so a batch of
+        tasks costs a single round-trip; the extras are buffered for
+        subsequent calls.
 
         Args:
             timeout: Timeout in seconds.
@@ -315,21 +545,47 @@ class TaskQueue:
         if not self._redis:
             raise RuntimeError("Not connected to Redis")
 
+        if self._prefetched:
+            return self._prefetched.popleft()
+
+        key, processing_key = self.settings.redis.task_queue_key, self.processing_key
         try:
-            result = await self._redis.brpop(  # type: ignore[misc,arg-type]
-                self.settings.redis.task_queue_key,
-                timeout=int(timeout),
-            )
-            if result:
-                _, data = result
-                task_data = json.loads(data)
-                self._logger.debug("Pulled task from queue", task_id=task_data.get("id"))
-                return QueuedTask.from_json(task_data)
-            return None
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.blmove(key, processing_key, int(timeout), "RIGHT", "LEFT")
+            for _ in range(self.prefetch_count - 1):
+                pipe.lmove(key, processing_key, "RIGHT", "LEFT")
+            payloads = [data for data in await pipe.execute() if data is not None]
         except Exception as e:
             self._logger.error("Failed to pull task", error=str(e))
             return None
 
+        malformed = []
+        for data in payloads:
+            try:
+                if len(data) > self.LARGE_PAYLOAD_BYTES:
+                    task_data = await asyncio.to_thread(_decode, data, self.wire_format)
+                else:
+                    task_data = _decode(data, self.wire_format)
+                task = QueuedTask.from_json(task_data)
+            except Exception as e:
+                self._logger.error("Failed to parse task", error=str(e))
+                malformed.append(data)
+                continue
+            task.receipt = data
+            self._prefetched.append(task)
+
+        if malformed:
+            # Unparseable payloads would only fail again on redelivery
+            try:
+                await self._remove_inflight(malformed)
+            except Exception as e:
+                self._logger.error("Failed to drop malformed tasks", error=str(e))
+
+        if not self._prefetched:
+            return None
+        self._logger.debug("Pulled tasks from queue", count=len(self._prefetched))
+        return self._prefetched.popleft()
+
     async def push_result(self, result: TaskResult) -> None:
         """
         Push a task result to the result queue.
@@ -343,45 +599,105 @@ class TaskQueue:
         try:
             await self._redis.lpush(  # type: ignore[misc]
                 self.settings.redis.result_queue_key,
-                json.dumps(result.to_json()),
+                _encode(result.to_json(), self.wire_format),
             )
             self._logger.debug("Pushed result to queue", task_id=result.task_id)
         except Exception as e:
             self._logger.error("Failed to push result", task_id=result.task_id, error=str(e))
 
+    async def push_results(self, results: list[TaskResult]) -> bool:
+        """
+        Push a batch of task results to the result queue with one LPUSH.
+
+        Args:
+            results: The task results, oldest first.
+
+        Returns:
+            True if the results reached the queue; failures are logged.
+        """
+        if not self._redis:
+            raise RuntimeError("Not connected to Redis")
+
+        try:
+            await self._redis.lpush(
+                self.settings.redis.result_queue_key,
+                *(_encode(result.to_json(), self.wire_format) for result in results),
+            )
+            self._logger.debug("Pushed results to queue", count=len(results))
+        except Exception as e:
+            self._logger.error(
+                "Failed to push results",
+                task_ids=[result.task_id for result in results],
+                error=str(e),
+            )
+            return False
+        return True
+
+    async def get_cached_result(self, key: str) -> TaskResult | None:
+        """
+        Look up a cached task result.
+
+        Args:
+            key: The result cache key.
+
+        Returns:
+            The cached TaskResult, or None on a miss or lookup error.
+        """
+        if not self._redis:
+            raise RuntimeError("Not connected to Redis")
+
+        try:
+            data = await self._redis.get(key)
+            return TaskResult.from_json(_decode(data, self.wire_format)) if data is not None else None
+        except Exception as e:
+            self._logger.warning("Failed to read cached result", key=key, error=str(e))
+            return None
+
+    async def cache_result(self, key: str, result: TaskResult, ttl_seconds: int) -> None:
+        """
+        Cache a task result with an expiry.
+
+        Args:
+            key: The result cache key.
+            result: The task result.
+            ttl_seconds: Seconds until the entry expires.
+        """
+        if not self._redis:
+            raise RuntimeError("Not connected to Redis")
+
+        try:
+            await self._redis.set(key, _encode(result.to_json(), self.wire_format), ex=ttl_seconds)
+        except Exception as e:
+            self._logger.warning("Failed to cache result", task_id=result.task_id, error=str(e))
+
     async def requeue_task(self, task: QueuedTask) -> None:
         """
         Requeue a task for retry.
 
+        The retry copy, with ``retry_count`` incremented, is pushed and the
+        original leaves the in-flight list in one atomic script call. The
+        task's ``receipt`` is consumed, so results built from it afterwards
+        are not acknowledged a second time.
+
         Args:
             task: The task to requeue.
         """
-        if not self._redis:
+        if not self._redis or not self._requeue_script:
             raise RuntimeError("Not connected to Redis")
 
-        task.retry_count += 1
-        task_data = {
-            "id": task.id,
-            "name": task.name,
-            "instruction": task.instruction,
-            "context": task.context,
-            "parameters": task.parameters,
-            "priority": task.priority,
-            "max_retries": task.max_retries,
-            "retry_count": task.retry_count,
-            "trace_id": task.trace_id,
-            "span_id": task.span_id,
-        }
+        data = task.to_json()
+        data["retry_count"] += 1
+        inflight, task.receipt = task.receipt, None
 
         try:
-            await self._redis.lpush(  # type: ignore[misc]
-                self.settings.redis.task_queue_key,
-                json.dumps(task_data),
+            await self._requeue_script(
+                keys=[self.settings.redis.task_queue_key, self.processing_key],
+                args=[_encode(data, self.wire_format), inflight or b""],
             )
             self._logger.info(
                 "Requeued task for retry",
                 task_id=task.id,
-                retry_count=task.retry_count,
+                retry_count=data["retry_count"],
             )
         except Exception as e:
             self._logger.error("Failed to requeue task", task_id=task.id, error=str(e))
@@ -399,10 +715,14 @@ class AgentExecutor:
     - Reports results back to the backend
     """
 
+    # Agents built for per-task configs, kept warm for tasks that repeat one
+    AGENT_CACHE_SIZE = 64
+
     def __init__(
         self,
         settings: Settings | None = None,
         tool_registry: ToolRegistry | None = None,
+        worker_id: str | None = None,
     ):
         """
         Initialize the agent executor.
@@ -410,16 +730,30 @@ class AgentExecutor:
         Args:
             settings: Application settings. Loads from environment if None.
             tool_registry: Tool registry. Creates default if None.
+            worker_id: ID of the owning worker, used as the task queue's
+                consumer ID.
         """
         self.settings = settings or get_settings()
         self.tool_registry = tool_registry or create_default_registry()
+        self.worker_id = worker_id
 
         self._llm_client: LLMClient | None = None
         self._backend_client: BackendClient | None = None
         self._task_queue: TaskQueue | None = None
         self._agents: dict[str, Agent] = {}
+        # Config digest -> template agent cloned per task, least recently used first
+        self._config_agents: OrderedDict[str, Agent] = OrderedDict()
         self._running_tasks: dict[str, asyncio.Task[Any]] = {}
+        # Live count of execute_task calls in progress, kept by execute_task
+        self._active_count = 0
         self._semaphore: asyncio.Semaphore | None = None
+        # Completed results wait here for the flusher; None asks it to stop
+        self._result_queue: asyncio.Queue[TaskResult | None] = asyncio.Queue()
+        self._result_flusher: asyncio.Task[None] | None = None
+        # Task ID -> start report still in flight; its result waits on it
+        self._start_reports: dict[str, asyncio.Task[None]] = {}
+        self._result_cache_hits = 0
+        self._result_cache_misses = 0
 
         self._logger = logger.bind(component="agent_executor")
         self._tracer = get_tracer("apex_agents.executor")
@@ -433,6 +767,7 @@ class AgentExecutor:
         self._logger.info("Initializing agent executor")
 
         # Initialize LLM client
+        self.settings.llm.ensure_api_keys()
         self._llm_client = LLMClient(
             openai_api_key=self.settings.llm.openai_api_key,
             anthropic_api_key=self.settings.llm.anthropic_api_key,
@@ -442,15 +777,21 @@ class AgentExecutor:
         # Initialize backend client
         self._backend_client = BackendClient(self.settings)
 
-        # Initialize task queue
-        self._task_queue = TaskQueue(self.settings)
-        await self._task_queue.connect()
-
         # Initialize concurrency semaphore
         self._semaphore = asyncio.Semaphore(self.settings.worker.num_agents)
 
-        # Create default agent pool
-        await self._create_agent_pool()
+        # Connect the task queue, create the default agent pool and open LLM
+        # connections together; the pool is built while the network waits
+        # The worker loop runs one task at a time, so it prefetches nothing
+        self._task_queue = TaskQueue(self.settings, consumer_id=self.worker_id)
+        await asyncio.gather(
+            self._task_queue.connect(),
+            self._create_agent_pool(),
+            self._llm_client.prewarm(),
+        )
+
+        # Start batching result reports
+        self._result_flusher = asyncio.create_task(self._flush_results_loop())
 
         self._logger.info(
             "Agent executor initialized",
@@ -475,13 +816,29 @@ class AgentExecutor:
         # Wait for tasks to complete with timeout
         if self._running_tasks:
             try:
-                await asyncio.wait_for(
-                    asyncio.gather(*self._running_tasks.values(), return_exceptions=True),
-                    timeout=self.settings.worker.graceful_shutdown_timeout_seconds,
-                )
-            except asyncio.TimeoutError:
+                async with asyncio.timeout(self.settings.worker.graceful_shutdown_timeout_seconds):
+                    await asyncio.gather(*self._running_tasks.values(), return_exceptions=True)
+            except TimeoutError:
                 self._logger.warning("Timeout waiting for tasks to complete")
 
+        # Flush results still waiting to be reported
+        if self._result_flusher:
+            self._result_queue.put_nowait(None)
+            try:
+                async with asyncio.timeout(self.settings.worker.graceful_shutdown_timeout_seconds):
+                    await self._result_flusher
+            except TimeoutError:
+                self._logger.warning("Timeout flushing pending results")
+            self._result_flusher = None
+
+        # Let start reports for tasks that never produced a result finish
+        if self._start_reports:
+            try:
+                async with asyncio.timeout(self.settings.worker.graceful_shutdown_timeout_seconds):
+                    await asyncio.gather(*self._start_reports.values(), return_exceptions=True)
+            except TimeoutError:
+                self._logger.warning("Timeout reporting task starts")
+
         # Close connections
         if self._task_queue:
             await self._task_queue.close()
@@ -489,6 +846,9 @@ class AgentExecutor:
         if self._backend_client:
             await self._backend_client.close()
 
+        if self._llm_client:
+            await self._llm_client.close()
+
         self._logger.info("Agent executor shutdown complete")
 
     async def _create_agent_pool(self) -> None:
@@ -505,7 +865,8 @@ class AgentExecutor:
             temperature=0.7,
         )
 
-        assert self._llm_client is not None, "LLM client must be initialized before creating agent pool"
+        if self._llm_client is None:
+            raise RuntimeError("LLM client must be initialized before creating agent pool")
         agent = Agent(
             config=default_config,
             llm_client=self._llm_client,
@@ -552,7 +913,8 @@ class AgentExecutor:
         Returns:
             TaskResult or None if no task available.
         """
-        if not self._task_queue:
+        # One check covers everything initialize() sets up for this path
+        if self._task_queue is None or self._semaphore is None:
             raise RuntimeError("Executor not initialized")
 
         # Pull task from queue
@@ -563,7 +925,6 @@ class AgentExecutor:
             return None
 
         # Execute with concurrency limit
-        assert self._semaphore is not None, "Executor not initialized"
         async with self._semaphore:
             return await self.execute_task(task)
 
@@ -577,7 +938,18 @@ class AgentExecutor:
         Returns:
             TaskResult with execution outcome.
         """
-        start_time = datetime.now(timezone.utc)
+        self._active_count += 1
+        try:
+            result = await self._execute_task(task)
+            # Read after the run: a requeue on failure consumes the receipt
+            result.receipt = task.receipt
+            return result
+        finally:
+            self._active_count -= 1
+
+    async def _execute_task(self, task: QueuedTask) -> TaskResult:
+        """Execute a single task; ``execute_task`` keeps the active count."""
+        start_ns = time.perf_counter_ns()
         agent = self._get_agent_for_task(task)
 
         self._logger.info(
@@ -587,9 +959,13 @@ class AgentExecutor:
             agent=agent.config.name,
         )
 
-        # Report task started
+        # Report task started alongside the run instead of ahead of it
         if self._backend_client:
-            await self._backend_client.report_task_started(task.id, str(agent.id))
+            report = asyncio.create_task(
+                self._backend_client.report_task_started(task.id, str(agent.id))
+            )
+            self._start_reports[task.id] = report
+            report.add_done_callback(functools.partial(self._forget_start_report, task.id))
 
         # Execute with tracing
         with TaskSpanContext(
@@ -600,6 +976,29 @@ class AgentExecutor:
             span_id=task.span_id,
         ) as span_ctx:
             try:
+                # Serve repeated tasks from the result cache
+                task_queue = self._task_queue
+                cache_key = self._result_cache_key(task, agent)
+                if cache_key is not None and task_queue is not None:
+                    cached = await task_queue.get_cached_result(cache_key)
+                    span_ctx.add_attribute("task.cache_hit", cached is not None)
+                    if cached is not None:
+                        self._result_cache_hits += 1
+                        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+                        self._logger.info(
+                            "Task served from result cache",
+                            task_id=task.id,
+                            duration_ms=duration_ms,
+                        )
+                        return TaskResult(
+                            task_id=task.id,
+                            status=TaskStatus.COMPLETED,
+                            result=cached.result,
+                            data=cached.data,
+                            duration_ms=duration_ms,
+                        )
+                    self._result_cache_misses += 1
+
                 # Build task input
                 task_input = TaskInput(
                     instruction=task.instruction,
@@ -607,15 +1006,12 @@ class AgentExecutor:
                     parameters=task.parameters,
                 )
 
-                # Run with timeout
-                output = await asyncio.wait_for(
-                    agent.run(task_input, trace_id=task.trace_id),
-                    timeout=self.settings.worker.max_task_duration_seconds,
-                )
+                # Run with timeout; cancels agent.run in place, no wrapper task
+                async with asyncio.timeout(self.settings.worker.max_task_duration_seconds):
+                    output = await agent.run(task_input, trace_id=task.trace_id)
 
                 # Calculate duration
-                end_time = datetime.now(timezone.utc)
-                duration_ms = int((end_time - start_time).total_seconds() * 1000)
+                duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
                 # Record metrics
                 span_ctx.record_metrics(
@@ -624,8 +1020,9 @@ class AgentExecutor:
                     duration_ms=duration_ms,
                 )
 
-                # Get trace context for result
-                trace_ctx = span_ctx.get_trace_context()
+                # W3C traceparent is "00-<32 hex trace id>-<16 hex span id>-<flags>"
+                traceparent = span_ctx.get_trace_context().get("traceparent")
+                trace_id = traceparent[3:35] if traceparent and len(traceparent) >= 35 else None
 
                 result = TaskResult(
                     task_id=task.id,
@@ -635,11 +1032,15 @@ class AgentExecutor:
                     tokens_used=agent.metrics.tokens_used,
                     cost_dollars=agent.metrics.cost_dollars,
                     duration_ms=duration_ms,
-                    trace_id=trace_ctx.get("traceparent", "").split("-")[1]
-                    if trace_ctx.get("traceparent")
-                    else None,
+                    trace_id=trace_id,
                 )
 
+                # Loop and diminishing-returns exits complete with an error marker
+                if cache_key is not None and task_queue is not None and "error" not in output.data:
+                    await task_queue.cache_result(
+                        cache_key, result, self.settings.redis.result_cache_ttl_seconds
+                    )
+
                 self._logger.info(
                     "Task completed successfully",
                     task_id=task.id,
@@ -650,7 +1051,7 @@ class AgentExecutor:
 
                 return result
 
-            except asyncio.TimeoutError:
+            except TimeoutError:
                 self._logger.error(
                     "Task execution timed out",
                     task_id=task.id,
@@ -659,7 +1060,7 @@ class AgentExecutor:
                 return await self._handle_task_failure(
                     task,
                     f"Task timed out after {self.settings.worker.max_task_duration_seconds} seconds",
-                    start_time,
+                    start_ns,
                 )
 
             except Exception as e:
@@ -668,13 +1069,13 @@ class AgentExecutor:
                     task_id=task.id,
                     error=str(e),
                 )
-                return await self._handle_task_failure(task, str(e), start_time)
+                return await self._handle_task_failure(task, str(e), start_ns)
 
     async def _handle_task_failure(
         self,
         task: QueuedTask,
         error: str,
-        start_time: datetime,
+        start_ns: int,
     ) -> TaskResult:
         """
         Handle task failure with retry logic.
@@ -682,13 +1083,12 @@ class AgentExecutor:
         Args:
             task: The failed task.
             error: Error message.
-            start_time: When execution started.
+            start_ns: ``time.perf_counter_ns()`` reading taken when execution started.
 
         Returns:
             TaskResult with failure status.
         """
-        end_time = datetime.now(timezone.utc)
-        duration_ms = int((end_time - start_time).total_seconds() * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         # Check if task should be retried
         if task.retry_count < task.max_retries:
@@ -708,6 +1108,29 @@ class AgentExecutor:
             duration_ms=duration_ms,
         )
 
+    def _forget_start_report(self, task_id: str, report: asyncio.Task[None]) -> None:
+        """Drop a finished start report unless the task has been restarted since."""
+        if self._start_reports.get(task_id) is report:
+            del self._start_reports[task_id]
+
+    def _result_cache_key(self, task: QueuedTask, agent: Agent) -> str | None:
+        """
+        Build the result cache key for a task run by ``agent``.
+
+        The key hashes the task inputs together with the agent configuration,
+        so the same instruction routed to a different model or prompt misses.
+
+        Returns:
+            The cache key, or None when the result cache is disabled.
+        """
+        if not self._task_queue or not self.settings.redis.result_cache_ttl_seconds:
+            return None
+        payload = orjson.dumps(
+            [task.instruction, task.context, task.parameters, agent.config.model_dump()],
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+        return self.settings.redis.result_cache_key_prefix + hashlib.sha256(payload).hexdigest()
+
     def _get_agent_for_task(self, task: QueuedTask) -> Agent:
         """
         Get the appropriate agent for a task.
@@ -718,14 +1141,29 @@ class AgentExecutor:
         Returns:
             Agent instance.
         """
-        # If task has specific agent config, create a new agent
+        # If task has specific agent config, clone a cached agent built for it:
+        # tools and schema are resolved once per config, while each task gets
+        # its own metrics and loop state, so concurrent runs cannot collide
         if task.agent_config:
-            assert self._llm_client is not None, "LLM client must be initialized"
-            return Agent(
+            key = hashlib.blake2b(
+                task.agent_config.model_dump_json().encode(), digest_size=16
+            ).hexdigest()
+            template = self._config_agents.get(key)
+            if template is not None:
+                self._config_agents.move_to_end(key)
+                return template.clone()
+
+            if self._llm_client is None:
+                raise RuntimeError("LLM client must be initialized")
+            template = Agent(
                 config=task.agent_config,
                 llm_client=self._llm_client,
                 tool_registry=self.tool_registry,
             )
+            self._config_agents[key] = template
+            if len(self._config_agents) > self.AGENT_CACHE_SIZE:
+                self._config_agents.popitem(last=False)
+            return template.clone()
 
         # Otherwise use default agent
         return self.get_agent("default")
@@ -733,7 +1171,12 @@ class AgentExecutor:
     @property
     def active_task_count(self) -> int:
         """Get the number of active tasks."""
-        return len([t for t in self._running_tasks.values() if not t.done()])
+        return self._active_count
+
+    @property
+    def result_cache_stats(self) -> dict[str, int]:
+        """Get result cache hit and miss counts."""
+        return {"hits": self._result_cache_hits, "misses": self._result_cache_misses}
 
     @property
     def registered_agents(self) -> list[str]:
@@ -744,13 +1187,71 @@ class AgentExecutor:
         """
         Report a task result.
 
+        Once initialized, the result is queued for the background flusher
+        and this returns immediately; otherwise it is reported inline.
+
         Args:
             result: The task result to report.
         """
-        # Push to result queue
-        if self._task_queue:
-            await self._task_queue.push_result(result)
+        if self._result_flusher is None:
+            await self._flush_results([result])
+            return
+        self._result_queue.put_nowait(result)
+
+    async def _flush_results(self, results: list[TaskResult]) -> None:
+        """Push a batch of results to the result queue and the backend."""
+        # Acknowledge only once the results are safely on the result queue;
+        # otherwise the tasks stay in flight and are redelivered on restart
+        if self._task_queue and await self._task_queue.push_results(results):
+            await self._task_queue.ack_tasks(
+                [result.receipt for result in results if result.receipt is not None]
+            )
 
-        # Report to backend
         if self._backend_client:
-            await self._backend_client.report_task_result(result)
+            # The backend must see a task start before its completion
+            starts = [
+                report
+                for report in (self._start_reports.get(result.task_id) for result in results)
+                if report is not None
+            ]
+            if starts:
+                await asyncio.gather(*starts, return_exceptions=True)
+            await self._backend_client.report_task_results(results)
+
+    async def _flush_results_loop(self) -> None:
+        """
+        Report queued results in batches until a ``None`` sentinel arrives.
+
+        A batch is flushed once it holds ``result_batch_size`` results or
+        ``result_flush_interval_ms`` has passed since its first result.
+        """
+        queue = self._result_queue
+        interval = self.settings.worker.result_flush_interval_ms / 1000
+        max_batch = self.settings.worker.result_batch_size
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            first = await queue.get()
+            if first is None:
+                break
+
+            batch = [first]
+            # A cancelled get() leaves its item queued for the next batch
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout_at(loop.time() + interval):
+                    while len(batch) < max_batch:
+                        item = await queue.get()
+                        if item is None:
+                            stopping = True
+                            break
+                        batch.append(item)
+
+            try:
+                await self._flush_results(batch)
+            except Exception as e:
+                self._logger.error(
+                    "Failed to flush results",
+                    task_ids=[result.task_id for result in batch],
+                    error=str(e),
+                )
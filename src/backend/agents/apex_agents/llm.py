@@ -4,17 +4,23 @@ LLM client abstraction supporting multiple providers.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import importlib.util
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import httpx
+import orjson
 import structlog
 import tiktoken
 from opentelemetry import trace
 from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
 logger = structlog.get_logger()
 tracer = trace.get_tracer(__name__)
 
@@ -27,10 +33,16 @@ class LLMProvider(str, Enum):
 
 @dataclass
 class LLMUsage:
-    """Token usage statistics."""
+    """Token usage statistics.
+
+    ``prompt_tokens`` counts every prompt token; the cache fields are the
+    parts of it read from or written to the provider's prompt cache.
+    """
     prompt_tokens: int
     completion_tokens: int
     total_tokens: int
+    cached_prompt_tokens: int = 0
+    cache_creation_tokens: int = 0
 
 
 @dataclass
@@ -44,28 +56,88 @@ class LLMResponse:
     finish_reason: str
 
 
-# Pricing per 1K tokens (input, output)
-MODEL_PRICING: dict[str, tuple[float, float]] = {
+class ModelPricing(NamedTuple):
+    """Prices per 1K tokens."""
+    input: float
+    output: float
+    # Prompt tokens served from the provider's prompt cache
+    cached_input: float
+    # Prompt tokens written to the cache (Anthropic bills these at a premium)
+    cache_write: float
+
+
+# OpenAI halves cached input and does not bill cache writes separately;
+# Anthropic charges 0.1x input for cache reads and 1.25x for writes
+MODEL_PRICING: dict[str, ModelPricing] = {
     # OpenAI
-    "gpt-4o": (0.005, 0.015),
-    "gpt-4o-mini": (0.00015, 0.0006),
-    "gpt-4-turbo": (0.01, 0.03),
-    "gpt-3.5-turbo": (0.0005, 0.0015),
+    "gpt-4o": ModelPricing(0.005, 0.015, 0.0025, 0.005),
+    "gpt-4o-mini": ModelPricing(0.00015, 0.0006, 0.000075, 0.00015),
+    "gpt-4-turbo": ModelPricing(0.01, 0.03, 0.01, 0.01),
+    "gpt-3.5-turbo": ModelPricing(0.0005, 0.0015, 0.0005, 0.0005),
     # Anthropic
-    "claude-3-opus": (0.015, 0.075),
-    "claude-3-sonnet": (0.003, 0.015),
-    "claude-3.5-sonnet": (0.003, 0.015),
-    "claude-3-haiku": (0.00025, 0.00125),
-    "claude-3.5-haiku": (0.00025, 0.00125),
+    "claude-3-opus": ModelPricing(0.015, 0.075, 0.0015, 0.01875),
+    "claude-3-sonnet": ModelPricing(0.003, 0.015, 0.0003, 0.00375),
+    "claude-3.5-sonnet": ModelPricing(0.003, 0.015, 0.0003, 0.00375),
+    "claude-3-haiku": ModelPricing(0.00025, 0.00125, 0.000025, 0.0003125),
+    "claude-3.5-haiku": ModelPricing(0.00025, 0.00125, 0.000025, 0.0003125),
 }
 
+# Unknown models are priced high, with no cache discount
+_DEFAULT_PRICING = ModelPricing(0.01, 0.03, 0.01, 0.01)
+
+
+# OpenAI and Anthropic both bill batch API requests at half price
+BATCH_DISCOUNT = 0.5
+
+
+def calculate_cost(
+    model: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    batch: bool = False,
+    cached_prompt_tokens: int = 0,
+    cache_creation_tokens: int = 0,
+) -> float:
+    """
+    Calculate cost for a model call.
 
-def calculate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
-    """Calculate cost for a model call."""
-    pricing = MODEL_PRICING.get(model, (0.01, 0.03))  # Default to expensive
-    input_cost = (prompt_tokens / 1000) * pricing[0]
-    output_cost = (completion_tokens / 1000) * pricing[1]
-    return input_cost + output_cost
+    Cached and cache-creation tokens are part of ``prompt_tokens`` and are
+    billed at their own rates; batch API calls get ``BATCH_DISCOUNT``.
+    """
+    pricing = MODEL_PRICING.get(model, _DEFAULT_PRICING)
+    uncached_tokens = prompt_tokens - cached_prompt_tokens - cache_creation_tokens
+    input_cost = (
+        uncached_tokens * pricing.input
+        + cached_prompt_tokens * pricing.cached_input
+        + cache_creation_tokens * pricing.cache_write
+    ) / 1000
+    output_cost = (completion_tokens / 1000) * pricing.output
+    cost = input_cost + output_cost
+    return cost * BATCH_DISCOUNT if batch else cost
+
+
+def _stream_text(event: dict[str, Any]) -> str | None:
+    """Extract the generated text, if any, from an OpenAI or Anthropic stream event."""
+    text: str | None = None
+    if "choices" in event:
+        if event["choices"]:
+            text = event["choices"][0]["delta"].get("content")
+    elif event.get("type") == "content_block_delta":
+        text = event["delta"].get("text")
+    elif event.get("type") == "error":
+        raise RuntimeError(f"LLM stream failed: {event['error']}")
+    return text
+
+
+@lru_cache(maxsize=256)
+def _provider_for(model: str) -> LLMProvider:
+    """Map a model name to its provider; agents reuse a handful of names."""
+    if model.startswith(("gpt", "o1")):
+        return LLMProvider.OPENAI
+    elif model.startswith("claude"):
+        return LLMProvider.ANTHROPIC
+    else:
+        raise ValueError(f"Unknown model provider for: {model}")
 
 
 class LLMClient:
@@ -82,27 +154,96 @@ class LLMClient:
             model="gpt-4o",
             messages=[{"role": "user", "content": "Hello!"}]
         )
+
+    One HTTP client is shared by every call, so repeated requests reuse
+    kept-alive connections; ``close()`` (or ``async with``) releases it.
     """
 
+    # Sized for an executor's concurrent agents; idle connections outlive
+    # an agent's think time so the next call skips the TCP+TLS handshake
+    HTTP_LIMITS = httpx.Limits(
+        max_connections=100, max_keepalive_connections=20, keepalive_expiry=90.0
+    )
+    # Both providers serve HTTP/2, which multiplexes concurrent calls over
+    # one connection; httpx needs the h2 package for it
+    HTTP2 = importlib.util.find_spec("h2") is not None
+    # Seconds a prewarm request may take; it must not hold up startup for long
+    PREWARM_TIMEOUT = 5.0
+
     def __init__(
         self,
         openai_api_key: str | None = None,
         anthropic_api_key: str | None = None,
         timeout: float = 60.0,
+        limits: httpx.Limits | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
+        """
+        Initialize the client.
+
+        Args:
+            openai_api_key: OpenAI API key.
+            anthropic_api_key: Anthropic API key.
+            timeout: Request timeout in seconds.
+            limits: Connection pool limits. Defaults to ``HTTP_LIMITS``.
+            http_client: Client to send requests with instead of an owned
+                one. It is left open by ``close()``; its owner closes it.
+        """
         self.openai_api_key = openai_api_key
         self.anthropic_api_key = anthropic_api_key
         self.timeout = timeout
+        self.limits = limits or self.HTTP_LIMITS
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
         self._logger = logger.bind(component="llm_client")
 
+    async def __aenter__(self) -> LLMClient:
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get or create the shared HTTP client."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=self.timeout, limits=self.limits, http2=self.HTTP2
+            )
+        return self._http_client
+
+    async def close(self) -> None:
+        """Close the HTTP client if this instance created it."""
+        if self._http_client is not None and self._owns_http_client:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def prewarm(self) -> None:
+        """
+        Open pooled connections to the configured providers before the first call.
+
+        The TLS handshake is paid here instead of by the first real request.
+        Failures are logged and ignored; later calls simply connect themselves.
+        """
+        urls = [
+            url
+            for url, key in (
+                ("https://api.openai.com/", self.openai_api_key),
+                ("https://api.anthropic.com/", self.anthropic_api_key),
+            )
+            if key
+        ]
+        client = self._get_http_client()
+        results = await asyncio.gather(
+            *(client.head(url, timeout=self.PREWARM_TIMEOUT) for url in urls),
+            return_exceptions=True,
+        )
+        for url, result in zip(urls, results, strict=True):
+            if isinstance(result, Exception):
+                self._logger.debug("Connection prewarm failed", url=url, error=str(result))
+
     def _get_provider(self, model: str) -> LLMProvider:
         """Determine provider from model name."""
-        if model.startswith("gpt") or model.startswith("o1"):
-            return LLMProvider.OPENAI
-        elif model.startswith("claude"):
-            return LLMProvider.ANTHROPIC
-        else:
-            raise ValueError(f"Unknown model provider for: {model}")
+        return _provider_for(model)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -152,89 +293,289 @@ class LLMClient:
 
             span.set_attributes({
                 "llm.tokens.prompt": response.usage.prompt_tokens,
+                "llm.tokens.prompt_cached": response.usage.cached_prompt_tokens,
                 "llm.tokens.completion": response.usage.completion_tokens,
                 "llm.cost": response.cost,
             })
 
             return response
 
-    async def _openai_create(
+    async def create_many(
+        self,
+        calls: list[dict[str, Any]],
+        max_concurrency: int = 8,
+    ) -> list[LLMResponse]:
+        """
+        Create several completions concurrently.
+
+        Args:
+            calls: Keyword arguments for each ``create`` call
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Responses in the same order as ``calls``
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def create_one(kwargs: dict[str, Any]) -> LLMResponse:
+            async with semaphore:
+                return await self.create(**kwargs)
+
+        return await asyncio.gather(*(create_one(kwargs) for kwargs in calls))
+
+    async def create_batch(
+        self,
+        calls: list[dict[str, Any]],
+        poll_interval: float = 30.0,
+    ) -> list[LLMResponse | None]:
+        """
+        Create completions through the provider's batch API.
+
+        Batches are billed at half price but may take up to 24 hours, so
+        this suits offline work such as evals. All calls must use models
+        of one provider.
+
+        Args:
+            calls: Keyword arguments for each ``create`` call
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            Responses in the same order as ``calls``; None where the
+            provider reported that request as failed or expired
+        """
+        if not calls:
+            return []
+        providers = {self._get_provider(call["model"]) for call in calls}
+        if len(providers) != 1:
+            raise ValueError("A batch must target a single provider")
+        if providers.pop() == LLMProvider.OPENAI:
+            results = await self._openai_batch(calls, poll_interval)
+        else:
+            results = await self._anthropic_batch(calls, poll_interval)
+
+        responses: list[LLMResponse | None] = [None] * len(calls)
+        for custom_id, response in results.items():
+            responses[int(custom_id)] = response
+        failed = responses.count(None)
+        if failed:
+            self._logger.warning("Batch requests failed", failed=failed, total=len(calls))
+        return responses
+
+    async def _openai_batch(
+        self, calls: list[dict[str, Any]], poll_interval: float
+    ) -> dict[str, LLMResponse]:
+        """Run calls through the OpenAI Batch API, keyed by call index."""
+        client = self._get_http_client()
+        lines = []
+        for i, call in enumerate(calls):
+            _, headers, payload = self._openai_request(
+                call["model"],
+                call["messages"],
+                call.get("tools"),
+                call.get("temperature", 0.7),
+                call.get("max_tokens"),
+            )
+            lines.append(orjson.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": payload,
+            }))
+        # The upload is multipart, so drop the JSON content type
+        auth = {"Authorization": headers["Authorization"]}
+
+        upload = await client.post(
+            "https://api.openai.com/v1/files",
+            headers=auth,
+            data={"purpose": "batch"},
+            files={"file": ("batch.jsonl", b"\n".join(lines), "application/jsonl")},
+        )
+        upload.raise_for_status()
+        created = await client.post(
+            "https://api.openai.com/v1/batches",
+            headers=headers,
+            content=orjson.dumps({
+                "input_file_id": orjson.loads(upload.content)["id"],
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            }),
+        )
+        created.raise_for_status()
+        batch = orjson.loads(created.content)
+
+        while batch["status"] not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval)
+            status = await client.get(
+                f"https://api.openai.com/v1/batches/{batch['id']}", headers=auth
+            )
+            status.raise_for_status()
+            batch = orjson.loads(status.content)
+
+        if not batch.get("output_file_id"):
+            raise RuntimeError(f"OpenAI batch {batch['id']} ended as {batch['status']}")
+        output = await client.get(
+            f"https://api.openai.com/v1/files/{batch['output_file_id']}/content", headers=auth
+        )
+        output.raise_for_status()
+
+        results = {}
+        for line in output.content.splitlines():
+            if not line.strip():
+                continue
+            item = orjson.loads(line)
+            response = item.get("response")
+            if response is None or response["status_code"] != 200:
+                continue
+            custom_id = item["custom_id"]
+            results[custom_id] = _parse_openai_response(
+                calls[int(custom_id)]["model"], response["body"], batch=True
+            )
+        return results
+
+    async def _anthropic_batch(
+        self, calls: list[dict[str, Any]], poll_interval: float
+    ) -> dict[str, LLMResponse]:
+        """Run calls through the Anthropic Message Batches API, keyed by call index."""
+        client = self._get_http_client()
+        requests = []
+        for i, call in enumerate(calls):
+            _, headers, payload = self._anthropic_request(
+                call["model"],
+                call["messages"],
+                call.get("tools"),
+                call.get("temperature", 0.7),
+                call.get("max_tokens"),
+            )
+            requests.append({"custom_id": str(i), "params": payload})
+
+        created = await client.post(
+            "https://api.anthropic.com/v1/messages/batches",
+            headers=headers,
+            content=orjson.dumps({"requests": requests}),
+        )
+        created.raise_for_status()
+        batch = orjson.loads(created.content)
+
+        while batch["processing_status"] != "ended":
+            await asyncio.sleep(poll_interval)
+            status = await client.get(
+                f"https://api.anthropic.com/v1/messages/batches/{batch['id']}", headers=headers
+            )
+            status.raise_for_status()
+            batch = orjson.loads(status.content)
+
+        output = await client.get(batch["results_url"], headers=headers)
+        output.raise_for_status()
+
+        results = {}
+        for line in output.content.splitlines():
+            if not line.strip():
+                continue
+            item = orjson.loads(line)
+            if item["result"]["type"] != "succeeded":
+                continue
+            custom_id = item["custom_id"]
+            results[custom_id] = _parse_anthropic_response(
+                calls[int(custom_id)]["model"], item["result"]["message"], batch=True
+            )
+        return results
+
+    async def stream(
+        self,
+        model: str,
+        messages: list[dict[str, Any]],
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion's text as the provider generates it.
+
+        Tool calls are not streamed; use ``create`` for turns that may call
+        tools. Unlike ``create``, failures are not retried, since text may
+        already have been yielded.
+
+        Args:
+            model: Model name
+            messages: Conversation messages
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            Text deltas in generation order
+        """
+        provider = self._get_provider(model)
+        build = (
+            self._openai_request if provider == LLMProvider.OPENAI else self._anthropic_request
+        )
+        url, headers, payload = build(model, messages, None, temperature, max_tokens)
+        payload["stream"] = True
+
+        # Not made current: the generator suspends between chunks
+        span = tracer.start_span(
+            "llm_stream",
+            attributes={"llm.provider": provider.value, "llm.model": model},
+        )
+        try:
+            async with self._get_http_client().stream(
+                "POST", url, headers=headers, content=orjson.dumps(payload)
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    # Server-sent events; Anthropic's "event:" lines repeat the data type
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    text = _stream_text(orjson.loads(data))
+                    if text:
+                        yield text
+        finally:
+            span.end()
+
+    def _openai_request(
         self,
         model: str,
         messages: list[dict[str, Any]],
         tools: list[dict[str, Any]] | None,
         temperature: float,
         max_tokens: int | None,
-    ) -> LLMResponse:
-        """Call OpenAI API."""
+    ) -> tuple[str, dict[str, str], dict[str, Any]]:
+        """Build the URL, headers and payload of an OpenAI chat request."""
         if not self.openai_api_key:
             raise ValueError("OpenAI API key not configured")
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            payload: dict[str, Any] = {
-                "model": model,
-                "messages": messages,
-                "temperature": temperature,
-            }
+        payload: dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+        }
 
-            if tools:
-                payload["tools"] = [
-                    {"type": "function", "function": t} for t in tools
-                ]
-
-            if max_tokens:
-                payload["max_tokens"] = max_tokens
-
-            response = await client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.openai_api_key}",
-                    "Content-Type": "application/json",
-                },
-                json=payload,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        choice = data["choices"][0]
-        message = choice["message"]
-        usage = data["usage"]
-
-        tool_calls = []
-        if "tool_calls" in message:
-            for tc in message["tool_calls"]:
-                tool_calls.append({
-                    "id": tc["id"],
-                    "function": {
-                        "name": tc["function"]["name"],
-                        "arguments": json.loads(tc["function"]["arguments"]),
-                    }
-                })
+        if tools:
+            payload["tools"] = [
+                {"type": "function", "function": t} for t in tools
+            ]
 
-        llm_usage = LLMUsage(
-            prompt_tokens=usage["prompt_tokens"],
-            completion_tokens=usage["completion_tokens"],
-            total_tokens=usage["total_tokens"],
-        )
+        if max_tokens:
+            payload["max_tokens"] = max_tokens
 
-        return LLMResponse(
-            content=message.get("content", ""),
-            tool_calls=tool_calls,
-            usage=llm_usage,
-            model=model,
-            cost=calculate_cost(model, llm_usage.prompt_tokens, llm_usage.completion_tokens),
-            finish_reason=choice["finish_reason"],
-        )
+        headers = {
+            "Authorization": f"Bearer {self.openai_api_key}",
+            "Content-Type": "application/json",
+        }
+        return "https://api.openai.com/v1/chat/completions", headers, payload
 
-    async def _anthropic_create(
+    def _anthropic_request(
         self,
         model: str,
         messages: list[dict[str, Any]],
         tools: list[dict[str, Any]] | None,
         temperature: float,
         max_tokens: int | None,
-    ) -> LLMResponse:
-        """Call Anthropic API."""
+    ) -> tuple[str, dict[str, str], dict[str, Any]]:
+        """Build the URL, headers and payload of an Anthropic messages request."""
         if not self.anthropic_api_key:
             raise ValueError("Anthropic API key not configured")
 
@@ -251,75 +592,169 @@ class LLMClient:
                     "content": msg["content"],
                 })
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            payload: dict[str, Any] = {
-                "model": model,
-                "messages": anthropic_messages,
-                "max_tokens": max_tokens or 4096,
-            }
+        payload: dict[str, Any] = {
+            "model": model,
+            "messages": anthropic_messages,
+            "max_tokens": max_tokens or 4096,
+        }
+
+        if system_content:
+            payload["system"] = system_content
+
+        if tools:
+            payload["tools"] = [
+                {
+                    "name": t["name"],
+                    "description": t.get("description", ""),
+                    "input_schema": t.get("parameters", {}),
+                }
+                for t in tools
+            ]
+
+        headers = {
+            "x-api-key": self.anthropic_api_key,
+            "anthropic-version": "2023-06-01",
+            "Content-Type": "application/json",
+        }
+        return "https://api.anthropic.com/v1/messages", headers, payload
 
-            if system_content:
-                payload["system"] = system_content
-
-            if tools:
-                payload["tools"] = [
-                    {
-                        "name": t["name"],
-                        "description": t.get("description", ""),
-                        "input_schema": t.get("parameters", {}),
-                    }
-                    for t in tools
-                ]
-
-            response = await client.post(
-                "https://api.anthropic.com/v1/messages",
-                headers={
-                    "x-api-key": self.anthropic_api_key,
-                    "anthropic-version": "2023-06-01",
-                    "Content-Type": "application/json",
-                },
-                json=payload,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        # Extract content and tool calls
-        content = ""
-        tool_calls = []
-
-        for block in data["content"]:
-            if block["type"] == "text":
-                content = block["text"]
-            elif block["type"] == "tool_use":
-                tool_calls.append({
-                    "id": block["id"],
-                    "function": {
-                        "name": block["name"],
-                        "arguments": block["input"],
-                    }
-                })
-
-        usage = data["usage"]
-        llm_usage = LLMUsage(
-            prompt_tokens=usage["input_tokens"],
-            completion_tokens=usage["output_tokens"],
-            total_tokens=usage["input_tokens"] + usage["output_tokens"],
+    async def _openai_create(
+        self,
+        model: str,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        temperature: float,
+        max_tokens: int | None,
+    ) -> LLMResponse:
+        """Call OpenAI API."""
+        url, headers, payload = self._openai_request(
+            model, messages, tools, temperature, max_tokens
+        )
+        response = await self._get_http_client().post(
+            url, headers=headers, content=orjson.dumps(payload)
         )
+        response.raise_for_status()
+        return _parse_openai_response(model, orjson.loads(response.content))
 
-        return LLMResponse(
-            content=content,
-            tool_calls=tool_calls,
-            usage=llm_usage,
-            model=model,
-            cost=calculate_cost(model, llm_usage.prompt_tokens, llm_usage.completion_tokens),
-            finish_reason=data["stop_reason"],
+    async def _anthropic_create(
+        self,
+        model: str,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        temperature: float,
+        max_tokens: int | None,
+    ) -> LLMResponse:
+        """Call Anthropic API."""
+        url, headers, payload = self._anthropic_request(
+            model, messages, tools, temperature, max_tokens
+        )
+        response = await self._get_http_client().post(
+            url, headers=headers, content=orjson.dumps(payload)
         )
+        response.raise_for_status()
+        return _parse_anthropic_response(model, orjson.loads(response.content))
+
+
+def _usage_cost(model: str, usage: LLMUsage, batch: bool) -> float:
+    """Price a response's usage, cache reads and writes included."""
+    return calculate_cost(
+        model,
+        usage.prompt_tokens,
+        usage.completion_tokens,
+        batch=batch,
+        cached_prompt_tokens=usage.cached_prompt_tokens,
+        cache_creation_tokens=usage.cache_creation_tokens,
+    )
 
 
-def count_tokens(text: str, model: str = "gpt-4") -> int:
-    """Count tokens in text using tiktoken."""
+def _parse_openai_response(
+    model: str, data: dict[str, Any], batch: bool = False
+) -> LLMResponse:
+    """Build an LLMResponse from an OpenAI chat completion body."""
+    choice = data["choices"][0]
+    message = choice["message"]
+    usage = data["usage"]
+
+    tool_calls = []
+    if "tool_calls" in message:
+        for tc in message["tool_calls"]:
+            tool_calls.append({
+                "id": tc["id"],
+                "function": {
+                    "name": tc["function"]["name"],
+                    "arguments": orjson.loads(tc["function"]["arguments"]),
+                }
+            })
+
+    llm_usage = LLMUsage(
+        prompt_tokens=usage["prompt_tokens"],
+        completion_tokens=usage["completion_tokens"],
+        total_tokens=usage["total_tokens"],
+        cached_prompt_tokens=(usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0),
+    )
+
+    return LLMResponse(
+        content=message.get("content", ""),
+        tool_calls=tool_calls,
+        usage=llm_usage,
+        model=model,
+        cost=_usage_cost(model, llm_usage, batch),
+        finish_reason=choice["finish_reason"],
+    )
+
+
+def _parse_anthropic_response(
+    model: str, data: dict[str, Any], batch: bool = False
+) -> LLMResponse:
+    """Build an LLMResponse from an Anthropic message body."""
+    # Extract content and tool calls
+    content = ""
+    tool_calls = []
+
+    for block in data["content"]:
+        if block["type"] == "text":
+            content = block["text"]
+        elif block["type"] == "tool_use":
+            tool_calls.append({
+                "id": block["id"],
+                "function": {
+                    "name": block["name"],
+                    "arguments": block["input"],
+                }
+            })
+
+    usage = data["usage"]
+    # Anthropic's input_tokens excludes the tokens read from or written to the cache
+    cache_read = usage.get("cache_read_input_tokens") or 0
+    cache_creation = usage.get("cache_creation_input_tokens") or 0
+    prompt_tokens = usage["input_tokens"] + cache_read + cache_creation
+    llm_usage = LLMUsage(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=usage["output_tokens"],
+        total_tokens=prompt_tokens + usage["output_tokens"],
+        cached_prompt_tokens=cache_read,
+        cache_creation_tokens=cache_creation,
+    )
+
+    return LLMResponse(
+        content=content,
+        tool_calls=tool_calls,
+        usage=llm_usage,
+        model=model,
+        cost=_usage_cost(model, llm_usage, batch),
+        finish_reason=data["stop_reason"],
+    )
+
+
+@lru_cache(maxsize=32)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    """Resolve a model's encoding once; building one loads its BPE ranks."""
     try:
-        encoding = tiktoken.encoding_for_model(model)
+        return tiktoken.encoding_for_model(model)
     except KeyError:
-        encoding = tiktoken.get_encoding("cl100k_base")
-    return len(encoding.encode(text))
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text: str, model: str = "gpt-4") -> int:
+    """Count tokens in text using tiktoken."""
+    return len(_get_encoding(model).encode(text))
@@ -10,15 +10,18 @@ Also tracks cost-per-insight to detect diminishing returns.
 
 from __future__ import annotations
 
-import hashlib
+import math
 import time
-from collections import deque
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import structlog
 
+if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+
 logger = structlog.get_logger()
 
 
@@ -72,13 +75,18 @@ class LoopDetector:
     similarity_threshold: float = 0.85
     hash_threshold: int = 3
     length_stagnation_window: int = 5
-    _recent_outputs: deque = field(default_factory=lambda: deque(maxlen=10))
-    _output_hashes: deque = field(default_factory=lambda: deque(maxlen=20))
+    # Token hashes of recent outputs, computed once when each is recorded
+    _recent_tokens: deque[frozenset[int]] = field(default_factory=lambda: deque(maxlen=10))
+    # Fingerprints only ever compared in-process, so the built-in str hash
+    # (cached on the string, no encode step) is enough
+    _output_hashes: deque[int] = field(default_factory=lambda: deque(maxlen=20))
+    # Occurrences of each hash in _output_hashes, kept in step by _record
+    _hash_counts: Counter[int] = field(default_factory=Counter)
     _output_lengths: deque = field(default_factory=lambda: deque(maxlen=10))
 
     def __post_init__(self) -> None:
         # Ensure deque maxlens match configured window sizes
-        self._recent_outputs = deque(maxlen=self.window_size)
+        self._recent_tokens = deque(maxlen=self.window_size)
         self._output_hashes = deque(maxlen=self.window_size * 2)
         self._output_lengths = deque(maxlen=self.window_size)
 
@@ -92,7 +100,7 @@ class LoopDetector:
             LoopDetectionResult indicating whether a loop was detected,
             with confidence score, loop type, and suggested action.
         """
-        output_hash = hashlib.sha256(output.encode()).hexdigest()[:16]
+        output_hash = hash(output)
 
         # Method 1: Exact hash matching (highest priority)
         result = self._check_exact_repeat(output_hash)
@@ -108,7 +116,7 @@ class LoopDetector:
             return result
 
         # Method 3: Jaccard similarity (word-level)
-        result = self._check_similarity(output)
+        result = self._check_similarity()
         if result is not None:
             return result
 
@@ -124,15 +132,26 @@ class LoopDetector:
             suggestion="",
         )
 
-    def _record(self, output: str, output_hash: str) -> None:
+    def _record(self, output: str, output_hash: int) -> None:
         """Record an output for future comparison."""
-        self._recent_outputs.append(output)
-        self._output_hashes.append(output_hash)
+        self._recent_tokens.append(token_hashes(output))
+
+        hashes = self._output_hashes
+        if len(hashes) == hashes.maxlen:
+            # append() is about to evict the oldest hash; drop its count first
+            evicted = hashes[0]
+            remaining = self._hash_counts[evicted] - 1
+            if remaining:
+                self._hash_counts[evicted] = remaining
+            else:
+                del self._hash_counts[evicted]
+        hashes.append(output_hash)
+        self._hash_counts[output_hash] += 1
         self._output_lengths.append(len(output))
 
-    def _check_exact_repeat(self, output_hash: str) -> Optional[LoopDetectionResult]:
+    def _check_exact_repeat(self, output_hash: int) -> Optional[LoopDetectionResult]:
         """Check for exact repeated outputs via hash matching."""
-        hash_count = sum(1 for h in self._output_hashes if h == output_hash)
+        hash_count = self._hash_counts.get(output_hash, 0)
         if hash_count >= self.hash_threshold:
             confidence = min(1.0, hash_count / (self.hash_threshold + 2))
             return LoopDetectionResult(
@@ -146,7 +165,7 @@ class LoopDetector:
             )
         return None
 
-    def _check_similarity(self, output: str) -> Optional[LoopDetectionResult]:
+    def _check_similarity(self) -> Optional[LoopDetectionResult]:
         """Check for high Jaccard similarity with recent outputs.
 
         Note: This is called after the current output has been recorded,
@@ -154,26 +173,25 @@ class LoopDetector:
         current output itself).
         """
         # Need at least 2 entries (current + 1 previous)
-        if len(self._recent_outputs) < 2:
+        if len(self._recent_tokens) < 2:
             return None
 
-        current_tokens = set(output.lower().split())
+        current_tokens = self._recent_tokens[-1]
         if not current_tokens:
             return None
 
         max_similarity = 0.0
         similar_count = 0
         # Compare against all previous outputs (skip the last which is current)
-        previous = list(self._recent_outputs)[:-1]
+        previous = list(self._recent_tokens)[:-1]
 
-        for prev_output in previous:
-            prev_tokens = set(prev_output.lower().split())
+        for prev_tokens in previous:
             if not prev_tokens:
                 continue
 
-            intersection = current_tokens & prev_tokens
-            union = current_tokens | prev_tokens
-            similarity = len(intersection) / len(union) if union else 0.0
+            intersection = len(current_tokens & prev_tokens)
+            # |A | B| = |A| + |B| - |A & B|, without materializing the union
+            similarity = intersection / (len(current_tokens) + len(prev_tokens) - intersection)
 
             max_similarity = max(max_similarity, similarity)
             if similarity >= self.similarity_threshold:
@@ -197,47 +215,37 @@ class LoopDetector:
 
     def _check_oscillation(self) -> Optional[LoopDetectionResult]:
         """Check for oscillation between 2-3 states (A-B-A-B pattern)."""
-        hashes = list(self._output_hashes)
-        if len(hashes) < 4:
+        if len(self._output_hashes) < 4:
             return None
 
+        # A sequence has period p when it equals itself shifted by p, so each
+        # test is one C-level list comparison of int hashes
+        recent = list(self._output_hashes)[-6:]
+
         # Check for period-2 oscillation: A-B-A-B
-        recent = hashes[-6:] if len(hashes) >= 6 else hashes
-        if len(recent) >= 4:
-            period_2_match = all(
-                recent[i] == recent[i + 2]
-                for i in range(len(recent) - 2)
+        if recent[2:] == recent[:-2] and recent[-1] != recent[-2]:
+            return LoopDetectionResult(
+                is_loop=True,
+                confidence=0.9,
+                loop_type=LoopType.OSCILLATION,
+                suggestion=(
+                    "Agent is oscillating between two states (A-B-A-B pattern). "
+                    "This typically indicates conflicting instructions or tool results. "
+                    "Consider adding a tie-breaking instruction or terminating."
+                ),
             )
-            if period_2_match and recent[-1] != recent[-2]:
-                return LoopDetectionResult(
-                    is_loop=True,
-                    confidence=0.9,
-                    loop_type=LoopType.OSCILLATION,
-                    suggestion=(
-                        "Agent is oscillating between two states (A-B-A-B pattern). "
-                        "This typically indicates conflicting instructions or tool results. "
-                        "Consider adding a tie-breaking instruction or terminating."
-                    ),
-                )
 
         # Check for period-3 oscillation: A-B-C-A-B-C
-        if len(recent) >= 6:
-            period_3_match = all(
-                recent[i] == recent[i + 3]
-                for i in range(len(recent) - 3)
+        if len(recent) == 6 and recent[3:] == recent[:3] and len(set(recent[:3])) >= 2:
+            return LoopDetectionResult(
+                is_loop=True,
+                confidence=0.85,
+                loop_type=LoopType.OSCILLATION,
+                suggestion=(
+                    "Agent is oscillating between three states (A-B-C-A-B-C pattern). "
+                    "Consider simplifying the task or terminating."
+                ),
             )
-            if period_3_match:
-                unique = len(set(recent[:3]))
-                if unique >= 2:
-                    return LoopDetectionResult(
-                        is_loop=True,
-                        confidence=0.85,
-                        loop_type=LoopType.OSCILLATION,
-                        suggestion=(
-                            "Agent is oscillating between three states (A-B-C-A-B-C pattern). "
-                            "Consider simplifying the task or terminating."
-                        ),
-                    )
 
         return None
 
@@ -269,8 +277,9 @@ class LoopDetector:
 
     def reset(self) -> None:
         """Clear all detection state."""
-        self._recent_outputs.clear()
+        self._recent_tokens.clear()
         self._output_hashes.clear()
+        self._hash_counts.clear()
         self._output_lengths.clear()
 
 
@@ -311,7 +320,19 @@ class CostPerInsightTracker:
     min_iterations: int = 3
     cost_threshold: float = 0.05
     novelty_floor: float = 0.1
-    _history: list[InsightRecord] = field(default_factory=list)
+    _history: deque[InsightRecord] = field(default_factory=lambda: deque(maxlen=10))
+    # Running totals over _history, so checks read them instead of re-summing
+    _sum_cost: float = 0.0
+    _sum_novelty: float = 0.0
+    _sum_state_changes: int = 0
+    # Exact count of costed records; _sum_cost can drift off zero when they leave
+    _nonzero_costs: int = 0
+    # Records appended since the float totals were last summed exactly
+    _since_resum: int = 0
+
+    def __post_init__(self) -> None:
+        # Only the last window_size records are ever read
+        self._history = deque(maxlen=self.window_size)
 
     def record_iteration(
         self,
@@ -335,12 +356,26 @@ class CostPerInsightTracker:
             output_novelty=output_novelty,
             timestamp=time.monotonic(),
         )
-        self._history.append(record)
-
-        # Keep only the last N * 2 records to bound memory
-        max_records = self.window_size * 2
-        if len(self._history) > max_records:
-            self._history = self._history[-max_records:]
+        history = self._history
+        if len(history) == history.maxlen:
+            # append() is about to evict the oldest record; take it out of the totals
+            evicted = history[0]
+            self._sum_cost -= evicted.cost
+            self._sum_novelty -= evicted.output_novelty
+            self._sum_state_changes -= evicted.state_changed
+            self._nonzero_costs -= evicted.cost != 0
+        history.append(record)
+        self._sum_cost += cost
+        self._sum_novelty += output_novelty
+        self._sum_state_changes += state_changed
+        self._nonzero_costs += cost != 0
+
+        # Re-sum exactly once per window turnover so float drift cannot build up
+        self._since_resum += 1
+        if self._since_resum >= self.window_size:
+            self._since_resum = 0
+            self._sum_cost = math.fsum(r.cost for r in history)
+            self._sum_novelty = math.fsum(r.output_novelty for r in history)
 
     def should_terminate(self) -> tuple[bool, str]:
         """Check if the agent should be terminated due to diminishing returns.
@@ -348,33 +383,30 @@ class CostPerInsightTracker:
         Returns:
             Tuple of (should_terminate, reason).
         """
-        if len(self._history) < self.min_iterations:
+        n = len(self._history)
+        if n < self.min_iterations:
             return False, ""
 
-        window = self._history[-self.window_size:]
-
         # Check 1: No state changes in the window
-        state_changes = sum(1 for r in window if r.state_changed)
-        if state_changes == 0 and len(window) >= self.min_iterations:
-            total_cost = sum(r.cost for r in window)
+        if self._sum_state_changes == 0:
             return True, (
-                f"No state changes in last {len(window)} iterations "
-                f"(cost: ${total_cost:.4f}). Agent is not making progress."
+                f"No state changes in last {n} iterations "
+                f"(cost: ${self._sum_cost:.4f}). Agent is not making progress."
             )
 
         # Check 2: Average novelty below floor
-        avg_novelty = sum(r.output_novelty for r in window) / len(window)
-        if avg_novelty < self.novelty_floor and len(window) >= self.min_iterations:
-            total_cost = sum(r.cost for r in window)
+        avg_novelty = self._sum_novelty / n
+        if avg_novelty < self.novelty_floor:
             return True, (
                 f"Average output novelty ({avg_novelty:.2f}) below threshold "
-                f"({self.novelty_floor}) over last {len(window)} iterations "
-                f"(cost: ${total_cost:.4f}). Diminishing returns detected."
+                f"({self.novelty_floor}) over last {n} iterations "
+                f"(cost: ${self._sum_cost:.4f}). Diminishing returns detected."
             )
 
-        # Check 3: Cost increasing but insight decreasing
-        if len(window) >= 4:
-            mid = len(window) // 2
+        # Check 3: Cost increasing but insight decreasing (the one O(window) check)
+        if n >= 4:
+            window = list(self._history)
+            mid = n // 2
             first_half = window[:mid]
             second_half = window[mid:]
 
@@ -401,17 +433,16 @@ class CostPerInsightTracker:
         Returns:
             Float from 0 (wasteful) to 1 (efficient).
         """
-        if not self._history:
+        n = len(self._history)
+        if not n:
             return 1.0
 
-        window = self._history[-self.window_size:]
-        total_cost = sum(r.cost for r in window)
-        avg_novelty = sum(r.output_novelty for r in window) / len(window)
-        state_change_rate = sum(1 for r in window if r.state_changed) / len(window)
-
-        if total_cost == 0:
+        if not self._nonzero_costs:
             return 1.0
 
+        avg_novelty = self._sum_novelty / n
+        state_change_rate = self._sum_state_changes / n
+
         # Weighted combination of novelty and state change rate
         insight_score = 0.6 * avg_novelty + 0.4 * state_change_rate
         return min(1.0, insight_score)
@@ -419,36 +450,68 @@ class CostPerInsightTracker:
     def reset(self) -> None:
         """Clear tracking history."""
         self._history.clear()
+        self._sum_cost = 0.0
+        self._sum_novelty = 0.0
+        self._sum_state_changes = 0
+        self._nonzero_costs = 0
+        self._since_resum = 0
 
 
-def compute_output_novelty(current: str, previous_outputs: list[str]) -> float:
-    """Compute a novelty score for an output compared to previous outputs.
+def token_hashes(text: str) -> frozenset[int]:
+    """Hash the lowercased word tokens of an output for novelty comparison.
 
-    Uses Jaccard distance at the word level. Returns 1.0 for completely
-    novel output and 0.0 for an exact duplicate.
+    Computing this once per output lets later novelty checks reuse it
+    instead of re-tokenizing every prior output.
+    """
+    return frozenset(map(hash, text.lower().split()))
+
+
+def compute_output_novelty_hashed(
+    current: frozenset[int], previous: Collection[frozenset[int]]
+) -> float:
+    """Compute a novelty score from pre-hashed token sets.
+
+    Same semantics as :func:`compute_output_novelty`, with each output
+    already reduced by :func:`token_hashes`.
 
     Args:
-        current: The current output text.
-        previous_outputs: List of previous output texts to compare against.
+        current: Token hashes of the current output.
+        previous: Token hashes of previous outputs to compare against.
 
     Returns:
         Float from 0.0 (duplicate) to 1.0 (completely novel).
     """
-    if not previous_outputs:
+    if not previous:
         return 1.0
 
-    current_tokens = set(current.lower().split())
-    if not current_tokens:
+    if not current:
         return 0.0
 
     max_similarity = 0.0
-    for prev in previous_outputs:
-        prev_tokens = set(prev.lower().split())
-        if not prev_tokens:
+    for prev in previous:
+        if not prev:
             continue
-        intersection = current_tokens & prev_tokens
-        union = current_tokens | prev_tokens
-        similarity = len(intersection) / len(union) if union else 0.0
+        intersection = len(current & prev)
+        # |A | B| = |A| + |B| - |A & B|, without materializing the union
+        similarity = intersection / (len(current) + len(prev) - intersection)
         max_similarity = max(max_similarity, similarity)
 
     return 1.0 - max_similarity
+
+
+def compute_output_novelty(current: str, previous_outputs: Sequence[str]) -> float:
+    """Compute a novelty score for an output compared to previous outputs.
+
+    Uses Jaccard distance at the word level. Returns 1.0 for completely
+    novel output and 0.0 for an exact duplicate.
+
+    Args:
+        current: The current output text.
+        previous_outputs: Previous output texts to compare against.
+
+    Returns:
+        Float from 0.0 (duplicate) to 1.0 (completely novel).
+    """
+    return compute_output_novelty_hashed(
+        token_hashes(current), [token_hashes(prev) for prev in previous_outputs]
+    )
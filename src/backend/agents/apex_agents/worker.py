@@ -23,7 +23,7 @@ import redis.asyncio as redis
 import structlog
 
 from apex_agents.config import Settings, get_settings
-from apex_agents.executor import AgentExecutor
+from apex_agents.executor import AgentExecutor, TaskQueue
 from apex_agents.tracing import get_tracer, init_tracing, shutdown_tracing
 
 logger = structlog.get_logger()
@@ -106,6 +106,9 @@ class Worker:
             "tasks_failed": self._tasks_failed,
             "uptime_seconds": uptime_seconds,
             "active_tasks": self._executor.active_task_count if self._executor else 0,
+            "result_cache": (
+                self._executor.result_cache_stats if self._executor else {"hits": 0, "misses": 0}
+            ),
         }
 
     async def start(self) -> None:
@@ -128,7 +131,7 @@ class Worker:
             await self._connect_redis()
 
             # Initialize executor
-            self._executor = AgentExecutor(settings=self.settings)
+            self._executor = AgentExecutor(settings=self.settings, worker_id=self.worker_id)
             await self._executor.initialize()
 
             # Register signal handlers
@@ -402,6 +405,7 @@ async def run_worker(settings: Settings | None = None) -> None:
     finally:
         if worker.state != WorkerState.STOPPED:
             await worker.stop()
+        await TaskQueue.disconnect_pools()
 
 
 async def run_worker_pool(
@@ -427,3 +431,4 @@ async def run_worker_pool(
         sys.exit(1)
     finally:
         await pool.stop()
+        await TaskQueue.disconnect_pools()
@@ -46,11 +46,16 @@ import argparse
 import asyncio
 import logging
 import sys
-from typing import NoReturn
+from typing import Any, NoReturn
 
 import structlog
 
-from apex_agents.config import Settings, get_settings
+try:
+    import uvloop
+except ImportError:  # optional: faster event loop, see the "uvloop" extra
+    uvloop = None  # type: ignore[assignment, unused-ignore]
+
+from apex_agents.config import BackendConfig, LogLevel, Settings, get_settings
 from apex_agents.worker import run_worker, run_worker_pool
 
 
@@ -163,27 +168,37 @@ def apply_cli_overrides(settings: Settings, args: argparse.Namespace) -> Setting
     Returns:
         Settings with overrides applied.
     """
-    # Note: Pydantic settings are immutable by default, so we create new instances
-    # For simplicity, we modify the settings in-place here since they're mutable
+    # Settings are frozen, so collect overrides and copy the affected sections
+    updates: dict[str, Any] = {}
+
     if args.agents is not None:
-        settings.worker.num_agents = args.agents
+        updates["worker"] = settings.worker.model_copy(update={"num_agents": args.agents})
 
     if args.debug:
-        settings.debug = True
-        settings.log_level = "DEBUG"
+        updates["debug"] = True
+        updates["log_level"] = LogLevel.DEBUG
 
     if args.backend_url:
         # Parse URL and update settings
         from urllib.parse import urlparse
 
         parsed = urlparse(args.backend_url)
+        backend_overrides: dict[str, Any] = {}
         if parsed.hostname:
-            settings.backend.host = parsed.hostname
+            backend_overrides["host"] = parsed.hostname
         if parsed.port:
-            settings.backend.http_port = parsed.port
+            backend_overrides["http_port"] = parsed.port
+        if backend_overrides:
+            # Revalidate rather than copy so the parsed values are checked
+            updates["backend"] = BackendConfig.model_validate(
+                {**settings.backend.model_dump(), **backend_overrides}
+            )
 
     if args.redis_url:
-        settings.redis.url = args.redis_url
+        updates["redis"] = settings.redis.model_copy(update={"url": args.redis_url})
+
+    if updates:
+        settings = settings.model_copy(update=updates)
 
     return settings
 
@@ -261,8 +276,11 @@ def main() -> NoReturn:
     """Main entry point."""
     args = parse_args()
 
+    # libuv-backed loop when available; same semantics as asyncio.run otherwise
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
     try:
-        exit_code = asyncio.run(main_async(args))
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            exit_code = runner.run(main_async(args))
     except KeyboardInterrupt:
         exit_code = 0
 
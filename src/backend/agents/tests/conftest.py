@@ -137,6 +137,10 @@ def mock_redis():
     """Create a mock Redis client."""
     redis = AsyncMock()
     redis.brpop.return_value = None
+    # TaskQueue.pull_task batches BRPOP + RPOPs through a non-transactional pipeline
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[None])
+    redis.pipeline = MagicMock(return_value=pipe)
     redis.lpush.return_value = None
     redis.setex.return_value = None
     redis.aclose.return_value = None
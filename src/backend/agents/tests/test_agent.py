@@ -1,10 +1,15 @@
 """Tests for the Agent class."""
 
-import pytest
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
-from apex_agents.agent import Agent, AgentConfig, AgentStatus, TaskInput, TaskOutput
+
+import pytest
+from pydantic import ValidationError
+
+from apex_agents.agent import Agent, AgentConfig, AgentMetrics, AgentStatus, TaskInput, TaskOutput
 from apex_agents.llm import LLMClient, LLMResponse, LLMUsage
-from apex_agents.tools import ToolRegistry, Tool, ToolParameter
+from apex_agents.loop_detector import CostPerInsightTracker, LoopDetector, token_hashes
+from apex_agents.tools import Tool, ToolParameter, ToolRegistry
 
 
 @pytest.fixture
@@ -63,12 +68,34 @@ class TestAgent:
         assert agent.config.model == "gpt-4o-mini"
         assert agent.status == AgentStatus.IDLE
 
+    def test_clone_shares_tools_but_not_run_state(self, agent):
+        """Test a clone reuses resolved tools while keeping its own per-run state."""
+        agent.metrics.tokens_used = 42
+        agent.loop_detector.check("seen")
+
+        clone = agent.clone()
+
+        assert clone.id != agent.id
+        assert clone.available_tools is agent.available_tools
+        assert clone._tools_schema is agent._tools_schema
+        assert clone.metrics.tokens_used == 0
+        assert clone.loop_detector is not agent.loop_detector
+        assert clone.cost_tracker is not agent.cost_tracker
+        assert clone._previous_outputs is not agent._previous_outputs
+        assert clone._tool_semaphore is not agent._tool_semaphore
+
     def test_agent_available_tools(self, agent):
         """Test that agent has access to configured tools."""
         tools = agent.available_tools
         assert len(tools) == 1
         assert tools[0].name == "test_tool"
 
+    def test_agent_tools_schema_built_once(self, agent):
+        """Test that the tools schema is reused rather than rebuilt per call."""
+        schema = agent._build_tools_schema()
+        assert schema is agent._build_tools_schema()
+        assert schema[0]["name"] == "test_tool"
+
     @pytest.mark.asyncio
     async def test_agent_run_simple(self, agent, mock_llm_client):
         """Test simple agent execution without tool calls."""
@@ -166,7 +193,6 @@ class TestAgent:
 
         agent.config.max_iterations = 3
         # Disable loop detection to test pure max-iterations behavior
-        from apex_agents.loop_detector import LoopDetector, CostPerInsightTracker
         agent.loop_detector = LoopDetector(
             hash_threshold=999, similarity_threshold=1.0, length_stagnation_window=999
         )
@@ -178,6 +204,42 @@ class TestAgent:
         assert "Max iterations reached" in result.result
         assert agent.metrics.iterations == 3
 
+    @pytest.mark.asyncio
+    async def test_agent_novelty_window_is_bounded(self, agent, mock_llm_client):
+        """Test only the last NOVELTY_WINDOW outputs are kept for novelty checks."""
+        call_count = 0
+
+        async def unique_tool_response(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            return LLMResponse(
+                content=f"Step {call_count} covers topic {call_count * 7}",
+                tool_calls=[
+                    {
+                        "id": f"call_{call_count}",
+                        "function": {"name": "test_tool", "arguments": {"query": "q"}},
+                    }
+                ],
+                usage=LLMUsage(prompt_tokens=50, completion_tokens=30, total_tokens=80),
+                model="gpt-4o-mini",
+                cost=0.001,
+                finish_reason="tool_calls",
+            )
+
+        mock_llm_client.create.side_effect = unique_tool_response
+        agent.config.max_iterations = Agent.NOVELTY_WINDOW + 4
+        agent.loop_detector = LoopDetector(
+            hash_threshold=999, similarity_threshold=1.0, length_stagnation_window=999
+        )
+        agent.cost_tracker = CostPerInsightTracker(min_iterations=999)
+
+        await agent.run(TaskInput(instruction="Do something"))
+
+        assert len(agent._previous_outputs) == Agent.NOVELTY_WINDOW
+        assert agent._previous_outputs[-1] == token_hashes(
+            f"Step {call_count} covers topic {call_count * 7}"
+        )
+
     @pytest.mark.asyncio
     async def test_agent_error_handling(self, agent, mock_llm_client):
         """Test that agent handles errors gracefully."""
@@ -191,6 +253,43 @@ class TestAgent:
         assert "API error" in str(exc_info.value)
         assert agent.status == AgentStatus.ERROR
 
+    @pytest.mark.asyncio
+    async def test_execute_tools_runs_concurrently_in_order(self, agent):
+        """Test tool calls overlap, keep call order and isolate failures."""
+        running = 0
+        peak = 0
+
+        async def slow_tool(query: str) -> str:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return f"Result for: {query}"
+
+        agent.tool_registry.register(
+            Tool(
+                name="slow_tool",
+                description="A slow tool",
+                parameters=[ToolParameter("query", "string", "The query")],
+                func=slow_tool,
+            )
+        )
+        calls = [
+            {"id": "call_1", "function": {"name": "slow_tool", "arguments": {"query": "a"}}},
+            {"id": "call_2", "function": {"name": "missing_tool", "arguments": {}}},
+            {"id": "call_3", "function": {"name": "slow_tool", "arguments": {"query": "b"}}},
+        ]
+
+        results = await agent._execute_tools(calls)
+
+        assert [r["tool_call_id"] for r in results] == ["call_1", "call_2", "call_3"]
+        assert results[0]["content"] == "Result for: a"
+        assert results[1]["content"] == "Error: Tool not found: missing_tool"
+        assert results[2]["content"] == "Result for: b"
+        assert peak == 2
+        assert agent.metrics.tool_calls == 3
+
     def test_build_messages_with_context(self, agent):
         """Test message building with context."""
         task = TaskInput(
@@ -207,6 +306,27 @@ class TestAgent:
         assert "Context:" in messages[1]["content"]
         assert "key1: value1" in messages[1]["content"]
 
+    def test_build_messages_reuses_system_message(self, agent):
+        """Test the system message is shared across runs, user message is not."""
+        first = agent._build_initial_messages(TaskInput(instruction="one"))
+        second = agent._build_initial_messages(TaskInput(instruction="two"))
+
+        assert first[0] is second[0]
+        assert first is not second
+        assert second[1] == {"role": "user", "content": "two"}
+
+    def test_build_messages_without_system_prompt(self, mock_llm_client, mock_tool_registry):
+        """Test no system message is emitted for an empty system prompt."""
+        agent = Agent(
+            config=AgentConfig(name="bare", model="gpt-4o-mini"),
+            llm_client=mock_llm_client,
+            tool_registry=mock_tool_registry,
+        )
+
+        messages = agent._build_initial_messages(TaskInput(instruction="hi"))
+
+        assert messages == [{"role": "user", "content": "hi"}]
+
 
 class TestAgentConfig:
     """Tests for AgentConfig."""
@@ -219,6 +339,12 @@ class TestAgentConfig:
         assert config.tools == []
         assert config.max_iterations == 10
         assert config.temperature == 0.7
+        assert config.max_parallel_tools == 8
+
+    def test_max_parallel_tools_must_be_positive(self):
+        """Test a tool concurrency limit below one is rejected."""
+        with pytest.raises(ValidationError):
+            AgentConfig(name="test", model="gpt-4o", max_parallel_tools=0)
 
     def test_custom_values(self):
         """Test custom configuration values."""
@@ -236,6 +362,19 @@ class TestAgentConfig:
         assert len(config.tools) == 2
 
 
+class TestAgentMetrics:
+    """Tests for AgentMetrics."""
+
+    def test_duration_from_monotonic_ns(self):
+        """Test duration is derived from nanosecond counter readings."""
+        metrics = AgentMetrics(start_ns=2_000_000, end_ns=1_502_999_999)
+        assert metrics.duration_ms == 1500
+
+    def test_duration_zero_until_finished(self):
+        """Test duration is zero while the run has no end reading."""
+        assert AgentMetrics(start_ns=0).duration_ms == 0
+
+
 class TestTaskInput:
     """Tests for TaskInput."""
 
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import redis.asyncio as redis
 
 from apex_agents.bidding import (
     AgentBid,
@@ -53,6 +55,10 @@ def mock_redis():
     r = AsyncMock()
     r.rpush = AsyncMock(return_value=1)
     r.setex = AsyncMock(return_value=True)
+    # Queued writes go through a non-transactional pipeline
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    r.pipeline = MagicMock(return_value=pipe)
     r.blpop = AsyncMock(return_value=None)
     r.aclose = AsyncMock()
     return r
@@ -132,6 +138,55 @@ class TestAgentBid:
         parsed = json.loads(json_str)
         assert parsed["agent_id"] == "a1"
 
+    def test_is_frozen_and_slotted(self):
+        bid = AgentBid(
+            agent_id="a1",
+            task_id="t1",
+            estimated_cost=0.05,
+            estimated_duration=20.0,
+            confidence=0.9,
+            capabilities=["python"],
+        )
+        assert not hasattr(bid, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            bid.estimated_cost = 0.01  # type: ignore[misc]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Wire Format Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestWireFormat:
+    """Tests for the configurable CNP wire encoding."""
+
+    def test_json_bytes_roundtrip(self, sample_announcement):
+        payload = json.dumps(sample_announcement.to_dict()).encode()
+        assert TaskAnnouncement.from_bytes(payload) == sample_announcement
+
+    def test_msgpack_bid_encoding(self):
+        msgpack = pytest.importorskip("msgpack")
+        bid = AgentBid(
+            agent_id="a1",
+            task_id="t1",
+            estimated_cost=0.05,
+            estimated_duration=20.0,
+            confidence=0.9,
+            capabilities=["python"],
+        )
+        assert msgpack.unpackb(bid.to_bytes("msgpack"), raw=False) == bid.to_dict()
+
+    def test_msgpack_without_package_fails_fast(self):
+        with (
+            patch("apex_agents.bidding.msgpack", None),
+            pytest.raises(ImportError, match="msgpack"),
+        ):
+            BiddingAgent(wire_format="msgpack")
+
+    def test_unknown_wire_format_rejected(self):
+        with pytest.raises(ValueError, match="Unsupported wire format"):
+            BiddingAgent(wire_format="xml")  # type: ignore[arg-type]
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Marginal Cost Tests
@@ -235,6 +290,51 @@ class TestEvaluateTask:
         assert bid_busy is not None
         assert bid_busy.confidence < bid_idle.confidence
 
+    def test_no_capabilities_skips_required_task(self, sample_announcement):
+        """Agent without capabilities should not bid on tasks with requirements."""
+        agent = BiddingAgent(agent_id="generic", capabilities=[])
+        with patch.object(agent, "marginal_cost") as marginal_cost:
+            assert agent.evaluate_task(sample_announcement) is None
+        marginal_cost.assert_not_called()
+
+    def test_partial_match_ratio_and_capabilities(self):
+        """Bid confidence and capabilities should reflect the overlap, in agent order."""
+        agent = BiddingAgent(agent_id="partial", capabilities=["rust", "python", "go"])
+        task = TaskAnnouncement(
+            task_id="t1",
+            description="Mixed task",
+            requirements=["python", "pandas", "rust", "sql"],
+            deadline_secs=30,
+            min_bid_count=1,
+        )
+
+        bid = agent.evaluate_task(task)
+
+        assert bid is not None
+        assert bid.capabilities == ["rust", "python"]
+        assert bid.confidence == pytest.approx(0.5)
+
+    def test_batch_matches_scalar_evaluation(self, bidding_agent):
+        """evaluate_tasks should agree with evaluate_task for every input."""
+        bidding_agent.current_queue_depth = 3
+        announcements = [
+            TaskAnnouncement(
+                task_id=f"t{i}",
+                description="",
+                requirements=reqs,
+                deadline_secs=30,
+                min_bid_count=1,
+            )
+            for i, reqs in enumerate(
+                [[], ["python"], ["sql"], ["python", "pandas", "sql"], ["rust"] * 4]
+            )
+        ]
+
+        batch = bidding_agent.evaluate_tasks(announcements)
+
+        assert batch == [bidding_agent.evaluate_task(a) for a in announcements]
+        assert batch[2] is None
+
     def test_no_requirements_matches_all(self, bidding_agent):
         """Task with no requirements should accept any agent."""
         task = TaskAnnouncement(
@@ -249,6 +349,153 @@ class TestEvaluateTask:
         assert bid.confidence > 0
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Connection Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestConnection:
+    """Tests for Redis connection setup and teardown."""
+
+    @pytest.mark.asyncio
+    async def test_client_uses_bounded_blocking_pool(self, bidding_agent):
+        """The eager client should sit on a capped RESP3 pool released by close()."""
+        pool = bidding_agent._pool
+
+        assert isinstance(pool, redis.BlockingConnectionPool)
+        assert pool.max_connections == BiddingAgent.POOL_MAX_CONNECTIONS
+        assert pool.connection_kwargs["protocol"] == 3
+        assert pool.connection_kwargs["socket_keepalive"] is True
+        assert bidding_agent._redis.connection_pool is pool
+
+        with patch.object(pool, "disconnect", AsyncMock()) as disconnect:
+            await bidding_agent.close()
+
+        disconnect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_connect_pings_server(self, bidding_agent, mock_redis):
+        """connect() is optional and only verifies the server is reachable."""
+        bidding_agent._redis = mock_redis
+
+        await bidding_agent.connect()
+
+        mock_redis.ping.assert_awaited_once()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Announcement Listener Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestListenForAnnouncements:
+    """Tests for the announcement subscription loop."""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_messages_and_skips_idle_polls(
+        self, bidding_agent, mock_redis, sample_announcement
+    ):
+        """Idle polls and malformed payloads are skipped; announcements dispatched."""
+        bidding_agent._redis = mock_redis
+        received = []
+
+        async def callback(announcement):
+            received.append(announcement)
+            bidding_agent._shutdown_event.set()
+
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.unsubscribe = AsyncMock()
+        pubsub.aclose = AsyncMock()
+        pubsub.get_message = AsyncMock(side_effect=[
+            None,
+            {"type": "message", "data": b"not json"},
+            None,
+            {"type": "message", "data": json.dumps(sample_announcement.to_dict()).encode()},
+            None,
+        ])
+        mock_redis.pubsub = MagicMock(return_value=pubsub)
+
+        await bidding_agent.listen_for_announcements(callback=callback)
+
+        mock_redis.pubsub.assert_called_once_with(ignore_subscribe_messages=True)
+        assert [a.task_id for a in received] == ["task-001"]
+        assert pubsub.get_message.await_count == 5
+        pubsub.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_buffered_burst_is_bid_as_batch(self, bidding_agent, mock_redis):
+        """Announcements already buffered should be evaluated in one batch."""
+        bidding_agent._redis = mock_redis
+        burst = [
+            TaskAnnouncement(
+                task_id=f"task-{i}",
+                description="",
+                requirements=reqs,
+                deadline_secs=30,
+                min_bid_count=1,
+            )
+            for i, reqs in enumerate([["python"], ["javascript"], ["rust", "go"]])
+        ]
+
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.unsubscribe = AsyncMock()
+        pubsub.aclose = AsyncMock()
+        pubsub.get_message = AsyncMock(side_effect=[
+            *({"type": "message", "data": json.dumps(a.to_dict()).encode()} for a in burst),
+            None,
+        ])
+        mock_redis.pubsub = MagicMock(return_value=pubsub)
+
+        original = bidding_agent.evaluate_tasks
+
+        def evaluate_and_stop(announcements):
+            bidding_agent._shutdown_event.set()
+            return original(announcements)
+
+        with patch.object(bidding_agent, "evaluate_tasks", side_effect=evaluate_and_stop) as batch:
+            await bidding_agent.listen_for_announcements()
+        await bidding_agent.flush()
+
+        batch.assert_called_once()
+        pipe = mock_redis.pipeline.return_value
+        keys = [c.args[0] for c in pipe.rpush.call_args_list]
+        assert keys == ["apex:cnp:bids:task-0", "apex:cnp:bids:task-2"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_listener_still_closes_pubsub(self, bidding_agent, mock_redis):
+        """Cancelling the listener should not leak the pubsub connection."""
+        bidding_agent._redis = mock_redis
+        closed = asyncio.Event()
+
+        async def slow_aclose():
+            await asyncio.sleep(0.01)
+            closed.set()
+
+        async def get_message(**_kwargs):
+            await asyncio.sleep(3600)
+
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.unsubscribe = AsyncMock()
+        pubsub.aclose = AsyncMock(side_effect=slow_aclose)
+        pubsub.get_message = AsyncMock(side_effect=get_message)
+        mock_redis.pubsub = MagicMock(return_value=pubsub)
+
+        listener = asyncio.create_task(bidding_agent.listen_for_announcements())
+        await asyncio.sleep(0)
+        listener.cancel()
+        await asyncio.sleep(0)
+        # A second cancel lands while cleanup is in flight
+        listener.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await listener
+        await asyncio.wait_for(closed.wait(), timeout=1.0)
+        pubsub.aclose.assert_awaited_once()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Bid Submission Tests
 # ─────────────────────────────────────────────────────────────────────────────
@@ -272,9 +519,12 @@ class TestSubmitBid:
         )
 
         await bidding_agent.submit_bid(bid)
+        await bidding_agent.flush()
 
-        mock_redis.rpush.assert_called_once()
-        call_args = mock_redis.rpush.call_args
+        pipe = mock_redis.pipeline.return_value
+        pipe.rpush.assert_called_once()
+        pipe.execute.assert_awaited_once()
+        call_args = pipe.rpush.call_args
         assert call_args[0][0] == "apex:cnp:bids:task-001"
 
         # Verify the payload is valid JSON with correct fields
@@ -283,6 +533,60 @@ class TestSubmitBid:
         assert payload["task_id"] == "task-001"
         assert payload["estimated_cost"] == 0.02
 
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_one_pipeline(self, bidding_agent, mock_redis):
+        """Bids and heartbeats queued together should flush in one round-trip."""
+        bidding_agent._redis = mock_redis
+
+        for i in range(5):
+            await bidding_agent.submit_bid(
+                AgentBid(
+                    agent_id=bidding_agent.agent_id,
+                    task_id=f"task-{i}",
+                    estimated_cost=0.02,
+                    estimated_duration=20.0,
+                    confidence=0.85,
+                    capabilities=["python"],
+                )
+            )
+        await bidding_agent.send_heartbeat("task-0")
+        await bidding_agent.flush()
+
+        pipe = mock_redis.pipeline.return_value
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.rpush.call_count == 5
+        assert pipe.setex.call_count == 1
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_flush_survives_pipeline_error(self, bidding_agent, mock_redis):
+        """A failed pipeline should be logged and not block later flushes."""
+        bidding_agent._redis = mock_redis
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.side_effect = [ConnectionError("down"), []]
+
+        await bidding_agent.send_heartbeat("task-001")
+        assert await bidding_agent.flush() == 1
+        await bidding_agent.send_heartbeat("task-001")
+        assert await bidding_agent.flush() == 0
+
+        assert pipe.execute.await_count == 2
+        assert bidding_agent.dropped_writes == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_replaces_cancelled_flusher(self, bidding_agent, mock_redis):
+        """Writes queued behind a cancelled flusher should still be sent by flush()."""
+        bidding_agent._redis = mock_redis
+        pipe = mock_redis.pipeline.return_value
+
+        await bidding_agent.send_heartbeat("task-001")
+        bidding_agent._flusher.cancel()
+        await asyncio.wait_for(bidding_agent.flush(), timeout=1.0)
+
+        pipe.execute.assert_awaited_once()
+        pipe.setex.assert_called_once()
+        assert bidding_agent.dropped_writes == 0
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Heartbeat Tests
@@ -298,10 +602,12 @@ class TestHeartbeat:
         bidding_agent._redis = mock_redis
 
         await bidding_agent.send_heartbeat("task-001")
+        await bidding_agent.flush()
 
-        mock_redis.setex.assert_called_once()
-        call_args = mock_redis.setex.call_args
-        assert call_args[0][0] == "apex:cnp:heartbeat:task-001"
+        pipe = mock_redis.pipeline.return_value
+        pipe.setex.assert_called_once()
+        call_args = pipe.setex.call_args
+        assert call_args[0][0] == b"apex:cnp:heartbeat:task-001"
         assert call_args[0][1] == bidding_agent.heartbeat_ttl
 
         # Payload should contain agent_id and task_id
@@ -310,16 +616,37 @@ class TestHeartbeat:
         assert payload["task_id"] == "task-001"
         assert "timestamp" in payload
 
+    @pytest.mark.asyncio
+    async def test_heartbeat_payload_reuses_encoded_prefix(self, bidding_agent, mock_redis):
+        """Repeated heartbeats should only differ in their timestamp."""
+        bidding_agent._redis = mock_redis
+
+        with patch("apex_agents.bidding.time.time", side_effect=[100.5, 101.25]):
+            await bidding_agent.send_heartbeat('task-"1"')
+            await bidding_agent.send_heartbeat('task-"1"')
+        await bidding_agent.flush()
+
+        pipe = mock_redis.pipeline.return_value
+        first, second = (json.loads(c.args[2]) for c in pipe.setex.call_args_list)
+        assert first == {
+            "agent_id": bidding_agent.agent_id,
+            "task_id": 'task-"1"',
+            "timestamp": 100.5,
+        }
+        assert second["timestamp"] == 101.25
+        # Only tasks activated by an award keep their encoded prefix
+        assert bidding_agent._heartbeat_prefixes == {}
+
     @pytest.mark.asyncio
     async def test_complete_task_stops_tracking(self, bidding_agent):
         """Completing a task should remove it from active tracking."""
-        bidding_agent._active_tasks.add("task-001")
+        bidding_agent._active_tasks["task-001"] = b"apex:cnp:heartbeat:task-001"
         bidding_agent._current_queue_depth = 1
 
-        # Create a mock heartbeat task
+        # Create a mock heartbeat loop
         mock_task = AsyncMock()
         mock_task.cancel = MagicMock()
-        bidding_agent._heartbeat_tasks["task-001"] = mock_task
+        bidding_agent._heartbeat_task = mock_task
 
         bidding_agent.complete_task("task-001")
 
@@ -350,12 +677,41 @@ class TestHandleAward:
 
         await bidding_agent.handle_award(award)
 
-        assert "task-001" in bidding_agent._active_tasks
+        assert bidding_agent._active_tasks["task-001"] == b"apex:cnp:heartbeat:task-001"
         assert bidding_agent._current_queue_depth == 1
-        assert "task-001" in bidding_agent._heartbeat_tasks
+        assert bidding_agent._heartbeat_task is not None
+        assert "task-001" in bidding_agent._heartbeat_prefixes
 
         # Cleanup
         bidding_agent.complete_task("task-001")
+        assert bidding_agent._heartbeat_prefixes == {}
+
+    @pytest.mark.asyncio
+    async def test_awards_share_one_heartbeat_loop(self, bidding_agent, mock_redis):
+        """Concurrent awards should share a loop that stops with the last task."""
+        bidding_agent._redis = mock_redis
+
+        for task_id in ("task-001", "task-002"):
+            await bidding_agent.handle_award(
+                AwardDecision(task_id=task_id, winning_bid={}, runner_up=None, total_bids=1)
+            )
+        loop_task = bidding_agent._heartbeat_task
+
+        # Let the first tick queue heartbeats for both tasks
+        await asyncio.sleep(0)
+        await bidding_agent.flush()
+        pipe = mock_redis.pipeline.return_value
+        keys = {c.args[0] for c in pipe.setex.call_args_list}
+        assert keys == {b"apex:cnp:heartbeat:task-001", b"apex:cnp:heartbeat:task-002"}
+        pipe.execute.assert_awaited_once()
+
+        bidding_agent.complete_task("task-001")
+        assert bidding_agent._heartbeat_task is loop_task
+
+        bidding_agent.complete_task("task-002")
+        assert bidding_agent._heartbeat_task is None
+        await asyncio.sleep(0)
+        assert loop_task.done()
 
     @pytest.mark.asyncio
     async def test_wait_for_award_returns_none_on_timeout(self, bidding_agent, mock_redis):
@@ -366,6 +722,26 @@ class TestHandleAward:
         result = await bidding_agent.wait_for_award(timeout=1.0)
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_wait_for_award_parses_bytes_payload(self, bidding_agent, mock_redis):
+        """Award payloads arrive as raw bytes and should decode directly."""
+        bidding_agent._redis = mock_redis
+        mock_redis.blpop.return_value = (
+            b"apex:cnp:awards:agent-test-1",
+            json.dumps({
+                "task_id": "task-001",
+                "winning_bid": {"bid": {"agent_id": "agent-test-1"}},
+                "total_bids": 2,
+            }).encode(),
+        )
+
+        result = await bidding_agent.wait_for_award(timeout=1.0)
+
+        mock_redis.blpop.assert_awaited_once_with(b"apex:cnp:awards:agent-test-1", timeout=1)
+        assert result is not None
+        assert result.task_id == "task-001"
+        assert result.total_bids == 2
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # AwardDecision Tests
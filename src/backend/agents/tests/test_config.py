@@ -1,11 +1,15 @@
 """Tests for configuration management."""
 
+import json
 import os
+import subprocess
+import sys
 from unittest.mock import patch
 
 import pytest
 from pydantic import ValidationError
 
+import apex_agents.config as config_module
 from apex_agents.config import (
     BackendConfig,
     DatabaseConfig,
@@ -18,7 +22,27 @@ from apex_agents.config import (
     WorkerConfig,
     get_settings,
     reload_settings,
+    settings_to_json,
 )
+from apex_agents.routing import DEFAULT_CASCADE
+
+
+class TestDeferredBuild:
+    """Tests for import-time cost of the settings models."""
+
+    def test_import_does_not_build_validators(self):
+        """Test validators are only built when a model is first constructed."""
+        code = (
+            "import apex_agents.config as c\n"
+            "models = [c.BackendConfig, c.RedisConfig, c.DatabaseConfig, c.LLMConfig,\n"
+            "          c.TracingConfig, c.WorkerConfig, c.Settings]\n"
+            "print(sorted({type(m.__pydantic_validator__).__name__ for m in models}))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert out.strip() == "['MockValSer']"
 
 
 class TestEnvironment:
@@ -67,6 +91,21 @@ class TestBackendConfig:
 
         assert config.grpc_address == "grpc.example.com:50052"
 
+    def test_addresses_follow_model_copy(self):
+        """Test derived addresses reflect fields updated through model_copy."""
+        config = BackendConfig().model_copy(update={"host": "other.host", "grpc_port": 1})
+
+        assert config.http_base_url == "http://other.host:8080"
+        assert config.grpc_address == "other.host:1"
+
+    def test_frozen(self):
+        """Test derived addresses cannot go stale through field mutation."""
+        config = BackendConfig()
+
+        with pytest.raises(ValidationError):
+            config.host = "other.host"  # type: ignore[misc]
+        assert config.http_base_url == "http://localhost:8080"
+
     @patch.dict(os.environ, {"APEX_BACKEND_HOST": "custom.host", "APEX_BACKEND_HTTP_PORT": "3000"})
     def test_env_override(self):
         """Test environment variable override."""
@@ -131,16 +170,22 @@ class TestLLMConfig:
 
     @patch.dict(os.environ, {}, clear=True)
     def test_missing_api_keys(self):
-        """Test validation error when no API keys provided."""
+        """Test ensure_api_keys raises when no API keys provided."""
         # Clear any existing env vars that might have keys
         for key in list(os.environ.keys()):
             if "APEX_LLM" in key:
                 del os.environ[key]
 
-        with pytest.raises(ValidationError) as exc_info:
-            LLMConfig()
+        # Construction no longer checks keys; the deployment check does
+        config = LLMConfig()
+
+        with pytest.raises(ValueError, match="API key must be configured"):
+            config.ensure_api_keys()
 
-        assert "API key must be configured" in str(exc_info.value)
+    @patch.dict(os.environ, {"APEX_LLM_ANTHROPIC_API_KEY": "sk-ant-test"})
+    def test_ensure_api_keys_with_one_key(self):
+        """Test ensure_api_keys accepts either provider key."""
+        LLMConfig(openai_api_key=None).ensure_api_keys()
 
 
 class TestTracingConfig:
@@ -238,6 +283,144 @@ class TestSettings:
         assert settings.debug is True
         assert settings.log_level == LogLevel.ERROR
 
+    @patch.dict(os.environ, {"APEX_LLM_OPENAI_API_KEY": "sk-test"})
+    def test_frozen(self):
+        """Test settings and their sections reject mutation and unknown fields."""
+        settings = Settings()
+
+        with pytest.raises(ValidationError):
+            settings.debug = True  # type: ignore[misc]
+        with pytest.raises(ValidationError):
+            settings.worker.num_agents = 2  # type: ignore[misc]
+        with pytest.raises(ValidationError):
+            WorkerConfig(unknown_field=1)  # type: ignore[call-arg]
+
+    @patch.dict(os.environ, {"APEX_LLM_OPENAI_API_KEY": "sk-test"})
+    def test_model_copy_overrides_section(self):
+        """Test model_copy is the way to derive overridden settings."""
+        settings = Settings()
+
+        copied = settings.model_copy(
+            update={"worker": settings.worker.model_copy(update={"num_agents": 2})}
+        )
+
+        assert copied.worker.num_agents == 2
+        assert settings.worker.num_agents == 5
+
+    @patch.dict(os.environ, {})
+    def test_sections_built_on_first_access(self):
+        """Test sub-configs are only loaded (and validated) when touched."""
+        os.environ.pop("APEX_LLM_OPENAI_API_KEY", None)
+        settings = Settings()
+
+        assert "llm" not in vars(settings)
+        assert settings.worker is settings.worker
+        assert "llm" not in vars(settings)
+
+    @patch.dict(os.environ, {"APEX_REDIS_POOL_SIZE": "3"})
+    def test_unconfigured_sections_share_defaults(self):
+        """Test sections with no env vars reuse one default instance."""
+        first, second = Settings(), Settings()
+
+        assert first.database is second.database
+        assert first.database == DatabaseConfig()
+        assert first.redis is not second.redis
+        assert first.redis.pool_size == 3
+
+    def test_mutable_default_sections_are_not_shared(self):
+        """Test mutating one Settings' routing leaves fresh Settings unaffected."""
+        first = Settings()
+        first.routing.cascade.append("my-model")
+
+        assert Settings().routing.cascade == list(DEFAULT_CASCADE)
+        assert reload_settings().routing is not first.routing
+
+    @patch.dict(os.environ, {"APEX_LLM_OPENAI_API_KEY": "sk-test", "APEX_REDIS_POOL_SIZE": "3"})
+    def test_sections_read_one_env_snapshot(self):
+        """Test all sections come from the environment as it was at load."""
+        with patch.object(
+            config_module, "_apex_env", wraps=config_module._apex_env
+        ) as snapshot:
+            settings = Settings()
+            with patch.dict(os.environ, {"APEX_REDIS_POOL_SIZE": "9"}):
+                sections = [settings.backend, settings.redis, settings.llm, settings.worker]
+
+        snapshot.assert_called_once()
+        assert sections[1].pool_size == 3
+
+    @patch.dict(
+        os.environ,
+        {
+            "APEX_LLM_OPENAI_API_KEY": "sk-test",
+            "APEX_TRACING_OTLP_ENDPOINT": "http://collector:4317",
+            "APEX_BACKEND_HOST": "collector",
+        },
+    )
+    def test_short_env_values_are_interned(self):
+        """Test loaded string values share storage with other loads."""
+        first = Settings()
+        second = Settings()
+
+        assert first.tracing.otlp_endpoint is second.tracing.otlp_endpoint
+        assert first.backend.host is sys.intern("collector")
+        assert first.llm.openai_api_key is not sys.intern("sk-test")
+
+    @patch.dict(
+        os.environ,
+        {"APEX_ROUTING__ENABLED": "true", "APEX_ROUTING__CASCADE": '["gpt-4o-mini", "gpt-4o"]'},
+    )
+    def test_routing_section_from_env(self):
+        """Test routing is a lazy section read from APEX_ROUTING__* variables."""
+        settings = Settings()
+
+        assert "routing" not in settings.model_dump()
+        assert settings.routing.enabled is True
+        assert settings.routing.cascade == ["gpt-4o-mini", "gpt-4o"]
+
+    @patch.dict(
+        os.environ,
+        {
+            "APEX_BACKEND__HOST": "nested.host",
+            "APEX_BACKEND_HOST": "flat.host",
+            "APEX_WORKER__NUM_AGENTS": "7",
+            "APEX_REDIS_POOL_SIZE": "4",
+        },
+    )
+    def test_nested_env_names(self):
+        """Test sections read APEX_<SECTION>__<FIELD> names, ahead of the flat form."""
+        settings = Settings()
+
+        assert settings.backend.host == "nested.host"
+        assert settings.worker.num_agents == 7
+        assert settings.redis.pool_size == 4
+        constructed = config_module._construct_settings(config_module._apex_env())
+        assert constructed.backend.host == "nested.host"
+
+    def test_sections_as_keyword_arguments(self):
+        """Test sections passed to the constructor replace the env-derived ones."""
+        backend = BackendConfig(host="given.host")
+
+        settings = Settings(backend=backend, worker={"num_agents": 2}, debug=True)
+
+        assert settings.backend is backend
+        assert settings.worker.num_agents == 2
+        assert settings.debug is True
+        with pytest.raises(ValidationError):
+            Settings(worker={"num_agents": 0})
+
+    def test_complex_env_values_fall_back_to_json(self):
+        """Test JSON that orjson rejects is still decoded."""
+        assert config_module._decode_complex('["a", "b"]') == ["a", "b"]
+        assert config_module._decode_complex("[18446744073709551616]") == [2**64]
+
+    @patch.dict(os.environ, {"APEX_ROUTING__CONFIDENCE_THRESHOLD": "1.5"})
+    def test_routing_section_is_validated(self):
+        """Test routing constraints are enforced when the section is built."""
+        settings = Settings()
+
+        with pytest.raises(ValidationError):
+            _ = settings.routing
+
     @patch.dict(os.environ, {"APEX_LLM_OPENAI_API_KEY": "sk-test"})
     def test_is_production(self):
         """Test is_production helper."""
@@ -247,6 +430,10 @@ class TestSettings:
         settings = Settings(environment=Environment.DEVELOPMENT)
         assert settings.is_production() is False
 
+        copied = settings.model_copy(update={"environment": Environment.PRODUCTION})
+        assert copied.is_production() is True
+        assert copied.is_development() is False
+
     @patch.dict(os.environ, {"APEX_LLM_OPENAI_API_KEY": "sk-test"})
     def test_is_development(self):
         """Test is_development helper."""
@@ -268,6 +455,15 @@ class TestSettings:
         settings = Settings()
         assert settings.log_level == LogLevel.WARNING
 
+    def test_enum_fields_accept_members_and_reject_unknown_names(self):
+        """Test enum members pass through and unknown names still fail validation."""
+        settings = Settings(environment=Environment.STAGING, log_level="Error")
+        assert settings.environment is Environment.STAGING
+        assert settings.log_level is LogLevel.ERROR
+
+        with pytest.raises(ValidationError):
+            Settings(log_level="verbose")
+
 
 class TestGetSettings:
     """Tests for get_settings function."""
@@ -291,3 +487,142 @@ class TestGetSettings:
 
         # Should be different instances after reload
         assert settings1 is not settings2
+        assert get_settings() is settings2
+
+    @patch.dict(os.environ, {"APEX_LLM_OPENAI_API_KEY": "sk-test"})
+    def test_reload_picks_up_env_changes(self):
+        """Test that reload_settings re-reads the environment."""
+        reload_settings()
+        with patch.dict(os.environ, {"APEX_DEBUG": "true"}):
+            assert get_settings().debug is False
+            assert reload_settings().debug is True
+
+    @patch.dict(
+        os.environ,
+        {
+            "APEX_LLM_OPENAI_API_KEY": "sk-test",
+            "APEX_ENVIRONMENT": "PRODUCTION",
+            "APEX_DEBUG": "true",
+            "APEX_WORKER_NUM_AGENTS": "7",
+            "APEX_BACKEND_TIMEOUT_SECONDS": "2.5",
+            "APEX_ROUTING__ENABLED": "1",
+            "APEX_ROUTING__CASCADE": '["gpt-4o-mini", "gpt-4o"]',
+        },
+    )
+    def test_reload_without_validation_matches_validated(self):
+        """Test the model_construct reload coerces env values like validation does."""
+        validated = reload_settings()
+        constructed = reload_settings(validate=False)
+
+        assert constructed is not validated
+        assert get_settings() is constructed
+        assert constructed.model_dump() == validated.model_dump()
+        for section in ("backend", "redis", "database", "llm", "tracing", "worker", "routing"):
+            assert getattr(constructed, section) == getattr(validated, section)
+        assert constructed.worker.num_agents == 7
+        assert constructed.environment is Environment.PRODUCTION
+        assert constructed.is_production() is True
+        assert constructed.is_development() is False
+
+    @patch.dict(os.environ, {"APEX_WORKER_NUM_AGENTS": "3", "APEX_REDIS_POOL_SIZE": "4"})
+    def test_reload_without_validation_reuses_type_adapters(self):
+        """Test env coercion builds each field type's TypeAdapter only once."""
+        reload_settings(validate=False)
+        misses = config_module._adapter.cache_info().misses
+
+        reload_settings(validate=False)
+
+        assert config_module._adapter.cache_info().misses == misses
+
+    @patch.dict(os.environ, {"APEX_WORKER_NUM_AGENTS": "1000"})
+    def test_reload_without_validation_skips_validators(self):
+        """Test validate=False bypasses field constraints."""
+        os.environ.pop("APEX_LLM_OPENAI_API_KEY", None)
+
+        settings = reload_settings(validate=False)
+
+        assert settings.worker.num_agents == 1000
+        assert settings.llm.openai_api_key is None
+
+
+class TestSettingsToJson:
+    """Tests for settings_to_json."""
+
+    @patch.dict(
+        os.environ,
+        {
+            "APEX_LLM_OPENAI_API_KEY": "sk-secret",
+            "APEX_DATABASE_URL": "postgresql://u:pw@db/apex",
+            "APEX_WORKER_NUM_AGENTS": "4",
+        },
+    )
+    def test_includes_sections_without_secrets(self):
+        """Test every section is serialized and credentials are left out."""
+        payload = settings_to_json(Settings())
+        data = json.loads(payload)
+
+        assert data["environment"] == "development"
+        assert data["worker"]["num_agents"] == 4
+        assert data["backend"]["http_port"] == 8080
+        assert data["llm"]["default_model"] == "gpt-4o-mini"
+        assert "openai_api_key" not in data["llm"]
+        assert "url" not in data["database"]
+        assert b"sk-secret" not in payload
+        assert b"pw@" not in payload
+
+
+class TestSettingsCache:
+    """Tests for the validated-environment markers behind get_settings."""
+
+    def _load(self, cache_dir, **env):
+        """Load settings from scratch with the marker cache enabled."""
+        env = {"APEX_SETTINGS_CACHE_DIR": str(cache_dir), **env}
+        with patch.dict(os.environ, env), patch.object(config_module, "_SETTINGS", None):
+            return get_settings()
+
+    def test_cache_disabled_by_default(self, tmp_path):
+        """Test nothing is written unless APEX_SETTINGS_CACHE_DIR is set."""
+        with patch.object(config_module, "_SETTINGS", None):
+            get_settings()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_warm_start_skips_validation(self, tmp_path):
+        """Test a previously validated environment is rebuilt with model_construct."""
+        cold = self._load(tmp_path, APEX_WORKER_NUM_AGENTS="7")
+        assert len(list(tmp_path.iterdir())) == 1
+
+        with patch.object(
+            config_module, "_construct_settings", wraps=config_module._construct_settings
+        ) as construct:
+            warm = self._load(tmp_path, APEX_WORKER_NUM_AGENTS="7")
+
+        construct.assert_called_once()
+        assert warm.worker == cold.worker
+        assert warm.llm == cold.llm
+
+    def test_marker_holds_no_values(self, tmp_path):
+        """Test only a digest reaches the disk, not keys or values."""
+        self._load(tmp_path)
+
+        (marker,) = tmp_path.iterdir()
+        assert marker.stat().st_size == 0
+        assert "sk-" not in marker.name
+
+    def test_changed_environment_revalidates(self, tmp_path):
+        """Test an environment that was never validated is not trusted."""
+        self._load(tmp_path, APEX_WORKER_NUM_AGENTS="7")
+
+        with pytest.raises(ValidationError):
+            self._load(tmp_path, APEX_WORKER_NUM_AGENTS="1000")
+
+        assert len(list(tmp_path.iterdir())) == 1
+
+    def test_unwritable_cache_dir_is_ignored(self, tmp_path):
+        """Test a cache dir that cannot be created does not break loading."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+
+        settings = self._load(blocker / "cache")
+
+        assert settings.worker.num_agents == 5
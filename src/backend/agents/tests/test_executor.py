@@ -7,8 +7,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from apex_agents.agent import AgentConfig
-from apex_agents.config import Settings
+from apex_agents.agent import Agent, AgentConfig, TaskOutput
+from apex_agents.config import LLMConfig, Settings
 from apex_agents.executor import (
     AgentExecutor,
     BackendClient,
@@ -117,6 +117,12 @@ class TestQueuedTask:
         assert task.agent_config is not None
         assert task.agent_config.name == "custom-agent"
 
+    def test_to_json_round_trip(self, queued_task):
+        """Test to_json output parses back into an equal task."""
+        queued_task.agent_config = AgentConfig(name="custom-agent", model="gpt-4o")
+
+        assert QueuedTask.from_json(json.loads(json.dumps(queued_task.to_json()))) == queued_task
+
 
 class TestTaskResult:
     """Tests for TaskResult."""
@@ -159,6 +165,13 @@ class TestTaskStatus:
         assert TaskStatus.FAILED.value == "failed"
         assert TaskStatus.CANCELLED.value == "cancelled"
 
+    @pytest.mark.parametrize("status", list(TaskStatus))
+    def test_result_json_status_is_plain_value(self, status):
+        """Test serialized results carry the status as its plain string value."""
+        json_data = TaskResult(task_id="task-1", status=status).to_json()
+        assert json_data["status"] == status.value
+        assert type(json_data["status"]) is str
+
 
 class TestBackendClient:
     """Tests for BackendClient."""
@@ -192,6 +205,21 @@ class TestBackendClient:
             result = await backend_client.health_check()
             assert result is False
 
+    @pytest.mark.asyncio
+    async def test_report_task_results_reports_each(self, backend_client, task_result):
+        """Test a batch report posts every result, tolerating individual failures."""
+        other = TaskResult(task_id="task-456", status=TaskStatus.FAILED, error="boom")
+        with patch.object(
+            backend_client,
+            "_request",
+            new_callable=AsyncMock,
+            side_effect=[{}, Exception("Connection refused")],
+        ) as mock_request:
+            await backend_client.report_task_results([task_result, other])
+
+        paths = sorted(call.args[1] for call in mock_request.call_args_list)
+        assert paths == ["/api/v1/tasks/task-123/complete", "/api/v1/tasks/task-456/complete"]
+
     @pytest.mark.asyncio
     async def test_report_task_result(self, backend_client, task_result):
         """Test reporting task result."""
@@ -248,7 +276,7 @@ class TestTaskQueue:
         return TaskQueue(mock_settings)
 
     @pytest.mark.asyncio
-    async def test_pull_task_success(self, task_queue):
+    async def test_pull_task_success(self, task_queue, mock_redis):
         """Test pulling a task from queue."""
         task_data = {
             "id": "task-123",
@@ -256,8 +284,7 @@ class TestTaskQueue:
             "instruction": "Do something",
         }
 
-        mock_redis = AsyncMock()
-        mock_redis.brpop.return_value = ("queue-key", json.dumps(task_data))
+        mock_redis.pipeline.return_value.execute.return_value = [json.dumps(task_data)]
         task_queue._redis = mock_redis
 
         task = await task_queue.pull_task(timeout=1.0)
@@ -267,16 +294,180 @@ class TestTaskQueue:
         assert task.name == "test-task"
 
     @pytest.mark.asyncio
-    async def test_pull_task_empty(self, task_queue):
+    async def test_pull_task_does_not_prefetch_by_default(self, task_queue, mock_redis):
+        """Test a serial consumer pulls one task at a time, leaving the rest queued."""
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.return_value = [json.dumps({"id": "t1", "name": "a"})]
+        task_queue._redis = mock_redis
+
+        await task_queue.pull_task(timeout=1.0)
+
+        assert task_queue.prefetch_count == 1
+        pipe.blmove.assert_called_once()
+        pipe.lmove.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_pull_task_decodes_bytes(self, task_queue, mock_redis):
+        """Test raw bytes payloads from a non-decoding connection are parsed."""
+        mock_redis.pipeline.return_value.execute.return_value = [
+            b'{"id": "task-123", "name": "test-task"}',
+        ]
+        task_queue._redis = mock_redis
+
+        task = await task_queue.pull_task(timeout=1.0)
+
+        assert task.id == "task-123"
+
+    @pytest.mark.asyncio
+    async def test_pull_task_decodes_large_payload_off_loop(self, task_queue, mock_redis):
+        """Test only payloads over the threshold are decoded in a worker thread."""
+        task_queue.prefetch_count = 2
+        large = json.dumps({"id": "big", "name": "b", "context": {"blob": "x" * 100}})
+        small = json.dumps({"id": "small", "name": "s"})
+        mock_redis.pipeline.return_value.execute.return_value = [large, small]
+        task_queue._redis = mock_redis
+        task_queue.LARGE_PAYLOAD_BYTES = len(small)
+
+        with patch("apex_agents.executor.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            first = await task_queue.pull_task(timeout=1.0)
+            second = await task_queue.pull_task(timeout=1.0)
+
+        assert (first.id, second.id) == ("big", "small")
+        to_thread.assert_called_once()
+        assert to_thread.call_args.args[1] == large
+
+    @pytest.fixture
+    def msgpack_settings(self, mock_settings):
+        """Create settings selecting the msgpack wire format."""
+        return mock_settings.model_copy(
+            update={"redis": mock_settings.redis.model_copy(update={"wire_format": "msgpack"})}
+        )
+
+    @pytest.mark.asyncio
+    async def test_msgpack_wire_format_round_trip(self, msgpack_settings, mock_redis, task_result):
+        """Test msgpack queues decode pulled tasks and encode pushed results as msgpack."""
+        msgpack = pytest.importorskip("msgpack")
+        task_queue = TaskQueue(msgpack_settings)
+        mock_redis.pipeline.return_value.execute.return_value = [
+            msgpack.packb({"id": "task-123", "name": "test-task"}, use_bin_type=True),
+        ]
+        task_queue._redis = mock_redis
+
+        task = await task_queue.pull_task(timeout=1.0)
+        await task_queue.push_results([task_result])
+
+        assert task.id == "task-123"
+        payload = mock_redis.lpush.call_args.args[1]
+        assert msgpack.unpackb(payload, raw=False) == task_result.to_json()
+
+    def test_msgpack_without_package_fails_fast(self, msgpack_settings):
+        """Test selecting msgpack without the package fails at construction."""
+        with (
+            patch("apex_agents.executor.msgpack", None),
+            pytest.raises(ImportError, match="msgpack"),
+        ):
+            TaskQueue(msgpack_settings)
+
+    @pytest.mark.asyncio
+    async def test_pull_task_empty(self, task_queue, mock_redis):
         """Test pulling from empty queue."""
-        mock_redis = AsyncMock()
-        mock_redis.brpop.return_value = None
         task_queue._redis = mock_redis
 
         task = await task_queue.pull_task(timeout=1.0)
 
         assert task is None
 
+    @pytest.mark.asyncio
+    async def test_pull_task_batches_one_round_trip(self, task_queue, mock_redis):
+        """Test one pipeline pulls a batch that later calls serve from the buffer."""
+        task_queue.prefetch_count = 3
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.return_value = [
+            json.dumps({"id": "t1", "name": "a", "instruction": "x"}),
+            json.dumps({"id": "t2", "name": "b", "instruction": "y"}),
+            None,
+        ]
+        task_queue._redis = mock_redis
+
+        first = await task_queue.pull_task(timeout=1.0)
+        second = await task_queue.pull_task(timeout=1.0)
+
+        assert (first.id, second.id) == ("t1", "t2")
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        key, processing_key = task_queue.settings.redis.task_queue_key, task_queue.processing_key
+        pipe.blmove.assert_called_once_with(key, processing_key, 1, "RIGHT", "LEFT")
+        assert pipe.lmove.call_count == 2
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_pull_task_skips_malformed_payload(self, task_queue, mock_redis):
+        """Test a bad payload is dropped from the in-flight list without losing the batch."""
+        task_queue.prefetch_count = 2
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.return_value = [
+            "not json",
+            json.dumps({"id": "t2", "name": "b", "instruction": "y"}),
+        ]
+        task_queue._redis = mock_redis
+
+        task = await task_queue.pull_task(timeout=1.0)
+
+        assert task.id == "t2"
+        pipe.lrem.assert_called_once_with(task_queue.processing_key, 1, "not json")
+
+    @pytest.mark.asyncio
+    async def test_ack_tasks_removes_inflight_payload(self, task_queue, mock_redis):
+        """Test acknowledging a pulled task removes exactly its payload."""
+        payload = json.dumps({"id": "t1", "name": "a"})
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.return_value = [payload]
+        task_queue._redis = mock_redis
+        task = await task_queue.pull_task(timeout=1.0)
+
+        await task_queue.ack_tasks([task.receipt])
+
+        assert task.receipt == payload
+        pipe.lrem.assert_called_once_with(task_queue.processing_key, 1, payload)
+
+    @pytest.mark.asyncio
+    async def test_connect_recovers_inflight_tasks(self, task_queue, mock_redis):
+        """Test a restarted consumer moves its unacknowledged tasks back to the queue."""
+        mock_redis.lmove.side_effect = [b"older", b"newer", None]
+        task_queue._redis = mock_redis
+
+        await task_queue._recover_inflight()
+
+        assert mock_redis.lmove.call_count == 3
+        mock_redis.lmove.assert_called_with(
+            task_queue.processing_key, task_queue.settings.redis.task_queue_key, "LEFT", "RIGHT"
+        )
+
+    def test_processing_key_uses_consumer_id(self, mock_settings):
+        """Test the in-flight list is named after the consumer."""
+        task_queue = TaskQueue(mock_settings, consumer_id="worker-1")
+
+        assert task_queue.processing_key == (
+            f"{mock_settings.redis.task_queue_key}:processing:worker-1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_close_returns_prefetched_tasks(self, task_queue, mock_redis, queued_task):
+        """Test buffered tasks are pushed back to the consuming end on close."""
+        second = QueuedTask(id="t2", name="b", instruction="y")
+        task_queue._prefetched.extend([queued_task, second])
+        task_queue._redis = mock_redis
+
+        await task_queue.close()
+
+        pipe = mock_redis.pipeline.return_value
+        mock_redis.pipeline.assert_called_once_with(transaction=True)
+        key, *payloads = pipe.rpush.call_args.args
+        assert key == task_queue.settings.redis.task_queue_key
+        assert [json.loads(p)["id"] for p in payloads] == ["t2", queued_task.id]
+        assert pipe.lrem.call_count == 2
+        assert not task_queue._prefetched
+        mock_redis.aclose.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_push_result(self, task_queue, task_result):
         """Test pushing a result to queue."""
@@ -288,17 +479,87 @@ class TestTaskQueue:
         mock_redis.lpush.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_requeue_task(self, task_queue, queued_task):
-        """Test requeuing a task."""
+    async def test_push_result_stringifies_non_str_keys(self, task_queue):
+        """Test result data with non-str keys encodes as json.dumps would."""
         mock_redis = AsyncMock()
         task_queue._redis = mock_redis
+        result = TaskResult(task_id="task-1", status=TaskStatus.COMPLETED, data={1: "a"})
 
-        original_retry_count = queued_task.retry_count
-        await task_queue.requeue_task(queued_task)
+        await task_queue.push_result(result)
+
+        _, payload = mock_redis.lpush.call_args.args
+        assert json.loads(payload)["data"] == {"1": "a"}
 
-        assert queued_task.retry_count == original_retry_count + 1
+    @pytest.mark.asyncio
+    async def test_push_results_single_lpush(self, task_queue, task_result):
+        """Test a batch of results is pushed with one variadic LPUSH."""
+        mock_redis = AsyncMock()
+        task_queue._redis = mock_redis
+        other = TaskResult(task_id="task-456", status=TaskStatus.FAILED, error="boom")
+
+        await task_queue.push_results([task_result, other])
+
+        key, *payloads = mock_redis.lpush.call_args.args
+        assert key == task_queue.settings.redis.result_queue_key
+        assert [json.loads(p)["task_id"] for p in payloads] == ["task-123", "task-456"]
         mock_redis.lpush.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_requeue_task(self, task_queue, queued_task):
+        """Test requeuing pushes a retry copy without mutating the task."""
+        task_queue._redis = AsyncMock()
+        task_queue._requeue_script = AsyncMock()
+
+        await task_queue.requeue_task(queued_task)
+
+        assert queued_task.retry_count == 0
+        kwargs = task_queue._requeue_script.call_args.kwargs
+        assert kwargs["keys"] == [
+            task_queue.settings.redis.task_queue_key,
+            task_queue.processing_key,
+        ]
+        payload, inflight = kwargs["args"]
+        assert json.loads(payload)["retry_count"] == 1
+        assert inflight == b""
+
+    @pytest.mark.asyncio
+    async def test_requeue_task_replaces_inflight_payload(self, task_queue, mock_redis):
+        """Test the pulled payload is handed to the script for atomic removal."""
+        payload = json.dumps({"id": "t1", "name": "a"})
+        mock_redis.pipeline.return_value.execute.return_value = [payload]
+        task_queue._redis = mock_redis
+        task_queue._requeue_script = AsyncMock()
+        task = await task_queue.pull_task(timeout=1.0)
+
+        await task_queue.requeue_task(task)
+
+        assert task_queue._requeue_script.call_args.kwargs["args"][1] == payload
+        assert task.receipt is None
+
+    @pytest.mark.asyncio
+    async def test_connect_shares_pool_per_url(self, mock_settings, monkeypatch):
+        """Test queues in one process reuse one pool and close only their client."""
+        monkeypatch.setattr(TaskQueue, "_pools", {})
+        monkeypatch.setattr(TaskQueue, "_recover_inflight", AsyncMock())
+        first, second = TaskQueue(mock_settings), TaskQueue(mock_settings)
+
+        await first.connect()
+        await second.connect()
+        pool = first._redis.connection_pool
+
+        assert second._redis.connection_pool is pool
+        assert pool.max_connections == mock_settings.redis.pool_size
+
+        with patch.object(pool, "disconnect", new_callable=AsyncMock) as mock_disconnect:
+            await first.close()
+            mock_disconnect.assert_not_called()
+
+            await TaskQueue.disconnect_pools()
+            mock_disconnect.assert_awaited_once()
+
+        assert TaskQueue._pools == {}
+        await second.close()
+
     @pytest.mark.asyncio
     async def test_not_connected_error(self, task_queue):
         """Test error when not connected."""
@@ -323,12 +584,54 @@ class TestAgentExecutor:
         with patch.object(
             executor, "_create_agent_pool", new_callable=AsyncMock
         ) as mock_create_pool:
-            with patch.object(TaskQueue, "connect", new_callable=AsyncMock):
+            with (
+                patch.object(TaskQueue, "connect", new_callable=AsyncMock),
+                patch("apex_agents.executor.LLMClient.prewarm", new_callable=AsyncMock) as prewarm,
+            ):
                 await executor.initialize()
 
                 mock_create_pool.assert_called_once()
+                prewarm.assert_awaited_once()
                 assert executor._semaphore is not None
                 assert executor._llm_client is not None
+                assert executor._result_flusher is not None
+
+        executor._result_flusher.cancel()
+
+    @pytest.mark.asyncio
+    async def test_initialize_overlaps_connect_and_agent_pool(self, executor):
+        """Test the agent pool is built while the queue connection is in progress."""
+        order = []
+
+        async def connect(self):
+            order.append("connect:start")
+            await asyncio.sleep(0)
+            order.append("connect:end")
+
+        async def create_pool():
+            order.append("pool")
+
+        with (
+            patch.object(TaskQueue, "connect", connect),
+            patch.object(executor, "_create_agent_pool", side_effect=create_pool),
+            patch("apex_agents.executor.LLMClient.prewarm", new_callable=AsyncMock),
+        ):
+            await executor.initialize()
+
+        assert order == ["connect:start", "pool", "connect:end"]
+        executor._result_flusher.cancel()
+
+    @pytest.mark.asyncio
+    async def test_initialize_requires_api_key(self, executor):
+        """Test initialization fails fast when no LLM API key is configured."""
+        executor.settings = executor.settings.model_copy(
+            update={"llm": LLMConfig.model_construct(openai_api_key=None)}
+        )
+
+        with pytest.raises(ValueError, match="API key must be configured"):
+            await executor.initialize()
+
+        assert executor._llm_client is None
 
     @pytest.mark.asyncio
     async def test_shutdown(self, executor):
@@ -407,6 +710,85 @@ class TestAgentExecutor:
         assert result.result == "Task completed"
         assert result.tokens_used == 100
 
+    @pytest.mark.asyncio
+    async def test_execute_task_does_not_wait_for_start_report(self, executor, queued_task):
+        """Test the agent runs while the start report is still in flight."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def report_task_started(task_id, agent_id):
+            started.set()
+            await release.wait()
+
+        mock_agent = AsyncMock(spec=Agent)
+        mock_agent.id = "agent-123"
+        mock_agent.config = AgentConfig(name="test-agent", model="gpt-4o")
+        mock_agent.metrics = MagicMock(tokens_used=0, cost_dollars=0.0)
+        mock_agent.run.return_value = TaskOutput(result="Task completed")
+        executor._agents["default"] = mock_agent
+        executor._backend_client = AsyncMock()
+        executor._backend_client.report_task_started.side_effect = report_task_started
+
+        with patch("apex_agents.executor.TaskSpanContext"):
+            result = await executor.execute_task(queued_task)
+
+        assert result.status == TaskStatus.COMPLETED
+        assert queued_task.id in executor._start_reports
+
+        release.set()
+        await executor._start_reports[queued_task.id]
+        assert started.is_set()
+        assert executor._start_reports == {}
+
+    @pytest.mark.asyncio
+    async def test_flush_results_waits_for_start_report(self, executor, task_result):
+        """Test a completion is reported only after the task's start report."""
+        order = []
+        release = asyncio.Event()
+
+        async def report_started():
+            await release.wait()
+            order.append("started")
+
+        executor._backend_client = AsyncMock()
+        executor._backend_client.report_task_results.side_effect = (
+            lambda _: order.append("completed")
+        )
+        executor._start_reports[task_result.task_id] = asyncio.create_task(report_started())
+
+        flush = asyncio.create_task(executor._flush_results([task_result]))
+        await asyncio.sleep(0)
+        assert order == []
+
+        release.set()
+        await flush
+
+        assert order == ["started", "completed"]
+
+    @pytest.mark.asyncio
+    async def test_execute_task_trace_id_from_traceparent(self, executor, queued_task):
+        """Test the result carries the trace ID field of the span's traceparent."""
+        mock_agent = AsyncMock(spec=Agent)
+        mock_agent.id = "agent-123"
+        mock_agent.config = AgentConfig(name="test-agent", model="gpt-4o")
+        mock_agent.metrics = MagicMock(tokens_used=0, cost_dollars=0.0)
+        mock_agent.run.return_value = TaskOutput(result="Task completed")
+        executor._agents["default"] = mock_agent
+
+        trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+        with patch("apex_agents.executor.TaskSpanContext") as mock_span:
+            span_ctx = mock_span.return_value.__enter__.return_value
+            span_ctx.get_trace_context.return_value = {
+                "traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"
+            }
+            result = await executor.execute_task(queued_task)
+
+            span_ctx.get_trace_context.return_value = {}
+            untraced = await executor.execute_task(queued_task)
+
+        assert result.trace_id == trace_id
+        assert untraced.trace_id is None
+
     @pytest.mark.asyncio
     async def test_execute_task_timeout(self, executor, queued_task):
         """Test task execution timeout."""
@@ -427,7 +809,13 @@ class TestAgentExecutor:
         executor._backend_client = AsyncMock()
         executor._llm_client = MagicMock()
         executor._task_queue = AsyncMock()
-        executor.settings.worker.max_task_duration_seconds = 1
+        executor.settings = executor.settings.model_copy(
+            update={
+                "worker": executor.settings.worker.model_copy(
+                    update={"max_task_duration_seconds": 1}
+                )
+            }
+        )
 
         with patch("apex_agents.executor.TaskSpanContext"):
             result = await executor.execute_task(queued_task)
@@ -458,24 +846,70 @@ class TestAgentExecutor:
         # Task should be requeued
         executor._task_queue.requeue_task.assert_called_once()
 
-    def test_active_task_count(self, executor):
-        """Test active task count."""
-        mock_task1 = MagicMock()
-        mock_task1.done.return_value = False
+    def test_get_agent_for_task_reuses_agent_per_config(self, executor, queued_task):
+        """Test tasks with equal agent configs reuse resolved tools in separate agents."""
+        executor._llm_client = MagicMock()
+        queued_task.agent_config = AgentConfig(name="custom", model="gpt-4o")
+        same = QueuedTask(
+            id="t2", name="b", instruction="y",
+            agent_config=AgentConfig(name="custom", model="gpt-4o"),
+        )
+        other = QueuedTask(
+            id="t3", name="c", instruction="z",
+            agent_config=AgentConfig(name="custom", model="gpt-4o-mini"),
+        )
 
-        mock_task2 = MagicMock()
-        mock_task2.done.return_value = True
+        agent = executor._get_agent_for_task(queued_task)
+        same_agent = executor._get_agent_for_task(same)
 
-        mock_task3 = MagicMock()
-        mock_task3.done.return_value = False
+        assert same_agent is not agent
+        assert same_agent.available_tools is agent.available_tools
+        assert same_agent.metrics is not agent.metrics
+        assert executor._get_agent_for_task(other).config.model == "gpt-4o-mini"
+        assert len(executor._config_agents) == 2
 
-        executor._running_tasks = {
-            "task-1": mock_task1,
-            "task-2": mock_task2,
-            "task-3": mock_task3,
-        }
+    def test_agent_cache_evicts_least_recently_used(self, executor, monkeypatch):
+        """Test the per-config agent cache stays bounded."""
+        executor._llm_client = MagicMock()
+        monkeypatch.setattr(AgentExecutor, "AGENT_CACHE_SIZE", 2)
+        tasks = [
+            QueuedTask(
+                id=f"t{i}", name="n", instruction="i",
+                agent_config=AgentConfig(name=f"agent-{i}", model="gpt-4o"),
+            )
+            for i in range(3)
+        ]
+
+        executor._get_agent_for_task(tasks[0])
+        first = next(iter(executor._config_agents.values()))
+        executor._get_agent_for_task(tasks[1])
+        executor._get_agent_for_task(tasks[0])
+        executor._get_agent_for_task(tasks[2])
+
+        assert len(executor._config_agents) == 2
+        assert first in executor._config_agents.values()
 
-        assert executor.active_task_count == 2
+    @pytest.mark.asyncio
+    async def test_active_task_count(self, executor, queued_task):
+        """Test the active count tracks executions in progress, including failures."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def run(task):
+            started.set()
+            await release.wait()
+            raise RuntimeError("boom")
+
+        with patch.object(executor, "_execute_task", side_effect=run):
+            running = asyncio.create_task(executor.execute_task(queued_task))
+            await started.wait()
+            assert executor.active_task_count == 1
+
+            release.set()
+            with pytest.raises(RuntimeError):
+                await running
+
+        assert executor.active_task_count == 0
 
     def test_registered_agents(self, executor):
         """Test getting registered agent names."""
@@ -489,3 +923,214 @@ class TestAgentExecutor:
         assert "agent-1" in agents
         assert "agent-2" in agents
         assert len(agents) == 2
+
+    @pytest.mark.asyncio
+    async def test_ack_after_requeue_keeps_retry_inflight(self, executor, mock_redis):
+        """Test acking a failed attempt does not remove its re-pulled retry."""
+        queue = TaskQueue(executor.settings, consumer_id="c1")
+        queue._redis = mock_redis
+        queue._requeue_script = AsyncMock()
+        executor._task_queue = queue
+        pipe = mock_redis.pipeline.return_value
+        retry = json.dumps({"id": "t1", "name": "a", "retry_count": 1})
+
+        async def fail(task):
+            return await executor._handle_task_failure(task, "boom", 0)
+
+        pipe.execute.return_value = [json.dumps({"id": "t1", "name": "a"})]
+        task = await queue.pull_task(timeout=1.0)
+        with patch.object(executor, "_execute_task", side_effect=fail):
+            failed = await executor.execute_task(task)
+        pipe.execute.return_value = [retry]
+        retried = await queue.pull_task(timeout=1.0)
+        pipe.reset_mock()
+
+        await executor._flush_results([failed])
+
+        assert failed.receipt is None
+        assert retried.receipt == retry
+        pipe.lrem.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_push_leaves_task_in_flight(self, executor, mock_redis):
+        """Test results that never reached the result queue are not acknowledged."""
+        queue = TaskQueue(executor.settings, consumer_id="c1")
+        queue._redis = mock_redis
+        executor._task_queue = queue
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.return_value = [json.dumps({"id": "t1", "name": "a"})]
+        task = await queue.pull_task(timeout=1.0)
+        pipe.reset_mock()
+        mock_redis.lpush.side_effect = ConnectionError("redis down")
+        result = TaskResult(task_id="t1", status=TaskStatus.COMPLETED, receipt=task.receipt)
+
+        await executor._flush_results([result])
+
+        mock_redis.lpush.assert_awaited_once()
+        pipe.lrem.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_report_result_batches_through_flusher(self, executor, task_result):
+        """Test results reported close together are flushed as one batch."""
+        executor._task_queue = AsyncMock()
+        executor._backend_client = AsyncMock()
+        executor._result_flusher = asyncio.create_task(executor._flush_results_loop())
+        task_result.receipt = b"payload-123"
+        other = TaskResult(task_id="task-456", status=TaskStatus.COMPLETED, result="ok")
+
+        await executor.report_result(task_result)
+        await executor.report_result(other)
+        executor._task_queue.push_results.assert_not_called()
+
+        executor._result_queue.put_nowait(None)
+        await executor._result_flusher
+
+        executor._task_queue.push_results.assert_called_once_with([task_result, other])
+        executor._task_queue.ack_tasks.assert_called_once_with([b"payload-123"])
+        executor._backend_client.report_task_results.assert_called_once_with(
+            [task_result, other]
+        )
+
+    @pytest.mark.asyncio
+    async def test_flusher_respects_batch_size(self, executor):
+        """Test a full batch is flushed without waiting for the interval."""
+        executor.settings = executor.settings.model_copy(
+            update={
+                "worker": executor.settings.worker.model_copy(
+                    update={"result_batch_size": 2, "result_flush_interval_ms": 10_000}
+                )
+            }
+        )
+        executor._task_queue = AsyncMock()
+        executor._result_flusher = asyncio.create_task(executor._flush_results_loop())
+        results = [
+            TaskResult(task_id=f"task-{i}", status=TaskStatus.COMPLETED) for i in range(3)
+        ]
+
+        for result in results:
+            await executor.report_result(result)
+        executor._result_queue.put_nowait(None)
+        await executor._result_flusher
+
+        batches = [call.args[0] for call in executor._task_queue.push_results.call_args_list]
+        assert batches == [results[:2], results[2:]]
+
+    @pytest.mark.asyncio
+    async def test_shutdown_flushes_pending_results(self, executor, task_result):
+        """Test shutdown reports queued results before closing connections."""
+        task_queue = AsyncMock()
+        executor._task_queue = task_queue
+        executor._backend_client = AsyncMock()
+        executor._result_flusher = asyncio.create_task(executor._flush_results_loop())
+
+        await executor.report_result(task_result)
+        await executor.shutdown()
+
+        task_queue.push_results.assert_called_once_with([task_result])
+        task_queue.close.assert_called_once()
+        assert executor._result_flusher is None
+
+
+class TestResultCache:
+    """Tests for the task result cache."""
+
+    @pytest.fixture
+    def executor(self, mock_settings):
+        """Create an executor with the result cache enabled."""
+        settings = mock_settings.model_copy(
+            update={
+                "redis": mock_settings.redis.model_copy(
+                    update={"result_cache_ttl_seconds": 60}
+                )
+            }
+        )
+        with patch("apex_agents.executor.create_default_registry"):
+            executor = AgentExecutor(settings=settings)
+        executor._task_queue = AsyncMock()
+        executor._task_queue.get_cached_result.return_value = None
+        return executor
+
+    @pytest.fixture
+    def agent(self, executor):
+        """Register a mock default agent."""
+        agent = AsyncMock(spec=Agent)
+        agent.id = "agent-123"
+        agent.config = AgentConfig(name="default", model="gpt-4o")
+        agent.metrics = MagicMock(tokens_used=100, cost_dollars=0.01)
+        agent.run.return_value = TaskOutput(result="Task completed")
+        executor._agents["default"] = agent
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_miss_runs_agent_and_caches(self, executor, agent, queued_task):
+        """Test a miss executes the task and stores the result with the TTL."""
+        with patch("apex_agents.executor.TaskSpanContext"):
+            result = await executor.execute_task(queued_task)
+
+        agent.run.assert_awaited_once()
+        key = executor._result_cache_key(queued_task, agent)
+        executor._task_queue.cache_result.assert_awaited_once_with(key, result, 60)
+        assert executor.result_cache_stats == {"hits": 0, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_agent(self, executor, agent, queued_task):
+        """Test a hit returns the cached output for this task without running the agent."""
+        executor._task_queue.get_cached_result.return_value = TaskResult(
+            task_id="earlier-task",
+            status=TaskStatus.COMPLETED,
+            result="Cached answer",
+            data={"k": "v"},
+            tokens_used=500,
+        )
+
+        with patch("apex_agents.executor.TaskSpanContext"):
+            result = await executor.execute_task(queued_task)
+
+        agent.run.assert_not_called()
+        assert result.task_id == queued_task.id
+        assert result.result == "Cached answer"
+        assert result.data == {"k": "v"}
+        assert result.tokens_used == 0
+        assert executor.result_cache_stats == {"hits": 1, "misses": 0}
+
+    @pytest.mark.asyncio
+    async def test_error_output_not_cached(self, executor, agent, queued_task):
+        """Test early-terminated runs are not cached."""
+        agent.run.return_value = TaskOutput(result="stopped", data={"error": "loop_detected"})
+
+        with patch("apex_agents.executor.TaskSpanContext"):
+            await executor.execute_task(queued_task)
+
+        executor._task_queue.cache_result.assert_not_called()
+
+    def test_key_depends_on_agent_config(self, executor, agent, queued_task):
+        """Test the same task run by a differently configured agent uses another key."""
+        key = executor._result_cache_key(queued_task, agent)
+        assert key.startswith(executor.settings.redis.result_cache_key_prefix)
+
+        agent.config = AgentConfig(name="default", model="claude-3-5-sonnet")
+        assert executor._result_cache_key(queued_task, agent) != key
+
+    def test_key_disabled_without_ttl(self, mock_settings, queued_task):
+        """Test the cache is off by default."""
+        with patch("apex_agents.executor.create_default_registry"):
+            executor = AgentExecutor(settings=mock_settings)
+        executor._task_queue = AsyncMock()
+
+        assert executor._result_cache_key(queued_task, MagicMock()) is None
+
+    @pytest.mark.asyncio
+    async def test_queue_round_trip(self, mock_settings, task_result):
+        """Test TaskQueue stores results with an expiry and decodes them back."""
+        task_queue = TaskQueue(mock_settings)
+        task_queue._redis = AsyncMock()
+
+        await task_queue.cache_result("key", task_result, 60)
+        _, payload = task_queue._redis.set.call_args.args
+        assert task_queue._redis.set.call_args.kwargs == {"ex": 60}
+
+        task_queue._redis.get.return_value = payload
+        assert await task_queue.get_cached_result("key") == task_result
+
+        task_queue._redis.get.return_value = None
+        assert await task_queue.get_cached_result("key") is None
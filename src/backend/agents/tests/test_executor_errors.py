@@ -1,8 +1,9 @@
 """Tests for executor error handling paths."""
 
 import asyncio
+import importlib.util
 import json
-from datetime import datetime, timezone
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -52,6 +53,27 @@ class TestAgentExecutorErrorPaths:
         with pytest.raises(RuntimeError):
             await executor.pull_and_execute()
 
+    @pytest.mark.asyncio
+    async def test_pull_and_execute_without_semaphore(self, executor):
+        """Test a half-initialized executor fails before pulling a task."""
+        executor._task_queue = AsyncMock()
+        executor._semaphore = None
+
+        with pytest.raises(RuntimeError, match="Executor not initialized"):
+            await executor.pull_and_execute()
+
+        executor._task_queue.pull_task.assert_not_called()
+
+    def test_custom_agent_requires_llm_client(self, executor):
+        """Test building a per-task agent without an LLM client raises, even under -O."""
+        task = QueuedTask(
+            id="t1", name="n", instruction="i",
+            agent_config=AgentConfig(name="custom", model="gpt-4o"),
+        )
+
+        with pytest.raises(RuntimeError, match="LLM client must be initialized"):
+            executor._get_agent_for_task(task)
+
     @pytest.mark.asyncio
     async def test_pull_and_execute_no_task(self, executor):
         """Test pull_and_execute returns None when no task is available."""
@@ -98,6 +120,8 @@ class TestAgentExecutorErrorPaths:
             mock_agent.metrics.tokens_used = 50
             mock_agent.metrics.cost_dollars = 0.005
             mock_agent.run.return_value = mock_output
+            # Each task runs a clone of the agent built for its config
+            mock_agent.clone = MagicMock(return_value=mock_agent)
             mock_agent_cls.return_value = mock_agent
 
             with patch("apex_agents.executor.TaskSpanContext"):
@@ -120,7 +144,7 @@ class TestAgentExecutorErrorPaths:
         executor._task_queue = AsyncMock()
 
         result = await executor._handle_task_failure(
-            task, "fatal error", datetime.now(timezone.utc)
+            task, "fatal error", time.perf_counter_ns()
         )
 
         assert result.status == TaskStatus.FAILED
@@ -141,7 +165,7 @@ class TestAgentExecutorErrorPaths:
         executor._task_queue = AsyncMock()
 
         result = await executor._handle_task_failure(
-            task, "transient error", datetime.now(timezone.utc)
+            task, "transient error", time.perf_counter_ns()
         )
 
         assert result.status == TaskStatus.FAILED
@@ -161,8 +185,8 @@ class TestAgentExecutorErrorPaths:
 
         await executor.report_result(result)
 
-        executor._task_queue.push_result.assert_called_once_with(result)
-        executor._backend_client.report_task_result.assert_called_once_with(result)
+        executor._task_queue.push_results.assert_called_once_with([result])
+        executor._backend_client.report_task_results.assert_called_once_with([result])
 
     @pytest.mark.asyncio
     async def test_report_result_no_queue(self, executor):
@@ -178,7 +202,7 @@ class TestAgentExecutorErrorPaths:
 
         await executor.report_result(result)
 
-        executor._backend_client.report_task_result.assert_called_once()
+        executor._backend_client.report_task_results.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_shutdown_cancels_running_tasks(self, executor):
@@ -190,7 +214,13 @@ class TestAgentExecutorErrorPaths:
         executor._running_tasks = {"task-1": mock_task}
         executor._task_queue = AsyncMock()
         executor._backend_client = AsyncMock()
-        executor.settings.worker.graceful_shutdown_timeout_seconds = 1
+        executor.settings = executor.settings.model_copy(
+            update={
+                "worker": executor.settings.worker.model_copy(
+                    update={"graceful_shutdown_timeout_seconds": 1}
+                )
+            }
+        )
 
         with patch("asyncio.gather", new_callable=AsyncMock):
             await executor.shutdown()
@@ -207,10 +237,11 @@ class TestTaskQueueErrorHandling:
         return TaskQueue(mock_settings)
 
     @pytest.mark.asyncio
-    async def test_pull_task_error_returns_none(self, task_queue):
+    async def test_pull_task_error_returns_none(self, task_queue, mock_redis):
         """Test that pull_task returns None on Redis error."""
-        mock_redis = AsyncMock()
-        mock_redis.brpop.side_effect = Exception("Redis connection lost")
+        mock_redis.pipeline.return_value.execute.side_effect = Exception(
+            "Redis connection lost"
+        )
         task_queue._redis = mock_redis
 
         result = await task_queue.pull_task()
@@ -335,3 +366,13 @@ class TestBackendClientErrorPaths:
         assert client is client2
 
         await backend_client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_http_client_pool_limits(self, backend_client):
+        """Test the client keeps a sized keep-alive pool and only asks for HTTP/2 with h2."""
+        with patch("apex_agents.executor.httpx.AsyncClient") as mock_client:
+            await backend_client._get_http_client()
+
+        kwargs = mock_client.call_args.kwargs
+        assert kwargs["limits"] is BackendClient.HTTP_LIMITS
+        assert kwargs["http2"] is (importlib.util.find_spec("h2") is not None)
@@ -1,13 +1,19 @@
 """Tests for the LLM client."""
 
+import asyncio
+import importlib.util
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 import httpx
+import orjson
 from apex_agents.llm import (
+    MODEL_PRICING,
     LLMClient,
     LLMProvider,
     LLMResponse,
     LLMUsage,
+    _get_encoding,
     calculate_cost,
     count_tokens,
 )
@@ -63,6 +69,23 @@ class TestCostCalculation:
         expected = (1000 / 1000 * 0.003) + (500 / 1000 * 0.015)
         assert abs(cost - expected) < 0.0001
 
+    def test_cached_prompt_tokens_discounted(self):
+        """Test cached and cache-creation prompt tokens are billed at their own rates."""
+        pricing = MODEL_PRICING["claude-3.5-sonnet"]
+        cost = calculate_cost(
+            "claude-3.5-sonnet",
+            3000,
+            0,
+            cached_prompt_tokens=1000,
+            cache_creation_tokens=1000,
+        )
+        assert cost == pytest.approx(pricing.input + pricing.cached_input + pricing.cache_write)
+
+    def test_batch_discount(self):
+        """Test batch API calls cost half the synchronous price."""
+        full = calculate_cost("gpt-4o", 1000, 1000)
+        assert calculate_cost("gpt-4o", 1000, 1000, batch=True) == pytest.approx(full / 2)
+
     def test_unknown_model_default_pricing(self):
         """Test unknown model uses default pricing."""
         cost = calculate_cost("unknown-model", 1000, 500)
@@ -85,6 +108,19 @@ class TestTokenCounting:
         tokens = count_tokens(text)
         assert tokens > 50
 
+    def test_encoding_resolved_once_per_model(self):
+        """Test the encoding is built on the first count only."""
+        _get_encoding.cache_clear()
+        encoding = MagicMock()
+        encoding.encode.return_value = [1, 2, 3]
+
+        with patch("apex_agents.llm.tiktoken.encoding_for_model", return_value=encoding) as lookup:
+            assert count_tokens("a b c", model="gpt-4o") == 3
+            assert count_tokens("d e f", model="gpt-4o") == 3
+
+        lookup.assert_called_once_with("gpt-4o")
+        _get_encoding.cache_clear()
+
 
 class TestLLMClient:
     """Tests for the LLM client."""
@@ -119,7 +155,7 @@ class TestLLMClient:
 
         with patch("httpx.AsyncClient.post") as mock_post:
             mock_post.return_value = MagicMock(
-                json=lambda: mock_response,
+                content=orjson.dumps(mock_response),
                 raise_for_status=lambda: None,
             )
 
@@ -132,6 +168,10 @@ class TestLLMClient:
             assert response.usage.total_tokens == 15
             assert response.tool_calls == []
 
+            body = orjson.loads(mock_post.call_args.kwargs["content"])
+            assert body["model"] == "gpt-4o-mini"
+            assert body["messages"] == [{"role": "user", "content": "Hi"}]
+
     @pytest.mark.asyncio
     async def test_openai_with_tools(self, client):
         """Test OpenAI API call with tool calls."""
@@ -163,7 +203,7 @@ class TestLLMClient:
 
         with patch("httpx.AsyncClient.post") as mock_post:
             mock_post.return_value = MagicMock(
-                json=lambda: mock_response,
+                content=orjson.dumps(mock_response),
                 raise_for_status=lambda: None,
             )
 
@@ -191,7 +231,7 @@ class TestLLMClient:
 
         with patch("httpx.AsyncClient.post") as mock_post:
             mock_post.return_value = MagicMock(
-                json=lambda: mock_response,
+                content=orjson.dumps(mock_response),
                 raise_for_status=lambda: None,
             )
 
@@ -216,6 +256,316 @@ class TestLLMClient:
 
         assert "API key not configured" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_create_many_bounds_concurrency(self, client):
+        """Test create_many runs calls concurrently up to the limit, in order."""
+        in_flight = 0
+        peak = 0
+
+        async def create(model, messages):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return messages[0]["content"]
+
+        calls = [
+            {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": str(i)}]}
+            for i in range(6)
+        ]
+        with patch.object(client, "create", side_effect=create):
+            responses = await client.create_many(calls, max_concurrency=2)
+
+        assert responses == [str(i) for i in range(6)]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_create_many_rejects_zero_concurrency(self, client):
+        """Test a concurrency limit below one is rejected."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await client.create_many([], max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_openai_create_batch(self):
+        """Test an OpenAI batch is uploaded, polled and parsed in call order."""
+        completion = {
+            "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 1000, "completion_tokens": 1000, "total_tokens": 2000},
+        }
+        polls = iter(["in_progress", "completed"])
+        uploaded = {}
+
+        def handler(request):
+            path = request.url.path
+            if path == "/v1/files":
+                uploaded["body"] = request.content
+                return httpx.Response(200, json={"id": "file-in"})
+            if path == "/v1/batches":
+                return httpx.Response(200, json={"id": "batch-1", "status": "validating"})
+            if path == "/v1/batches/batch-1":
+                return httpx.Response(
+                    200,
+                    json={"id": "batch-1", "status": next(polls), "output_file_id": "file-out"},
+                )
+            assert path == "/v1/files/file-out/content"
+            lines = [
+                {"custom_id": "1", "response": {"status_code": 200, "body": completion}},
+                {"custom_id": "0", "response": None, "error": {"code": "server_error"}},
+            ]
+            return httpx.Response(200, content=b"\n".join(orjson.dumps(x) for x in lines))
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = LLMClient(openai_api_key="test-openai-key", http_client=http_client)
+        calls = [
+            {"model": "gpt-4o", "messages": [{"role": "user", "content": str(i)}]}
+            for i in range(2)
+        ]
+
+        responses = await client.create_batch(calls, poll_interval=0)
+
+        assert responses[0] is None
+        assert responses[1].content == "ok"
+        assert responses[1].cost == pytest.approx(calculate_cost("gpt-4o", 1000, 1000) / 2)
+        assert b'"custom_id":"1"' in uploaded["body"]
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_anthropic_create_batch(self):
+        """Test an Anthropic message batch is polled until ended and parsed."""
+        message = {
+            "content": [{"type": "text", "text": "ok"}],
+            "usage": {"input_tokens": 10, "output_tokens": 5},
+            "stop_reason": "end_turn",
+        }
+        polls = iter(["in_progress", "ended"])
+        results_url = "https://api.anthropic.com/v1/messages/batches/b-1/results"
+
+        def handler(request):
+            if request.method == "POST":
+                return httpx.Response(
+                    200, json={"id": "b-1", "processing_status": "in_progress"}
+                )
+            if str(request.url) == results_url:
+                line = {"custom_id": "0", "result": {"type": "succeeded", "message": message}}
+                return httpx.Response(200, content=orjson.dumps(line))
+            return httpx.Response(
+                200,
+                json={"id": "b-1", "processing_status": next(polls), "results_url": results_url},
+            )
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = LLMClient(anthropic_api_key="test-anthropic-key", http_client=http_client)
+
+        responses = await client.create_batch(
+            [{"model": "claude-3-haiku", "messages": [{"role": "user", "content": "Hi"}]}],
+            poll_interval=0,
+        )
+
+        assert responses[0].content == "ok"
+        assert responses[0].usage.total_tokens == 15
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_create_batch_rejects_mixed_providers(self, client):
+        """Test a batch spanning providers is rejected before any request."""
+        messages = [{"role": "user", "content": "Hi"}]
+        with pytest.raises(ValueError, match="single provider"):
+            await client.create_batch([
+                {"model": "gpt-4o", "messages": messages},
+                {"model": "claude-3-haiku", "messages": messages},
+            ])
+
+    @pytest.mark.asyncio
+    async def test_openai_stream(self):
+        """Test OpenAI server-sent events are yielded as text deltas."""
+        requests = []
+
+        def handler(request):
+            requests.append(orjson.loads(request.content))
+            events = [
+                {"choices": [{"delta": {"role": "assistant"}}]},
+                {"choices": [{"delta": {"content": "Hel"}}]},
+                {"choices": [{"delta": {"content": "lo!"}}]},
+            ]
+            body = "".join(f"data: {orjson.dumps(e).decode()}\n\n" for e in events)
+            return httpx.Response(200, text=body + "data: [DONE]\n\n")
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = LLMClient(openai_api_key="test-openai-key", http_client=http_client)
+
+        chunks = [
+            chunk
+            async for chunk in client.stream(
+                model="gpt-4o-mini", messages=[{"role": "user", "content": "Hi"}]
+            )
+        ]
+
+        assert chunks == ["Hel", "lo!"]
+        assert requests[0]["stream"] is True
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_anthropic_stream(self):
+        """Test Anthropic content_block_delta events are yielded as text deltas."""
+        events = [
+            ("message_start", {"type": "message_start", "message": {}}),
+            ("content_block_delta", {
+                "type": "content_block_delta",
+                "index": 0,
+                "delta": {"type": "text_delta", "text": "Hi "},
+            }),
+            ("content_block_delta", {
+                "type": "content_block_delta",
+                "index": 0,
+                "delta": {"type": "text_delta", "text": "there"},
+            }),
+            ("message_stop", {"type": "message_stop"}),
+        ]
+        body = "".join(
+            f"event: {name}\ndata: {orjson.dumps(data).decode()}\n\n" for name, data in events
+        )
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda _: httpx.Response(200, text=body))
+        )
+        client = LLMClient(anthropic_api_key="test-anthropic-key", http_client=http_client)
+
+        chunks = [
+            chunk
+            async for chunk in client.stream(
+                model="claude-3-haiku", messages=[{"role": "user", "content": "Hi"}]
+            )
+        ]
+
+        assert chunks == ["Hi ", "there"]
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_openai_cached_tokens_tracked(self, client):
+        """Test OpenAI cached prompt tokens are recorded and priced at the cached rate."""
+        mock_response = {
+            "choices": [{"message": {"content": "Hi"}, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": 2000,
+                "completion_tokens": 0,
+                "total_tokens": 2000,
+                "prompt_tokens_details": {"cached_tokens": 1000},
+            },
+        }
+
+        with patch("httpx.AsyncClient.post") as mock_post:
+            mock_post.return_value = MagicMock(
+                content=orjson.dumps(mock_response),
+                raise_for_status=lambda: None,
+            )
+            response = await client.create(
+                model="gpt-4o", messages=[{"role": "user", "content": "Hi"}]
+            )
+
+        pricing = MODEL_PRICING["gpt-4o"]
+        assert response.usage.cached_prompt_tokens == 1000
+        assert response.cost == pytest.approx(pricing.input + pricing.cached_input)
+
+    @pytest.mark.asyncio
+    async def test_anthropic_cache_tokens_tracked(self, client):
+        """Test Anthropic cache reads and writes are counted as prompt tokens."""
+        mock_response = {
+            "content": [{"type": "text", "text": "Hi"}],
+            "usage": {
+                "input_tokens": 10,
+                "output_tokens": 5,
+                "cache_read_input_tokens": 100,
+                "cache_creation_input_tokens": 50,
+            },
+            "stop_reason": "end_turn",
+        }
+
+        with patch("httpx.AsyncClient.post") as mock_post:
+            mock_post.return_value = MagicMock(
+                content=orjson.dumps(mock_response),
+                raise_for_status=lambda: None,
+            )
+            response = await client.create(
+                model="claude-3-haiku", messages=[{"role": "user", "content": "Hi"}]
+            )
+
+        assert response.usage.prompt_tokens == 160
+        assert response.usage.total_tokens == 165
+        assert response.usage.cached_prompt_tokens == 100
+        assert response.usage.cache_creation_tokens == 50
+
+    @pytest.mark.asyncio
+    async def test_http_client_shared_across_calls(self, client):
+        """Test every call reuses one pooled HTTP client until close()."""
+        mock_response = {
+            "choices": [{"message": {"content": "Hi"}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }
+        messages = [{"role": "user", "content": "Hi"}]
+
+        with patch("httpx.AsyncClient.post") as mock_post:
+            mock_post.return_value = MagicMock(
+                content=orjson.dumps(mock_response),
+                raise_for_status=lambda: None,
+            )
+            await client.create(model="gpt-4o-mini", messages=messages)
+            http_client = client._http_client
+            await client.create(model="gpt-4o-mini", messages=messages)
+
+        assert client._http_client is http_client
+        assert mock_post.call_count == 2
+
+        await client.close()
+
+        assert http_client.is_closed
+        assert client._http_client is None
+
+    def test_http_client_limits_and_http2(self, client):
+        """Test the shared client uses the pool limits and asks for HTTP/2 only with h2."""
+        with patch("apex_agents.llm.httpx.AsyncClient") as mock_client:
+            client._get_http_client()
+
+        kwargs = mock_client.call_args.kwargs
+        assert kwargs["limits"] is LLMClient.HTTP_LIMITS
+        assert kwargs["http2"] is (importlib.util.find_spec("h2") is not None)
+
+    @pytest.mark.asyncio
+    async def test_prewarm_connects_configured_providers(self):
+        """Test prewarm reaches only providers with keys and ignores failures."""
+        hosts = []
+
+        def handler(request):
+            hosts.append((request.method, request.url.host))
+            raise httpx.ConnectError("unreachable", request=request)
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = LLMClient(openai_api_key="test-openai-key", http_client=http_client)
+
+        await client.prewarm()
+
+        assert hosts == [("HEAD", "api.openai.com")]
+        await http_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_client(self):
+        """Test leaving ``async with`` closes the owned HTTP client."""
+        async with LLMClient(openai_api_key="test-openai-key") as client:
+            http_client = client._get_http_client()
+
+        assert http_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_supplied_http_client_left_open(self):
+        """Test a caller-supplied HTTP client is used but not closed."""
+        http_client = httpx.AsyncClient()
+        client = LLMClient(openai_api_key="test-openai-key", http_client=http_client)
+
+        assert client._get_http_client() is http_client
+        await client.close()
+
+        assert not http_client.is_closed
+        await http_client.aclose()
+
 
 class TestLLMUsage:
     """Tests for LLMUsage."""
@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
+import orjson
 from tenacity import RetryError
 
 from apex_agents.llm import (
@@ -51,7 +52,7 @@ class TestLLMClientRetry:
                     response=MagicMock(status_code=500),
                 )
             return MagicMock(
-                json=lambda: mock_success,
+                content=orjson.dumps(mock_success),
                 raise_for_status=lambda: None,
             )
 
@@ -134,7 +135,7 @@ class TestLLMClientAnthropicDetails:
 
         with patch("httpx.AsyncClient.post") as mock_post:
             mock_post.return_value = MagicMock(
-                json=lambda: mock_response,
+                content=orjson.dumps(mock_response),
                 raise_for_status=lambda: None,
             )
 
@@ -168,7 +169,7 @@ class TestLLMClientAnthropicDetails:
 
         with patch("httpx.AsyncClient.post") as mock_post:
             mock_post.return_value = MagicMock(
-                json=lambda: mock_response,
+                content=orjson.dumps(mock_response),
                 raise_for_status=lambda: None,
             )
 
@@ -9,6 +9,8 @@ from apex_agents.loop_detector import (
     LoopDetector,
     LoopType,
     compute_output_novelty,
+    compute_output_novelty_hashed,
+    token_hashes,
 )
 
 
@@ -123,6 +125,16 @@ class TestLoopDetectorSimilarity:
         if result.is_loop:
             assert result.loop_type == LoopType.SEMANTIC_LOOP
 
+    def test_each_output_tokenized_once(self):
+        detector = LoopDetector(hash_threshold=100)
+        outputs = [f"step {i} of the same plan" for i in range(6)]
+
+        with patch("apex_agents.loop_detector.token_hashes", wraps=token_hashes) as tokenize:
+            for output in outputs:
+                detector.check(output)
+
+        assert tokenize.call_count == len(outputs)
+
 
 class TestLoopDetectorOscillation:
     """Tests for oscillation pattern detection (A-B-A-B)."""
@@ -145,6 +157,17 @@ class TestLoopDetectorOscillation:
         if result.is_loop:
             assert result.loop_type == LoopType.OSCILLATION
 
+    def test_period_2_requires_whole_recent_window(self):
+        detector = LoopDetector()
+        # A-B-A-B tail preceded by a different output within the last six
+        detector._output_hashes.extend([9, 2, 1, 2, 1, 2])
+        assert detector._check_oscillation() is None
+
+        detector._output_hashes.append(1)
+        result = detector._check_oscillation()
+        assert result is not None
+        assert result.loop_type == LoopType.OSCILLATION
+
     def test_no_oscillation_for_sequential_unique(self):
         detector = LoopDetector(hash_threshold=100, similarity_threshold=1.0)
 
@@ -385,6 +408,15 @@ class TestComputeOutputNovelty:
         score = compute_output_novelty("", ["some previous output"])
         assert score == 0.0
 
+    def test_hashed_matches_text_version(self):
+        previous = ["the slow brown cat", "", "a quick red fox"]
+        current = "The quick brown fox"
+        hashed = compute_output_novelty_hashed(
+            token_hashes(current), [token_hashes(p) for p in previous]
+        )
+        assert hashed == pytest.approx(compute_output_novelty(current, previous))
+        assert hashed == pytest.approx(1.0 - 2 / 6)
+
 
 class TestAgentLoopDetectionIntegration:
     """Integration tests for loop detection within the Agent execution loop."""
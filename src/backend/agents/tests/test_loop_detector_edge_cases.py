@@ -21,6 +21,19 @@ class TestLoopDetectorCustomWindowSize:
         # Internal hash history should be bounded by window_size * 2
         assert len(detector._output_hashes) <= 6
 
+    def test_hash_counts_track_evictions(self):
+        """Test repeat counts follow the bounded hash history as it evicts."""
+        detector = LoopDetector(window_size=2, hash_threshold=100, similarity_threshold=1.0)
+        for output in ["a", "b", "a", "c", "d", "a", "e"]:
+            detector.check(output)
+
+        assert set(detector._hash_counts) == set(detector._output_hashes)
+        assert all(
+            detector._hash_counts[h] == list(detector._output_hashes).count(h)
+            for h in detector._hash_counts
+        )
+        assert detector._hash_counts[hash("a")] == 1
+
     def test_hash_threshold_1_triggers_immediately(self):
         """Test hash_threshold=1 triggers on first repeat."""
         detector = LoopDetector(hash_threshold=1, similarity_threshold=1.0)
@@ -81,6 +94,34 @@ class TestCostPerInsightTrackerEdgeCases:
         should_stop, _ = tracker.should_terminate()
         assert not should_stop
 
+    def test_running_totals_match_window(self):
+        """Test running totals equal sums over the retained window after evictions."""
+        tracker = CostPerInsightTracker(window_size=4)
+        for i in range(11):
+            tracker.record_iteration(
+                tokens_used=100,
+                cost=0.01 * (i + 1),
+                state_changed=i % 3 == 0,
+                output_novelty=0.1 * (i % 5),
+            )
+
+        window = list(tracker._history)
+        assert len(window) == 4
+        assert tracker._sum_cost == pytest.approx(sum(r.cost for r in window))
+        assert tracker._sum_novelty == pytest.approx(sum(r.output_novelty for r in window))
+        assert tracker._sum_state_changes == sum(r.state_changed for r in window)
+
+    def test_zero_cost_window_after_eviction(self):
+        """Test a window that is free again scores 1.0 despite float drift in the total."""
+        tracker = CostPerInsightTracker()
+        for cost in [0.1] * 5 + [0.0] * 10:
+            tracker.record_iteration(
+                tokens_used=0, cost=cost, state_changed=False, output_novelty=0.0
+            )
+
+        assert all(r.cost == 0.0 for r in tracker._history)
+        assert tracker.get_efficiency_score() == 1.0
+
     def test_window_sizing(self):
         """Test that window_size parameter controls history."""
         tracker = CostPerInsightTracker(window_size=5)
@@ -0,0 +1,39 @@
+"""Tests for the lazily-resolved apex_agents package exports."""
+
+import importlib
+
+import pytest
+
+import apex_agents
+
+
+class TestLazyExports:
+    """Tests for PEP 562 attribute resolution in apex_agents/__init__.py."""
+
+    @pytest.mark.parametrize("name", apex_agents.__all__)
+    def test_export_resolves_to_submodule_object(self, name):
+        """Test every public name resolves to the object in its submodule."""
+        module = importlib.import_module(apex_agents._LAZY[name])
+        assert getattr(apex_agents, name) is getattr(module, name)
+
+    def test_all_matches_lazy_map(self):
+        """Test __all__ and the lazy map describe the same names."""
+        assert set(apex_agents.__all__) == apex_agents._LAZY_KEYS
+
+    def test_access_binds_sibling_exports(self):
+        """Test resolving one name caches every export of its submodule."""
+        apex_agents.__dict__.pop("Worker", None)
+        apex_agents.__dict__.pop("WorkerPool", None)
+
+        _ = apex_agents.Worker
+
+        assert "WorkerPool" in vars(apex_agents)
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+            _ = apex_agents.Missing
+
+    def test_dir_lists_lazy_names(self):
+        """Test dir() includes names that have not been resolved yet."""
+        assert set(apex_agents.__all__) <= set(dir(apex_agents))
@@ -44,9 +44,11 @@ class TestInitTracing:
 
     def test_init_tracing_disabled(self):
         """Test tracing initialization when disabled."""
-        with patch.dict("os.environ", {"APEX_LLM_OPENAI_API_KEY": "sk-test"}):
+        with patch.dict(
+            "os.environ", {"APEX_LLM_OPENAI_API_KEY": "sk-test", "APEX_TRACING_ENABLED": "false"}
+        ):
             settings = Settings()
-            settings.tracing.enabled = False
+            assert settings.tracing.enabled is False
 
             tracer = init_tracing(settings)
 
@@ -73,11 +75,13 @@ class TestInitTracing:
 
     def test_init_tracing_with_console(self, mock_settings):
         """Test tracing initialization with console export."""
-        mock_settings.tracing.console_export = True
+        settings = mock_settings.model_copy(
+            update={"tracing": mock_settings.tracing.model_copy(update={"console_export": True})}
+        )
 
         with patch("apex_agents.tracing.ConsoleSpanExporter") as mock_exporter:
             with patch("apex_agents.tracing.SimpleSpanProcessor"):
-                tracer = init_tracing(mock_settings)
+                tracer = init_tracing(settings)
 
                 assert tracer is not None
 
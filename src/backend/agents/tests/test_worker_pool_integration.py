@@ -153,7 +153,13 @@ class TestWorkerErrorPaths:
         worker._redis = AsyncMock()
         worker._heartbeat_task = None
 
-        worker.settings.worker.graceful_shutdown_timeout_seconds = 1
+        worker.settings = worker.settings.model_copy(
+            update={
+                "worker": worker.settings.worker.model_copy(
+                    update={"graceful_shutdown_timeout_seconds": 1}
+                )
+            }
+        )
 
         with patch("apex_agents.worker.shutdown_tracing"):
             await worker.stop(timeout=0.1)